@@ -0,0 +1,92 @@
+"""
+Gunicorn configuration, loaded from the working directory by `gunicorn`.
+
+These settings can be overridden by a `GUNICORN_` prefixed environment
+variable: `WORKER_CLASS` (`sync`, `gthread` or `uvicorn`), `WORKERS`,
+`THREADS`, `BIND`, `FORWARDED_ALLOW_IPS`, `TIMEOUT`, `GRACEFUL_TIMEOUT`,
+`KEEPALIVE`, `MAX_REQUESTS`, `MAX_REQUESTS_JITTER`, `PRELOAD_APP`,
+`ACCESSLOG`, `ERRORLOG` and `LOGLEVEL`. The other settings are passed on the
+command line or in `GUNICORN_CMD_ARGS`, see
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import gc
+import os
+import typing as t
+
+import environ
+
+env = environ.Env()
+env.prefix = "GUNICORN_"
+
+# The CPUs of the container, not of the host.
+cpus = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else os.cpu_count() or 1
+)
+
+WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    # Serves the async viewsets natively on the ASGI application.
+    "uvicorn": "uvicorn_worker.UvicornWorker",
+}
+
+# `gthread` keeps a worker responsive while one of its threads waits on a slow
+# request or the database, so it needs fewer processes than `sync`.
+worker_type: str = env.str("WORKER_CLASS", default="gthread")  # pyright: ignore[reportArgumentType]
+worker_class = WORKER_CLASSES[worker_type]
+wsgi_app = "server.asgi:application" if worker_type == "uvicorn" else "server.wsgi"
+
+default_workers = {"sync": cpus * 2 + 1, "gthread": cpus + 1, "uvicorn": cpus}
+workers: int = env.int("WORKERS", default=default_workers[worker_type])  # pyright: ignore[reportArgumentType]
+# Every thread holds its own database connection, see `DATABASE_CONN_MAX_AGE`.
+# Gunicorn runs `sync` as `gthread` once `threads` is above 1.
+threads: int = env.int("THREADS", default=1 if worker_type == "sync" else 4)  # pyright: ignore[reportArgumentType]
+
+bind: list[str] = env.list("BIND", default=[":8000"])  # pyright: ignore[reportArgumentType]
+forwarded_allow_ips: str = env.str("FORWARDED_ALLOW_IPS", default="*")  # pyright: ignore[reportArgumentType]
+timeout: int = env.int("TIMEOUT", default=300)  # pyright: ignore[reportArgumentType]
+graceful_timeout: int = env.int("GRACEFUL_TIMEOUT", default=30)  # pyright: ignore[reportArgumentType]
+keepalive: int = env.int("KEEPALIVE", default=5)  # pyright: ignore[reportArgumentType]
+
+# Restart a worker after this many requests, to bound the growth of leaked or
+# fragmented memory. The jitter keeps the workers from restarting together.
+max_requests: int = env.int("MAX_REQUESTS", default=1000)  # pyright: ignore[reportArgumentType]
+max_requests_jitter: int = env.int(
+    "MAX_REQUESTS_JITTER",
+    default=max_requests // 10,  # pyright: ignore[reportArgumentType]
+)
+
+# Import the application once in the master, so the workers share its memory
+# copy-on-write. Code changes then need a restart instead of a `HUP`.
+preload_app: bool = env.bool("PRELOAD_APP", default=True)  # pyright: ignore[reportArgumentType]
+
+accesslog: str | None = env.str("ACCESSLOG", default=None)  # pyright: ignore[reportArgumentType]
+errorlog: str = env.str("ERRORLOG", default="-")  # pyright: ignore[reportArgumentType]
+loglevel: str = env.str("LOGLEVEL", default="info")  # pyright: ignore[reportArgumentType]
+
+if preload_app:
+    # A collection in the master writes to the pages of every object it visits,
+    # which copies them for the workers forked after it.
+    gc.disable()
+
+
+def pre_fork(server: t.Any, worker: t.Any) -> None:
+    if not preload_app:
+        return
+
+    from django.db import connections
+
+    # A connection opened while loading the application must not be shared by
+    # the workers.
+    connections.close_all()
+    # Keep the objects of the loaded application out of the collections, which
+    # would otherwise copy their pages into every worker.
+    gc.freeze()
+
+
+def post_fork(server: t.Any, worker: t.Any) -> None:
+    if preload_app:
+        gc.enable()
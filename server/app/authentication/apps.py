@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = "server.utils.django.fields.UUIDAutoField"
     name = "server.app.authentication"
+
+    def ready(self) -> None:
+        # Connect the receivers that invalidate the cached users.
+        from server.app.authentication import authentication  # noqa: F401
+        from server.app.authentication import serializers as auth_serializers
+        from server.utils.django import cache as util_cache
+
+        # The permission version of the tokens reads their generations.
+        util_cache.track_models(auth_serializers.PERMISSION_MODELS)
@@ -0,0 +1,162 @@
+import functools
+import typing as t
+
+from django import dispatch
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import signals
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import authentication, exceptions, tokens
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from server.app.authentication import models as auth_models
+from server.app.authentication import serializers as auth_serializers
+
+USER_CACHE_KEY_PREFIX = "jwt-user"
+
+# The fields kept in the cached user, the others are loaded on access.
+USER_SNAPSHOT_FIELDS = (
+    "id",
+    "password",
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "updated_at",
+)
+
+
+# The user claims of the tokens that grant access, checked against the user.
+STALE_USER_CLAIMS = ("is_staff", "is_superuser")
+
+
+def get_user_cache_key(user_id: t.Any) -> str:
+    return f"{USER_CACHE_KEY_PREFIX}:{user_id}"
+
+
+class CachedJWTAuthentication(authentication.JWTAuthentication):
+    """
+    JWT authentication that loads the user from the cache instead of the database.
+
+    A snapshot of the user with `USER_SNAPSHOT_FIELDS` is cached per user id for
+    `JWT_USER_CACHE_TIMEOUT` seconds and deleted when the user is saved or
+    deleted, so a deactivation or a password change applies to the next request.
+    Users changed by a queryset `update()` are picked up when the entry expires.
+
+    With `JWT_STATELESS_USER` the user is built from the token claims only, as a
+    `TokenUser` that is not checked against the database. Writes save it in
+    `created_by` and `updated_by` by its primary key, see
+    `server.utils.rest_framework.fields.get_action_user`.
+
+    A token whose permission version is older than the current one is rejected
+    in both modes, and so is a token whose staff or superuser claims no longer
+    match the cached user, so the client refreshes it to get the current claims.
+    """
+
+    def get_user(self, validated_token: tokens.Token) -> t.Any:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise exceptions.InvalidToken(
+                _("Token contained no recognizable user identification"),
+            ) from e
+
+        self.check_perm_version(validated_token)
+
+        if settings.JWT_STATELESS_USER:
+            return api_settings.TOKEN_USER_CLASS(validated_token)
+
+        user = self.get_cached_user(user_id)
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(
+                _("User is inactive"),
+                code="user_inactive",
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM,
+        ) != get_md5_hash_password(user.password):
+            raise exceptions.AuthenticationFailed(
+                _("The user's password has been changed."),
+                code="password_changed",
+            )
+
+        if any(
+            claim in validated_token and validated_token[claim] != getattr(user, claim)
+            for claim in STALE_USER_CLAIMS
+        ):
+            raise exceptions.InvalidToken(_("Token claims are out of date"))
+
+        return user
+
+    def check_perm_version(self, validated_token: tokens.Token) -> None:
+        """
+        Reject a token issued before the permissions last changed.
+
+        Tokens without the claim, such as `AccessToken.for_user`, claim no
+        permissions and are accepted.
+
+        Args:
+            validated_token (tokens.Token): The token.
+
+        Raises:
+            exceptions.InvalidToken: If the permission version of the token is
+                not the current one.
+        """
+        perm_version = validated_token.get(auth_serializers.PERM_VERSION_CLAIM)
+        if (
+            perm_version is not None
+            and perm_version != auth_serializers.get_perm_version()
+        ):
+            raise exceptions.InvalidToken(_("Token permissions are out of date"))
+
+    def get_cached_user(self, user_id: t.Any) -> auth_models.User:
+        """
+        Get the user snapshot from the cache, loading it on a miss.
+
+        Args:
+            user_id (t.Any): The user id claim of the token.
+
+        Raises:
+            exceptions.AuthenticationFailed: If the user does not exist.
+
+        Returns:
+            auth_models.User: The user.
+        """
+        key = get_user_cache_key(user_id)
+        user: auth_models.User | None = cache.get(key)
+        if user is not None:
+            return user
+
+        try:
+            user = auth_models.User.objects.only(*USER_SNAPSHOT_FIELDS).get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except auth_models.User.DoesNotExist as e:
+            raise exceptions.AuthenticationFailed(
+                _("User not found"),
+                code="user_not_found",
+            ) from e
+
+        cache.set(key, user, settings.JWT_USER_CACHE_TIMEOUT)
+        return user
+
+
+@dispatch.receiver(signals.post_save, sender=auth_models.User)
+@dispatch.receiver(signals.post_delete, sender=auth_models.User)
+def delete_cached_user(
+    sender: type[auth_models.User],
+    instance: auth_models.User,
+    **kwargs: t.Any,
+) -> None:
+    key = get_user_cache_key(getattr(instance, api_settings.USER_ID_FIELD))
+    cache.delete(key)
+    # A concurrent request may cache the row before the change commits, which
+    # would keep it for the whole timeout.
+    transaction.on_commit(functools.partial(cache.delete, key))
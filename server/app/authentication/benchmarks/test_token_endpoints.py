@@ -0,0 +1,45 @@
+import time
+import typing as t
+
+import pytest
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status, test
+from rest_framework_simplejwt import tokens
+
+from server.app.authentication import models as auth_models
+
+ROUNDS = 100
+
+
+@pytest.fixture
+def user() -> auth_models.User:
+    return baker.make(auth_models.User, is_active=True)
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestTokenEndpointsBenchmark:
+    @pytest.mark.parametrize("endpoint", ["obtain", "refresh"])
+    def test_endpoint(self, user: auth_models.User, endpoint: str) -> None:
+        user.set_password("password")
+        user.save()
+        client = test.APIClient()
+        refresh = str(tokens.RefreshToken.for_user(user))
+        data = (
+            {"username": user.username, "password": "password"}
+            if endpoint == "obtain"
+            else {"refresh": refresh}
+        )
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            response = client.post(reverse(f"v1:authentication:{endpoint}"), data)
+            assert response.status_code == status.HTTP_200_OK
+            if endpoint == "refresh":
+                data = {"refresh": t.cast(dict[str, t.Any], response.data)["refresh"]}
+        elapsed = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"\n{endpoint}: {elapsed / ROUNDS * 1000:,.2f} ms per request",
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:25
+
+import server.utils.django.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=server.utils.django.fields.default_uuid, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
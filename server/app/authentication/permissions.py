@@ -0,0 +1,27 @@
+import typing as t
+
+from rest_framework import permissions, views
+from rest_framework import request as drf_request
+from rest_framework_simplejwt import tokens
+
+
+class TokenClaimPermission(permissions.BasePermission):
+    """
+    Allow the requests whose access token sets `claim`, without loading the user.
+
+    `CachedJWTAuthentication` rejects the tokens whose claims are out of date.
+    """
+
+    claim: t.ClassVar[str]
+
+    def has_permission(self, request: drf_request.Request, view: views.APIView) -> bool:
+        token = request.auth
+        return isinstance(token, tokens.Token) and bool(token.get(self.claim, False))
+
+
+class IsStaffClaim(TokenClaimPermission):
+    claim = "is_staff"
+
+
+class IsSuperuserClaim(TokenClaimPermission):
+    claim = "is_superuser"
@@ -0,0 +1,92 @@
+import hashlib
+import typing as t
+
+import orjson
+from django.contrib.auth import models as django_auth_models
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import exceptions, tokens
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.settings import api_settings
+
+from server.app.authentication import models as auth_models
+from server.utils.django import cache as util_cache
+
+PERM_VERSION_CLAIM = "perm_version"
+
+# The models whose changes may change the permissions of a user.
+PERMISSION_MODELS: tuple[type[t.Any], ...] = (
+    django_auth_models.Permission,
+    django_auth_models.Group,
+    django_auth_models.Group.permissions.through,
+    auth_models.User.groups.through,
+    auth_models.User.user_permissions.through,
+)
+
+
+# The user fields the claims are derived from.
+USER_CLAIM_FIELDS = ("id", "username", "is_active", "is_staff", "is_superuser")
+
+
+def get_perm_version() -> str:
+    """
+    Get the version of the permission sets, from the cache generations.
+
+    The version changes whenever a permission, a group or the permissions or
+    groups of a user change, so a token with an older version has claims that
+    may no longer hold.
+
+    Returns:
+        str: The version, a digest of the generations.
+    """
+    generations = util_cache.get_generations(PERMISSION_MODELS)
+    signature = orjson.dumps(sorted(generations.items()))
+    return hashlib.md5(signature, usedforsecurity=False).hexdigest()
+
+
+def set_user_claims(token: tokens.Token, user: auth_models.User) -> None:
+    token["username"] = user.username
+    token["is_staff"] = user.is_staff
+    token["is_superuser"] = user.is_superuser
+    token[PERM_VERSION_CLAIM] = get_perm_version()
+
+
+class MyTokenObtainPairSerializer(jwt_serializers.TokenObtainPairSerializer):
+    """
+    Token obtain pair serializer that adds the user claims the views need.
+
+    The claims are copied to the access tokens made on refresh.
+    """
+
+    @classmethod
+    def get_token(cls, user: auth_models.User) -> tokens.Token:
+        token = super().get_token(user)
+        set_user_claims(token, user)
+        return token
+
+
+class MyTokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """
+    Token refresh serializer that derives the user claims from the user again.
+
+    Otherwise the claims of the first refresh token are copied to every access
+    and rotated refresh token, so a demoted user would keep them. Refreshing a
+    token of a deleted or inactive user fails like obtaining one.
+    """
+
+    def validate(self, attrs: dict[str, t.Any]) -> dict[str, str]:
+        refresh = self.token_class(attrs["refresh"])
+        user = (
+            auth_models.User.objects.filter(
+                **{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]},
+            )
+            .only(*USER_CLAIM_FIELDS)
+            .first()
+        )
+        if user is None or not user.is_active:
+            raise exceptions.AuthenticationFailed(
+                _("No active account found with the given credentials"),
+                code="no_active_account",
+            )
+
+        set_user_claims(refresh, user)
+        return super().validate({**attrs, "refresh": str(refresh)})
@@ -0,0 +1,271 @@
+import typing as t
+
+import pytest
+from django.contrib.auth import models as django_auth_models
+from django.core.cache import cache
+from django.urls import reverse
+from model_bakery import baker
+from pytest_django import fixtures
+from rest_framework import request as drf_request
+from rest_framework import status, test, views
+from rest_framework_simplejwt import exceptions, models, tokens
+
+from server.app.authentication import authentication, permissions, serializers
+from server.app.authentication import models as auth_models
+
+
+@pytest.fixture
+def user() -> auth_models.User:
+    return baker.make(auth_models.User, is_active=True)
+
+
+def get_access_token(user: auth_models.User) -> tokens.Token:
+    refresh = serializers.MyTokenObtainPairSerializer.get_token(user)
+    return t.cast(tokens.RefreshToken, refresh).access_token
+
+
+@pytest.fixture
+def authenticate(user: auth_models.User) -> t.Callable[[], t.Any]:
+    token = tokens.AccessToken.for_user(user)
+
+    def _authenticate() -> t.Any:
+        request = test.APIRequestFactory().get(
+            "/",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+        result = authentication.CachedJWTAuthentication().authenticate(request)
+        assert result is not None
+        return result[0]
+
+    return _authenticate
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    def test_cache_user(
+        self,
+        user: auth_models.User,
+        authenticate: t.Callable[[], t.Any],
+        django_assert_num_queries: fixtures.DjangoAssertNumQueries,
+    ) -> None:
+        with django_assert_num_queries(1):
+            authenticate()
+        with django_assert_num_queries(0):
+            cached_user = authenticate()
+
+        assert cached_user == user
+        assert cached_user.username == user.username
+        assert cached_user.is_staff == user.is_staff
+
+    def test_invalidate_on_save(
+        self,
+        user: auth_models.User,
+        authenticate: t.Callable[[], t.Any],
+        django_assert_num_queries: fixtures.DjangoAssertNumQueries,
+    ) -> None:
+        authenticate()
+
+        user.first_name = "updated"
+        user.save()
+
+        with django_assert_num_queries(1):
+            assert authenticate().first_name == "updated"
+
+    def test_invalidate_on_commit(
+        self,
+        user: auth_models.User,
+        authenticate: t.Callable[[], t.Any],
+        django_capture_on_commit_callbacks: t.Any,
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save()
+            # A concurrent request caches the user before the commit.
+            cache.set(
+                authentication.get_user_cache_key(user.pk),
+                baker.prepare(auth_models.User, pk=user.pk, is_active=True),
+            )
+
+        with pytest.raises(exceptions.AuthenticationFailed) as exc_info:
+            authenticate()
+        assert exc_info.value.detail["code"] == "user_inactive"  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+    def test_deactivated_user(
+        self,
+        user: auth_models.User,
+        authenticate: t.Callable[[], t.Any],
+    ) -> None:
+        authenticate()
+
+        user.is_active = False
+        user.save()
+
+        with pytest.raises(exceptions.AuthenticationFailed) as exc_info:
+            authenticate()
+        assert exc_info.value.detail["code"] == "user_inactive"  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+    def test_deleted_user(
+        self,
+        user: auth_models.User,
+        authenticate: t.Callable[[], t.Any],
+    ) -> None:
+        authenticate()
+        key = authentication.get_user_cache_key(user.pk)
+
+        user.delete()
+
+        assert cache.get(key) is None
+        with pytest.raises(exceptions.AuthenticationFailed) as exc_info:
+            authenticate()
+        assert exc_info.value.detail["code"] == "user_not_found"  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+    def test_stateless_user(
+        self,
+        user: auth_models.User,
+        authenticate: t.Callable[[], t.Any],
+        django_assert_num_queries: fixtures.DjangoAssertNumQueries,
+        settings: t.Any,
+    ) -> None:
+        settings.JWT_STATELESS_USER = True
+
+        with django_assert_num_queries(0):
+            token_user = authenticate()
+
+        assert isinstance(token_user, models.TokenUser)
+        assert token_user.pk == str(user.pk)
+
+    @pytest.mark.parametrize("stateless", [False, True])
+    def test_stale_perm_version(
+        self,
+        user: auth_models.User,
+        settings: t.Any,
+        stateless: bool,  # noqa: FBT001
+    ) -> None:
+        settings.JWT_STATELESS_USER = stateless
+        token = get_access_token(user)
+        jwt_authentication = authentication.CachedJWTAuthentication()
+        assert jwt_authentication.get_user(token).pk in {user.pk, str(user.pk)}
+
+        user.groups.add(baker.make(django_auth_models.Group))
+
+        with pytest.raises(exceptions.InvalidToken):
+            jwt_authentication.get_user(token)
+
+    def test_stale_staff_claim(self, user: auth_models.User) -> None:
+        user.is_staff = True
+        user.save()
+        token = get_access_token(user)
+
+        user.is_staff = False
+        user.save()
+
+        with pytest.raises(exceptions.InvalidToken):
+            authentication.CachedJWTAuthentication().get_user(token)
+
+
+@pytest.mark.django_db
+class TestTokenClaimPermission:
+    @pytest.mark.parametrize(
+        ("permission_class", "is_staff", "is_superuser", "expected"),
+        [
+            (permissions.IsStaffClaim, True, False, True),
+            (permissions.IsStaffClaim, False, True, False),
+            (permissions.IsSuperuserClaim, False, True, True),
+            (permissions.IsSuperuserClaim, True, False, False),
+        ],
+    )
+    def test_has_permission(
+        self,
+        user: auth_models.User,
+        permission_class: type[permissions.TokenClaimPermission],
+        is_staff: bool,  # noqa: FBT001
+        is_superuser: bool,  # noqa: FBT001
+        expected: bool,  # noqa: FBT001
+    ) -> None:
+        user.is_staff = is_staff
+        user.is_superuser = is_superuser
+        token = get_access_token(user)
+        request = drf_request.Request(test.APIRequestFactory().get("/"))
+        request.auth = token
+
+        assert permission_class().has_permission(request, views.APIView()) is expected
+
+    def test_no_token(self) -> None:
+        request = drf_request.Request(test.APIRequestFactory().get("/"))
+        request.auth = None
+
+        assert not permissions.IsStaffClaim().has_permission(request, views.APIView())
+
+
+@pytest.mark.django_db
+class TestMyTokenObtainPairSerializer:
+    def test_claims(self, user: auth_models.User) -> None:
+        token = serializers.MyTokenObtainPairSerializer.get_token(user)
+
+        assert token["username"] == user.username
+        assert token["is_staff"] == user.is_staff
+        assert token["is_superuser"] == user.is_superuser
+        assert token[serializers.PERM_VERSION_CLAIM] == serializers.get_perm_version()
+
+    def test_perm_version_on_group_change(self, user: auth_models.User) -> None:
+        perm_version = serializers.get_perm_version()
+
+        user.groups.add(baker.make(django_auth_models.Group))
+
+        assert serializers.get_perm_version() != perm_version
+
+    def test_obtain_and_refresh(self, user: auth_models.User) -> None:
+        user.set_password("password")
+        user.save()
+        client = test.APIClient()
+
+        response = client.post(
+            reverse("v1:authentication:obtain"),
+            {"username": user.username, "password": "password"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response_data = t.cast(dict[str, t.Any], response.data)
+        response = client.post(
+            reverse("v1:authentication:refresh"),
+            {"refresh": response_data["refresh"]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        access_token = tokens.AccessToken(response_data["access"])
+        assert access_token["username"] == user.username
+        assert serializers.PERM_VERSION_CLAIM in access_token
+
+    def test_refresh_derives_claims(self, user: auth_models.User) -> None:
+        user.is_staff = True
+        user.save()
+        refresh = serializers.MyTokenObtainPairSerializer.get_token(user)
+        perm_version = serializers.get_perm_version()
+
+        user.is_staff = False
+        user.save()
+        user.groups.add(baker.make(django_auth_models.Group))
+        serializer = serializers.MyTokenRefreshSerializer(
+            data={"refresh": str(refresh)},
+        )
+        serializer.is_valid(raise_exception=True)
+
+        for token in (
+            tokens.AccessToken(serializer.validated_data["access"]),
+            tokens.RefreshToken(serializer.validated_data["refresh"]),
+        ):
+            assert token["is_staff"] is False
+            assert token[serializers.PERM_VERSION_CLAIM] != perm_version
+
+    def test_refresh_inactive_user(self, user: auth_models.User) -> None:
+        refresh = serializers.MyTokenObtainPairSerializer.get_token(user)
+        user.is_active = False
+        user.save()
+
+        serializer = serializers.MyTokenRefreshSerializer(
+            data={"refresh": str(refresh)},
+        )
+
+        with pytest.raises(exceptions.AuthenticationFailed) as exc_info:
+            serializer.is_valid()
+        assert exc_info.value.detail["code"] == "no_active_account"  # pyright: ignore[reportCallIssue, reportArgumentType]
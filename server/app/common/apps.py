@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.core import checks
+
+from server.utils.django import checks as util_checks
 
 
 class CommonConfig(AppConfig):
     default_auto_field = "server.utils.django.fields.UUIDAutoField"
     name = "server.app.common"
+
+    def ready(self) -> None:
+        checks.register(util_checks.check_uuid_version)
@@ -0,0 +1,32 @@
+import os
+import time
+
+from django.core import signals
+from django.db import connections
+
+DEFAULT_ROUNDS = 200
+
+rounds = int(os.getenv("CONNECT_LATENCY_ROUNDS", DEFAULT_ROUNDS))
+
+# Run each round as a request, so `CONN_MAX_AGE`, the health checks and the pool
+# close or reuse the connections like they do for the real requests.
+for connection in connections.all():
+    timings: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        signals.request_started.send(sender=None)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        signals.request_finished.send(sender=None)
+        timings.append(time.perf_counter() - start)
+
+    first = timings[0]
+    timings.sort()
+    print(  # noqa: T201
+        f"{connection.alias}: {rounds} requests, "
+        f"first {first * 1000:.2f} ms, "
+        f"median {timings[len(timings) // 2] * 1000:.2f} ms, "
+        f"p99 {timings[int(len(timings) * 0.99)] * 1000:.2f} ms "
+        f"(CONN_MAX_AGE={connection.settings_dict['CONN_MAX_AGE']}, "
+        f"pool={bool(connection.settings_dict['OPTIONS'].get('pool'))})",
+    )
@@ -0,0 +1,47 @@
+import concurrent.futures
+import os
+import time
+import urllib.error
+import urllib.request
+
+DEFAULT_URL = "http://localhost:8000/api/v1/"
+DEFAULT_REQUESTS = 2000
+DEFAULT_CONCURRENCY = 50
+
+# Run once against each `GUNICORN_WORKER_CLASS` of `gunicorn.conf.py`, with the
+# same URL, token and concurrency, to compare the sync workers with uvicorn.
+url = os.getenv("HTTP_LOAD_URL", DEFAULT_URL)
+requests = int(os.getenv("HTTP_LOAD_REQUESTS", DEFAULT_REQUESTS))
+concurrency = int(os.getenv("HTTP_LOAD_CONCURRENCY", DEFAULT_CONCURRENCY))
+headers = {"Accept": "application/json"}
+if token := os.getenv("HTTP_LOAD_TOKEN"):
+    headers["Authorization"] = f"Bearer {token}"
+
+
+def fetch(_: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    request = urllib.request.Request(url, headers=headers)  # noqa: S310
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:  # noqa: S310
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return time.perf_counter() - start, status
+
+
+start = time.perf_counter()
+with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+    results = list(executor.map(fetch, range(requests)))
+elapsed = time.perf_counter() - start
+
+timings = sorted(timing for timing, _ in results)
+errors = sum(status >= 400 for _, status in results)  # noqa: PLR2004
+print(  # noqa: T201
+    f"{url}: {requests} requests, {concurrency} concurrent, "
+    f"{requests / elapsed:,.1f} req/s, "
+    f"median {timings[len(timings) // 2] * 1000:.2f} ms, "
+    f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f} ms, "
+    f"p99 {timings[int(len(timings) * 0.99)] * 1000:.2f} ms, "
+    f"{errors} errors",
+)
@@ -0,0 +1,40 @@
+import os
+import pathlib
+
+# Compare the runs with `GUNICORN_PRELOAD_APP` on and off, after the same load,
+# e.g. `server/scripts/http_load.py`. RSS counts the pages shared with the master
+# in full, PSS splits them between the processes that share them.
+master = int(os.environ["WORKER_RSS_PID"])
+
+
+def read_memory(pid: int) -> dict[str, int]:
+    memory: dict[str, int] = {}
+    for line in pathlib.Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        memory[name.rstrip(":")] = int(value)
+    return memory
+
+
+def get_children(pid: int) -> list[int]:
+    children = pathlib.Path(f"/proc/{pid}/task/{pid}/children").read_text()
+    return [int(child) for child in children.split()]
+
+
+totals = {"Rss": 0, "Pss": 0}
+for name, pid in [
+    ("master", master),
+    *(("worker", child) for child in get_children(master)),
+]:
+    memory = read_memory(pid)
+    shared = memory["Shared_Clean"] + memory["Shared_Dirty"]
+    totals["Rss"] += memory["Rss"]
+    totals["Pss"] += memory["Pss"]
+    print(  # noqa: T201
+        f"{name} {pid}: RSS {memory['Rss'] / 1024:.1f} MiB, "
+        f"PSS {memory['Pss'] / 1024:.1f} MiB, "
+        f"shared {shared / 1024:.1f} MiB",
+    )
+
+print(  # noqa: T201
+    f"total: RSS {totals['Rss'] / 1024:.1f} MiB, PSS {totals['Pss'] / 1024:.1f} MiB",
+)
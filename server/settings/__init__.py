@@ -85,6 +85,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "server.utils.django.middleware.PrimaryPinMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -124,11 +125,84 @@ DATABASES = {
     ),
 }
 
+# Read replicas of `default`, for the reads of the list and retrieve actions,
+# see `server.utils.django.routers.ReplicaRouter`.
+DATABASE_REPLICA_URLS: list[str] = env.list("DATABASE_REPLICA_URLS", default=[])  # pyright: ignore[reportArgumentType]
+DATABASE_REPLICAS = [f"replica_{index}" for index in range(len(DATABASE_REPLICA_URLS))]
+for alias, url in zip(DATABASE_REPLICAS, DATABASE_REPLICA_URLS, strict=True):
+    DATABASES[alias] = env.db_url_config(url)
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+
+DATABASE_ROUTERS = [
+    "server.utils.django.routers.ReplicaRouter",
+]
+
+# Seconds a client reads from the primary after a write, longer than the
+# replica lag, see `server.utils.django.middleware.PrimaryPinMiddleware`.
+DATABASE_REPLICA_PIN_SECONDS: int = env.int(
+    "DATABASE_REPLICA_PIN_SECONDS",
+    default=5,  # pyright: ignore[reportArgumentType]
+)
+
+# Set by `server.asgi`. The async views query from the threads of
+# `sync_to_async`, whose persistent connections are never closed, so they are
+# disabled, see https://docs.djangoproject.com/en/5.1/ref/databases/#persistent-connections
+ASGI: bool = env.bool("ASGI", default=False)  # pyright: ignore[reportArgumentType]
+
+for database in DATABASES.values():
+    # Seconds a connection is kept open for the next requests of the same
+    # thread, 0 to connect on every request. Health checks reconnect when it
+    # broke idle. Use `DATABASE_POOL` to reuse connections under ASGI.
+    database["CONN_MAX_AGE"] = (
+        0 if ASGI else env.int("DATABASE_CONN_MAX_AGE", default=0)  # pyright: ignore[reportArgumentType]
+    )
+    database["CONN_HEALTH_CHECKS"] = env.bool(
+        "DATABASE_CONN_HEALTH_CHECKS",
+        default=True,  # pyright: ignore[reportArgumentType]
+    )
+
+    if database["ENGINE"] != "django.db.backends.postgresql":
+        continue
+    database_options = database.setdefault("OPTIONS", {})
+
+    # PgBouncer in transaction mode moves the session between transactions,
+    # which breaks server side cursors and prepared statements.
+    if env.bool("DATABASE_PGBOUNCER", default=False):  # pyright: ignore[reportArgumentType]
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+        database_options["prepare_threshold"] = None
+
+    # A psycopg pool per process, shared by its threads, instead of one
+    # persistent connection per thread.
+    # https://docs.djangoproject.com/en/5.1/ref/databases/#connection-pool
+    if env.bool("DATABASE_POOL", default=False):  # pyright: ignore[reportArgumentType]
+        database["CONN_MAX_AGE"] = 0
+        database_options["pool"] = {
+            "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=2),  # pyright: ignore[reportArgumentType]
+            "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=10),  # pyright: ignore[reportArgumentType]
+            # Seconds to wait for a free connection before failing the request.
+            "timeout": env.float("DATABASE_POOL_TIMEOUT", default=10.0),  # pyright: ignore[reportArgumentType]
+            "max_idle": env.float("DATABASE_POOL_MAX_IDLE", default=600.0),  # pyright: ignore[reportArgumentType]
+            "max_lifetime": env.float("DATABASE_POOL_MAX_LIFETIME", default=3600.0),  # pyright: ignore[reportArgumentType]
+        }
+
 FIXTURE_DIRS = [
     BASE_DIR / "server" / "fixtures",
 ]
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/ref/settings/#caches
+
+# Cached responses are invalidated through the cache itself, use a shared
+# backend such as `rediscache://` when more than one process serves requests.
+CACHES = {
+    "default": env.cache_url(
+        "CACHE_URL",
+        default="locmemcache://",  # pyright: ignore[reportArgumentType]
+    ),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -186,12 +260,27 @@ STORAGES = {
     },
 }
 
+# The uploaded files of a request are kept in memory up to this size in total,
+# the ones past it are spooled to disk.
+FILE_UPLOAD_MAX_MEMORY_SIZE: int = env.int(
+    "FILE_UPLOAD_MAX_MEMORY_SIZE",
+    default=2621440,  # pyright: ignore[reportArgumentType]
+)
+
+FILE_UPLOAD_HANDLERS = [
+    "server.utils.django.upload_handlers.SpooledTemporaryFileUploadHandler",
+]
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "server.utils.django.fields.UUIDAutoField"
 
+# UUID version of generated primary keys, 4 (random) or 7 (time-ordered).
+# Version 7 keeps inserts local in the primary key btree.
+UUID_VERSION: int = env.int("UUID_VERSION", default=4)  # pyright: ignore[reportArgumentType]
+
 
 # Extra settings
 
@@ -0,0 +1,5 @@
+# One of "exact", "estimate" or "cached",
+# see `server.utils.rest_framework.pagination.CountStrategyPaginator`.
+PAGINATION_COUNT_STRATEGY = "exact"
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = 100_000
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
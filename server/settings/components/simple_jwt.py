@@ -5,5 +5,12 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": datetime.timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
     "TOKEN_OBTAIN_SERIALIZER": "server.app.authentication.serializers.MyTokenObtainPairSerializer",  # noqa: E501
+    "TOKEN_REFRESH_SERIALIZER": "server.app.authentication.serializers.MyTokenRefreshSerializer",  # noqa: E501
     "UPDATE_LAST_LOGIN": True,
 }
+
+# Seconds a user is cached between requests,
+# see `server.app.authentication.authentication.CachedJWTAuthentication`.
+JWT_USER_CACHE_TIMEOUT = 60
+# Authenticate a `TokenUser` built from the token claims, without the database.
+JWT_STATELESS_USER = False
@@ -1,4 +1,5 @@
 from server.settings import BASE_DIR, INSTALLED_APPS, MIDDLEWARE
+from server.settings.components.simple_jwt import SIMPLE_JWT
 
 TEST_APPS = [
     "nplusone.ext.django",
@@ -16,12 +17,26 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
-    }
+    },
+    # Routed to only by the tests that set `DATABASE_REPLICAS`.
+    "replica_0": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+        "TEST": {"MIRROR": "default"},
+    },
+}
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
 }
 AUTH_PASSWORD_VALIDATORS = []
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
 TIME_ZONE = "UTC"
+# PyJWT warns about HMAC keys shorter than 32 bytes, such as the `SECRET_KEY`
+# of `.env.example`, and the tests turn warnings into errors.
+SIMPLE_JWT = {**SIMPLE_JWT, "SIGNING_KEY": "test-signing-key-" * 2}
 
 NPLUSONE_RAISE = True
@@ -0,0 +1,149 @@
+import functools
+import time
+import typing as t
+
+from django import dispatch
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models import signals
+
+GENERATION_KEY_PREFIX = "generation"
+GENERATION_TIMEOUT = None
+
+# Sent with `key` and `hit` on every lookup of a cached response, to be
+# connected to metrics.
+response_cache_lookup = dispatch.Signal()
+
+# The cache aliases that read the generation of each model, by generation key.
+# The changes of the other models bump nothing.
+_tracked_aliases: dict[str, set[str]] = {}
+
+
+def get_generation_key(model: type[models.Model]) -> str:
+    # Proxy models share the rows, and so the generation, of their concrete model.
+    concrete_model = model._meta.concrete_model or model  # noqa: SLF001
+    return f"{GENERATION_KEY_PREFIX}:{concrete_model._meta.label_lower}"  # noqa: SLF001
+
+
+def track_models(
+    model_classes: t.Iterable[type[models.Model]],
+    alias: str = "default",
+) -> None:
+    """
+    Bump the generations of models in a cache alias whenever they change.
+
+    The receivers are connected to the models and their many-to-many through
+    models only, so the other models keep the fast path of `QuerySet.delete`
+    that Django takes for the models without delete signals.
+
+    Args:
+        model_classes (t.Iterable[type[models.Model]]): The models.
+        alias (str): The cache alias that reads their generations.
+    """
+    for model in model_classes:
+        _tracked_aliases.setdefault(get_generation_key(model), set()).add(alias)
+        _connect_receivers(model)
+
+
+def _connect_receivers(model: type[models.Model]) -> None:
+    # A receiver is connected once per sender, however often it is tracked.
+    signals.post_save.connect(bump_generation_on_change, model)
+    signals.post_delete.connect(bump_generation_on_change, model)
+
+    opts = model._meta  # noqa: SLF001
+    for relation in [
+        *(field.remote_field for field in opts.many_to_many),
+        *(related for related in opts.related_objects if related.many_to_many),
+    ]:
+        # `through` may still be an "app_label.ModelName" reference here,
+        # which the model signals resolve once the model is registered.
+        signals.m2m_changed.connect(bump_generation_on_m2m_change, relation.through)
+
+
+def _new_generation() -> int:
+    # A counter that is evicted restarts above any value it had before, so the
+    # entries cached under an old generation are never read again.
+    return time.time_ns()
+
+
+def get_generations(
+    model_classes: t.Iterable[type[models.Model]],
+    alias: str = "default",
+) -> dict[str, int]:
+    """
+    Get the generation counters of models, starting the missing ones.
+
+    Args:
+        model_classes (t.Iterable[type[models.Model]]): The models.
+        alias (str): The cache alias.
+
+    Returns:
+        dict[str, int]: The generation of each model by generation key.
+    """
+    cache = caches[alias]
+    keys = list(dict.fromkeys(get_generation_key(model) for model in model_classes))
+    generations: dict[str, t.Any] = cache.get_many(keys)
+
+    for key in keys:
+        if key not in generations:
+            generation = _new_generation()
+            # Another process may have started the counter in the meantime.
+            cache.add(key, generation, GENERATION_TIMEOUT)
+            generations[key] = cache.get(key, generation)
+    return generations
+
+
+def _incr_generation(key: str, alias: str) -> None:
+    cache = caches[alias]
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _new_generation(), GENERATION_TIMEOUT)
+
+
+def bump_generation(
+    model: type[models.Model],
+    using: str | None = None,
+    alias: str | None = None,
+) -> None:
+    """
+    Bump the generation counter of a model, invalidating what was cached for it.
+
+    The counter is bumped right away and again when the transaction commits, so
+    a response cached from the rows before the commit is not kept either.
+
+    Args:
+        model (type[models.Model]): The changed model.
+        using (str | None): The database alias of the change.
+        alias (str | None): The cache alias, `None` bumps the counter in every
+            alias the model is tracked in, see `track_models`.
+    """
+    key = get_generation_key(model)
+    for cache_alias in _tracked_aliases.get(key, ()) if alias is None else (alias,):
+        _incr_generation(key, cache_alias)
+        transaction.on_commit(
+            functools.partial(_incr_generation, key, cache_alias),
+            using,
+        )
+
+
+def bump_generation_on_change(
+    sender: type[models.Model],
+    using: str | None = None,
+    **kwargs: t.Any,
+) -> None:
+    bump_generation(sender, using)
+
+
+def bump_generation_on_m2m_change(
+    sender: type[models.Model],
+    instance: models.Model,
+    action: str,
+    model: type[models.Model],
+    using: str | None = None,
+    **kwargs: t.Any,
+) -> None:
+    if action.startswith("post_"):
+        bump_generation(sender, using)
+        bump_generation(type(instance), using)
+        bump_generation(model, using)
@@ -0,0 +1,25 @@
+import typing as t
+
+from django.core import checks, exceptions
+
+from server.utils.django import fields as util_fields
+
+
+def check_uuid_version(**kwargs: t.Any) -> list[checks.CheckMessage]:
+    """
+    Check that the `UUID_VERSION` setting has a generator.
+
+    Returns:
+        list[checks.CheckMessage]: The errors found.
+    """
+    try:
+        util_fields.get_uuid_generator()
+    except exceptions.ImproperlyConfigured as e:
+        return [
+            checks.Error(
+                str(e),
+                hint="Set DJANGO_UUID_VERSION to a supported version.",
+                id="common.E001",
+            ),
+        ]
+    return []
@@ -1,16 +1,76 @@
 import datetime
+import os
+import time
 import typing as t
 import uuid
 
+from django.conf import settings
+from django.core import exceptions
 from django.db import models
 from django.db.backends.base import operations as base_operations
+from django.db.models import signals
 
 base_operations.BaseDatabaseOperations.integer_field_ranges["UUIDField"] = (0, 0)
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The 48 most significant bits hold the Unix timestamp in milliseconds and
+    the next 12 bits its sub-millisecond fraction, so later keys sort after
+    earlier ones and inserts stay on the right edge of the primary key index.
+    The remaining 62 bits are random.
+
+    Returns:
+        uuid.UUID: The generated UUID.
+    """
+    milliseconds, nanoseconds = divmod(time.time_ns(), 1_000_000)
+    fraction = nanoseconds * 0x1000 // 1_000_000
+    random = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(
+        int=(milliseconds & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | fraction << 64
+        | 0b10 << 62
+        | random,
+    )
+
+
+UUID_GENERATORS: dict[int, t.Callable[[], uuid.UUID]] = {4: uuid.uuid4, 7: uuid7}
+
+
+def get_uuid_generator() -> t.Callable[[], uuid.UUID]:
+    """
+    Get the generator of the version of the `UUID_VERSION` setting.
+
+    Returns:
+        t.Callable[[], uuid.UUID]: The generator.
+
+    Raises:
+        ImproperlyConfigured: If there is no generator for the version.
+    """
+    try:
+        return UUID_GENERATORS[settings.UUID_VERSION]
+    except KeyError as e:
+        versions = ", ".join(map(str, UUID_GENERATORS))
+        msg = f"UUID_VERSION must be one of {versions}, got {settings.UUID_VERSION!r}."
+        raise exceptions.ImproperlyConfigured(msg) from e
+
+
+def default_uuid() -> uuid.UUID:
+    """
+    Generate a primary key with the version of the `UUID_VERSION` setting.
+
+    Returns:
+        uuid.UUID: The generated UUID.
+    """
+    return get_uuid_generator()()
+
+
 class UUIDAutoField(models.UUIDField[uuid.UUID], models.AutoField):  # pyright: ignore[reportGeneralTypeIssues]
     def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
-        kwargs.setdefault("default", uuid.uuid4)
+        kwargs.setdefault("default", default_uuid)
         kwargs.setdefault("editable", False)
         super().__init__(*args, **kwargs)
 
@@ -22,18 +82,39 @@ class CreatedAtField(models.DateTimeField[datetime.datetime]):
 
 
 class UpdatedAtField(models.DateTimeField[datetime.datetime]):
+    # The `CreatedAtField` of the same model, resolved once the model class is
+    # prepared so that `pre_save` does not scan the model fields on every insert.
+    created_at_field: CreatedAtField | None = None
+
     def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
         kwargs["auto_now"] = True
         super().__init__(*args, **kwargs)
 
+    def contribute_to_class(
+        self,
+        cls: type[models.Model],
+        name: str,
+        private_only: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        super().contribute_to_class(cls, name, private_only=private_only)
+        signals.class_prepared.connect(self._set_created_at_field, sender=cls)
+
+    def _set_created_at_field(
+        self, sender: type[models.Model], **kwargs: t.Any
+    ) -> None:
+        self.created_at_field = next(  # pyright: ignore[reportAttributeAccessIssue]
+            (
+                field
+                for field in sender._meta.concrete_fields  # noqa: SLF001
+                if isinstance(field, CreatedAtField)
+            ),
+            None,
+        )
+
     def pre_save(self, model_instance: models.Model, add: bool) -> datetime.datetime:  # noqa: FBT001
-        if add:
-            for field in model_instance._meta.get_fields():  # noqa: SLF001
-                if not isinstance(field, CreatedAtField):
-                    continue
-
-                value = getattr(model_instance, field.name)
-                setattr(model_instance, self.attname, value)
-                return value
+        if add and self.created_at_field is not None:
+            value = getattr(model_instance, self.created_at_field.attname)
+            setattr(model_instance, self.attname, value)
+            return value
 
         return super().pre_save(model_instance, add)
@@ -1,13 +1,272 @@
+import datetime
+import typing as t
+
+from asgiref import sync
 from django.db import models
 from django.utils import timezone
 
+from server.utils.django import cache
+
+
+def update_in_batches(
+    queryset: models.QuerySet[t.Any],
+    batch_size: int | None = None,
+    **values: t.Any,
+) -> int:
+    """
+    Update the rows of a queryset, optionally in primary key ordered batches.
+
+    Every batch is its own `UPDATE ... WHERE pk IN (...)` statement, so outside
+    of an atomic block each batch commits on its own and row locks are released
+    early instead of being held by a single statement over the whole table.
+
+    Args:
+        queryset (models.QuerySet[t.Any]): The rows to update.
+        batch_size (int | None): Rows per `UPDATE`, `None` runs a single one.
+        **values (t.Any): The values passed to `QuerySet.update`.
+
+    Returns:
+        int: The number of updated rows.
+    """
+    if batch_size is None:
+        count = queryset.update(**values)
+        # `BaseQuerySet.update` bumps the generation itself.
+        if not isinstance(queryset, BaseQuerySet):
+            cache.bump_generation(queryset.model, queryset.db)
+        return count
+
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    # Each batch keeps the filter of the queryset, so a row that stopped matching
+    # since its primary key was read is left alone.
+    unordered = queryset.order_by()
+    count = 0
+    last_pk = None
+
+    while True:
+        batch = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+        batch_pks = list(batch[:batch_size])
+        if not batch_pks:
+            break
+
+        # The generation is bumped once below, not by every batch.
+        count += models.QuerySet.update(unordered.filter(pk__in=batch_pks), **values)
+        if len(batch_pks) < batch_size:
+            break
+        last_pk = batch_pks[-1]
+
+    cache.bump_generation(queryset.model, queryset.db)
+    return count
+
+
+def _has_field(model: type[models.Model], name: str) -> bool:
+    return any(field.name == name for field in model._meta.concrete_fields)  # noqa: SLF001
+
+
+def _auto_now_fields(model: type[models.Model]) -> list[models.Field[t.Any, t.Any]]:
+    return [
+        field
+        for field in model._meta.concrete_fields  # noqa: SLF001
+        if getattr(field, "auto_now", False)
+    ]
+
+
+class BaseQuerySet(models.QuerySet[models.Model]):
+    # Rows per statement when `batch_size` is not given, this keeps the `CASE`
+    # expressions of `bulk_update`, the parameters of `bulk_create` and the
+    # `UPDATE`s of the soft deletes bounded.
+    bulk_batch_size = 1000
+
+    def bulk_create(  # noqa: PLR0913
+        self,
+        objs: t.Iterable[models.Model],
+        batch_size: int | None = None,
+        ignore_conflicts: bool = False,  # noqa: FBT001, FBT002
+        update_conflicts: bool = False,  # noqa: FBT001, FBT002
+        update_fields: t.Sequence[str] | None = None,
+        unique_fields: t.Sequence[str] | None = None,
+        *,
+        user: models.Model | None = None,
+    ) -> list[models.Model]:
+        """
+        Insert objects in batches and stamp their audit fields.
+
+        `created_at` and `updated_at` are set by the fields on insert, `user`
+        fills `created_by` and `updated_by` of the objects that have none yet.
+
+        Args:
+            objs (t.Iterable[models.Model]): The objects to insert.
+            batch_size (int | None): Rows per `INSERT`, `None` uses
+                `bulk_batch_size`.
+            ignore_conflicts (bool): Passed to `QuerySet.bulk_create`.
+            update_conflicts (bool): Passed to `QuerySet.bulk_create`.
+            update_fields (t.Sequence[str] | None): Fields to update on
+                conflicts, `updated_at` and `updated_by` are added.
+            unique_fields (t.Sequence[str] | None): Passed to
+                `QuerySet.bulk_create`.
+            user (models.Model | None): The user who creates the objects.
+
+        Returns:
+            list[models.Model]: The inserted objects.
+        """
+        objs = list(objs)
+        audit_fields = [
+            name
+            for name in ("created_by", "updated_by")
+            if _has_field(self.model, name)
+        ]
+        if user is not None and audit_fields:
+            for obj in objs:
+                for name in audit_fields:
+                    if getattr(obj, f"{name}_id") is None:
+                        setattr(obj, name, user)
+
+        if update_conflicts and update_fields:
+            extra_fields = [field.name for field in _auto_now_fields(self.model)]
+            if user is not None and "updated_by" in audit_fields:
+                extra_fields.append("updated_by")
+            update_fields = list(dict.fromkeys([*update_fields, *extra_fields]))
+
+        objs = super().bulk_create(
+            objs,
+            batch_size=batch_size or self.bulk_batch_size,
+            ignore_conflicts=ignore_conflicts,
+            update_conflicts=update_conflicts,
+            update_fields=update_fields,
+            unique_fields=unique_fields,
+        )
+        cache.bump_generation(self.model, self.db)
+        return objs
+
+    def bulk_update(
+        self,
+        objs: t.Iterable[models.Model],
+        fields: t.Sequence[str],
+        batch_size: int | None = None,
+        *,
+        user: models.Model | None = None,
+    ) -> int:
+        """
+        Update objects in batches and stamp their audit fields.
 
-class SoftDeletableQuerySet(models.QuerySet[models.Model]):
-    def delete(self) -> None:
-        self.update(deleted_at=timezone.now())
+        Unlike `save()`, `QuerySet.bulk_update` does not refresh `auto_now`
+        fields, so `updated_at` is set to the same time for every object and
+        added to `fields`, as is `updated_by` when `user` is given.
 
-    def undelete(self) -> None:
-        self.update(deleted_at=None)
+        Args:
+            objs (t.Iterable[models.Model]): The objects to update.
+            fields (t.Sequence[str]): The fields to update.
+            batch_size (int | None): Rows per `UPDATE`, `None` uses
+                `bulk_batch_size`.
+            user (models.Model | None): The user who updates the objects.
+
+        Returns:
+            int: The number of updated rows.
+        """
+        objs = list(objs)
+        fields = list(fields)
+        now = timezone.now()
+        auto_now_fields = _auto_now_fields(self.model)
+        stamp_user = user is not None and _has_field(self.model, "updated_by")
+
+        for obj in objs:
+            for field in auto_now_fields:
+                setattr(obj, field.attname, now)
+            if stamp_user:
+                obj.updated_by = user  # pyright: ignore[reportAttributeAccessIssue]
+
+        fields.extend(field.name for field in auto_now_fields)
+        if stamp_user:
+            fields.append("updated_by")
+
+        count = super().bulk_update(
+            objs,
+            list(dict.fromkeys(fields)),
+            batch_size=batch_size or self.bulk_batch_size,
+        )
+        cache.bump_generation(self.model, self.db)
+        return count
+
+    # Unlike `save()` and `delete()` of instances, these send no model signals.
+    def update(self, **kwargs: t.Any) -> int:
+        count = super().update(**kwargs)
+        cache.bump_generation(self.model, self.db)
+        return count
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        deleted = super().delete()
+        cache.bump_generation(self.model, self.db)
+        return deleted
+
+
+class BaseManager(models.Manager[models.Model]):
+    _queryset_class = BaseQuerySet
+
+
+def _audit_values(
+    model: type[models.Model],
+    updated_by: models.Model | None = None,
+    now: datetime.datetime | None = None,
+) -> dict[str, t.Any]:
+    # `QuerySet.update` does not refresh `auto_now` fields such as `updated_at`.
+    now = now or timezone.now()
+    values: dict[str, t.Any] = {field.name: now for field in _auto_now_fields(model)}
+    if updated_by is not None:
+        values["updated_by"] = updated_by
+    return values
+
+
+def _soft_delete_values(
+    model: type[models.Model],
+    updated_by: models.Model | None = None,
+) -> dict[str, t.Any]:
+    now = timezone.now()
+    return {**_audit_values(model, updated_by, now), "deleted_at": now}
+
+
+def _undelete_values(
+    model: type[models.Model],
+    updated_by: models.Model | None = None,
+) -> dict[str, t.Any]:
+    return {**_audit_values(model, updated_by), "deleted_at": None}
+
+
+class SoftDeletableQuerySet(BaseQuerySet):
+    def delete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> tuple[int, dict[str, int]]:
+        count = update_in_batches(
+            self,
+            batch_size or self.bulk_batch_size,
+            **_soft_delete_values(self.model, updated_by),
+        )
+        return count, {self.model._meta.label: count}  # noqa: SLF001
+
+    def undelete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> int:
+        return update_in_batches(
+            self,
+            batch_size or self.bulk_batch_size,
+            **_undelete_values(self.model, updated_by),
+        )
+
+    async def adelete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> tuple[int, dict[str, int]]:
+        return await sync.sync_to_async(self.delete)(batch_size, updated_by)
+
+    async def aundelete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> int:
+        return await sync.sync_to_async(self.undelete)(batch_size, updated_by)
 
 
 class SoftDeletableManager(models.Manager[models.Model]):
@@ -17,9 +276,45 @@ class SoftDeletableManager(models.Manager[models.Model]):
         return super().get_queryset().filter(deleted_at__isnull=True)
 
 
-class GlobalQuerySet(models.QuerySet[models.Model]):
-    def undelete(self) -> None:
-        self.update(deleted_at=None)
+class GlobalQuerySet(BaseQuerySet):
+    def soft_delete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> tuple[int, dict[str, int]]:
+        queryset = self.filter(deleted_at__isnull=True)
+        count = update_in_batches(
+            queryset,
+            batch_size or self.bulk_batch_size,
+            **_soft_delete_values(self.model, updated_by),
+        )
+        return count, {self.model._meta.label: count}  # noqa: SLF001
+
+    def undelete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> int:
+        queryset = self.filter(deleted_at__isnull=False)
+        return update_in_batches(
+            queryset,
+            batch_size or self.bulk_batch_size,
+            **_undelete_values(self.model, updated_by),
+        )
+
+    async def asoft_delete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> tuple[int, dict[str, int]]:
+        return await sync.sync_to_async(self.soft_delete)(batch_size, updated_by)
+
+    async def aundelete(
+        self,
+        batch_size: int | None = None,
+        updated_by: models.Model | None = None,
+    ) -> int:
+        return await sync.sync_to_async(self.undelete)(batch_size, updated_by)
 
 
 class GlobalManager(models.Manager):
@@ -0,0 +1,81 @@
+import http as http_status
+import time
+import typing as t
+
+from asgiref import sync
+from django import http
+from django.conf import settings
+
+from server.utils.django import routers
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PRIMARY_PIN_COOKIE = "primary_pin"
+PRIMARY_PIN_HEADER = "X-Primary-Pin"
+
+
+class PrimaryPinMiddleware:
+    """
+    Keep a client on the primary database for a while after it writes.
+
+    A successful write sets the `primary_pin` cookie and the `X-Primary-Pin`
+    header to the timestamp the pin ends, `DATABASE_REPLICA_PIN_SECONDS` later.
+    A request that sends either of them back before then reads from the
+    primary, so the client sees its own writes through the replica lag.
+
+    The middleware is async-capable, so the ASGI handler awaits it without a
+    switch to a thread.
+    """
+
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response: t.Callable[[http.HttpRequest], t.Any]) -> None:
+        self.get_response = get_response
+        if sync.iscoroutinefunction(self.get_response):
+            sync.markcoroutinefunction(self)
+
+    def __call__(self, request: http.HttpRequest) -> t.Any:
+        if sync.iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with routers.pin_primary(pinned=self.is_pinned(request)):
+            response = self.get_response(request)
+        return self.set_pin(request, response)
+
+    async def __acall__(self, request: http.HttpRequest) -> t.Any:
+        with routers.pin_primary(pinned=self.is_pinned(request)):
+            response = await self.get_response(request)
+        return self.set_pin(request, response)
+
+    def set_pin(
+        self,
+        request: http.HttpRequest,
+        response: http.HttpResponse,
+    ) -> http.HttpResponse:
+        if (
+            request.method not in SAFE_METHODS
+            and response.status_code < http_status.HTTPStatus.BAD_REQUEST
+        ):
+            pin_seconds: int = settings.DATABASE_REPLICA_PIN_SECONDS
+            until = str(int(time.time()) + pin_seconds)
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                until,
+                max_age=pin_seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+            response[PRIMARY_PIN_HEADER] = until
+        return response
+
+    def is_pinned(self, request: http.HttpRequest) -> bool:
+        for value in (
+            request.COOKIES.get(PRIMARY_PIN_COOKIE),
+            request.headers.get(PRIMARY_PIN_HEADER),
+        ):
+            try:
+                if value is not None and int(value) > time.time():
+                    return True
+            except ValueError:
+                continue
+        return False
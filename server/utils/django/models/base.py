@@ -1,8 +1,11 @@
+import hashlib
 import typing as t
-import uuid
 
+from asgiref import sync
+from django import dispatch
 from django.conf import settings
 from django.db import models
+from django.db.models import signals
 from django.utils import timezone
 
 from server.utils.django import fields as util_fields
@@ -10,7 +13,11 @@ from server.utils.django import managers
 
 
 class UUIDPrimaryKeyMixin(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(
+        primary_key=True,
+        default=util_fields.default_uuid,
+        editable=False,
+    )
 
     class Meta:
         abstract = True
@@ -67,6 +74,8 @@ class UserActionLogMixin(CreatedActionLogMixin, UpdatedActionLogMixin):
 
 
 class BaseModel(UUIDPrimaryKeyMixin, TimestampMixin, UserActionLogMixin):
+    objects = managers.BaseManager()
+
     class Meta:
         abstract = True
         ordering = ("-created_at",)
@@ -83,8 +92,14 @@ class SoftDeletableModel(models.Model):
     all_objects = managers.GlobalManager()
     objects = managers.SoftDeletableManager()
 
+    # Hot lookup fields of live rows. Every entry, a field name or a tuple of
+    # field names, gets a partial index with `WHERE deleted_at IS NULL` so that
+    # queries through `objects` can use it, e.g. `("email", ("team", "name"))`.
+    soft_deletable_index_fields: t.ClassVar[t.Sequence[str | t.Sequence[str]]] = ()
+
     class Meta:
         abstract = True
+        default_manager_name = "all_objects"
 
     def delete(
         self,
@@ -97,9 +112,93 @@ class SoftDeletableModel(models.Model):
             return super().delete(*args, using=using, **kwargs)
 
         self.deleted_at = timezone.now()
-        self.save(using=using)
-        return 0, {}
+        self.save(using=using, update_fields=self.get_soft_delete_update_fields())
+        return 1, {self._meta.label: 1}
 
     def undelete(self, using: str | None = None, *args: t.Any, **kwargs: t.Any) -> None:
         self.deleted_at = None
-        self.save(using=using)
+        self.save(using=using, update_fields=self.get_soft_delete_update_fields())
+
+    async def adelete(
+        self,
+        using: str | None = None,
+        soft: bool = True,  # noqa: FBT001, FBT002
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> tuple[int, dict[str, int]]:
+        return await sync.sync_to_async(self.delete)(using, soft, *args, **kwargs)
+
+    async def aundelete(
+        self,
+        using: str | None = None,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> None:
+        await sync.sync_to_async(self.undelete)(using, *args, **kwargs)
+
+    def get_soft_delete_update_fields(self) -> list[str]:
+        # Only write `deleted_at`, plus `auto_now` fields such as `updated_at`
+        # that a full `save()` would have refreshed as well.
+        return [
+            "deleted_at",
+            *(
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            ),
+        ]
+
+
+def soft_deletable_index(
+    model: type[SoftDeletableModel],
+    fields: t.Sequence[str],
+) -> models.Index:
+    """Build the partial index on `fields` covering only live rows."""
+    table_name = model._meta.db_table  # noqa: SLF001
+    columns = {field.name: field.column for field in model._meta.local_fields}  # noqa: SLF001
+    column_names = [columns.get(name.lstrip("-"), name) for name in fields]
+    # Same digest as `Index.set_name_with_model`, salted with the condition.
+    digest = hashlib.md5(usedforsecurity=False)
+    for name in (table_name, *column_names, "deleted_at__isnull"):
+        digest.update(name.encode())
+    return models.Index(
+        fields=list(fields),
+        condition=models.Q(deleted_at__isnull=True),
+        name=f"{table_name[:10]}_{column_names[0][:7]}_{digest.hexdigest()[:6]}_live",
+    )
+
+
+@dispatch.receiver(signals.class_prepared)
+def add_soft_deletable_indexes(sender: type[models.Model], **kwargs: t.Any) -> None:
+    if not issubclass(sender, SoftDeletableModel):
+        return
+
+    opts = sender._meta  # noqa: SLF001
+    # The condition needs `deleted_at` in the same table, which is not the case
+    # for proxy models or multi-table inheritance children.
+    if opts.proxy or "deleted_at" not in {field.name for field in opts.local_fields}:
+        return
+
+    for fields in sender.soft_deletable_index_fields:
+        index = soft_deletable_index(
+            sender,
+            [fields] if isinstance(fields, str) else fields,
+        )
+        if index.name not in {existing.name for existing in opts.indexes}:
+            opts.indexes.append(index)
+
+
+@dispatch.receiver(signals.class_prepared)
+def add_soft_deletable_manager(sender: type[models.Model], **kwargs: t.Any) -> None:
+    if not issubclass(sender, SoftDeletableModel) or sender._meta.abstract:  # noqa: SLF001
+        return
+
+    opts = sender._meta  # noqa: SLF001
+    # A base class earlier in the MRO, such as `BaseModel` in
+    # `class Item(BaseModel, SoftDeletableModel)`, shadows both the manager that
+    # filters the deleted rows and the `Meta` that names the default manager.
+    if not opts.default_manager_name:
+        opts.default_manager_name = "all_objects"
+
+    if not isinstance(opts.managers_map.get("objects"), managers.SoftDeletableManager):
+        sender.add_to_class("objects", managers.SoftDeletableManager())
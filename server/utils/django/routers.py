@@ -0,0 +1,101 @@
+import contextlib
+import contextvars
+import random
+import typing as t
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models
+
+# The replica alias the reads of the current request go to, `None` for the
+# primary.
+_read_alias: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "read_alias",
+    default=None,
+)
+# Whether the client wrote recently, so its reads stay on the primary.
+_pinned: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pinned",
+    default=False,
+)
+
+
+def get_replica_alias() -> str | None:
+    """
+    Get a replica alias for a read, `None` when reads must go to the primary.
+
+    Returns:
+        str | None: A random alias of `DATABASE_REPLICAS`, `None` when there is
+            none or the client is pinned to the primary.
+    """
+    replicas: list[str] = settings.DATABASE_REPLICAS
+    if not replicas or _pinned.get():
+        return None
+    return random.choice(replicas)  # noqa: S311
+
+
+@contextlib.contextmanager
+def read_replica() -> t.Iterator[str | None]:
+    """
+    Send the reads inside the block to one replica.
+
+    Yields:
+        str | None: The replica alias, `None` for the primary.
+    """
+    alias = get_replica_alias()
+    token = _read_alias.set(alias)
+    try:
+        yield alias
+    finally:
+        _read_alias.reset(token)
+
+
+@contextlib.contextmanager
+def pin_primary(*, pinned: bool = True) -> t.Iterator[None]:
+    """Keep the reads inside the block on the primary."""
+    token = _pinned.set(pinned)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Route the reads inside `read_replica()` to a replica, all else to the primary.
+
+    The replicas are the aliases of `DATABASE_REPLICAS`, mirrors of `default`
+    that are never written to or migrated.
+
+    Only the list and retrieve actions of the viewsets enter `read_replica()`.
+    Other reads, through the managers included, stay on the primary unless the
+    caller wraps them in `read_replica()` or picks `.using(get_replica_alias())`.
+    """
+
+    def db_for_read(self, model: type[models.Model], **hints: t.Any) -> str | None:
+        if _pinned.get():
+            return None
+        return _read_alias.get()
+
+    def db_for_write(self, model: type[models.Model], **hints: t.Any) -> str | None:
+        # Not the database of an instance read from a replica.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(
+        self,
+        obj1: models.Model,
+        obj2: models.Model,
+        **hints: t.Any,
+    ) -> bool | None:
+        # The replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(
+        self,
+        db: str,
+        app_label: str,
+        model_name: str | None = None,
+        **hints: t.Any,
+    ) -> bool | None:
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,38 @@
+import time
+
+import pytest
+from django.db import connection
+
+from server.utils.django.tests import models as test_models
+
+ROWS = 20_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestSoftDeletableIndexes:
+    @pytest.fixture(autouse=True)
+    def _rows(self) -> None:
+        test_models.MockSoftDeletableModel.all_objects.bulk_create(
+            test_models.MockSoftDeletableModel(name=f"name-{i % 1000}")
+            for i in range(ROWS)
+        )
+        test_models.MockSoftDeletableModel.all_objects.filter(
+            name__gte="name-1"
+        ).soft_delete()  # pyright: ignore[reportAttributeAccessIssue]
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_planner_picks_partial_index(self) -> None:
+        (index,) = test_models.MockSoftDeletableModel._meta.indexes  # noqa: SLF001
+        queryset = test_models.MockSoftDeletableModel.objects.filter(name="name-0")
+
+        plan = queryset.explain()
+        print(f"\n{plan}")  # noqa: T201
+        assert index.name in plan
+
+        start = time.perf_counter()
+        for _ in range(100):
+            list(queryset.all())
+        elapsed = time.perf_counter() - start
+        print(f"live lookup: {elapsed * 10:.3f} ms/query")  # noqa: T201
@@ -0,0 +1,31 @@
+import time
+from unittest import mock
+
+import pytest
+from django.db.models import options
+
+from server.utils.django.tests import models as test_models
+
+ROWS = 50_000
+BATCH_SIZE = 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestTimestampFields:
+    def test_bulk_create(self) -> None:
+        with mock.patch.object(
+            options.Options,
+            "get_fields",
+            autospec=True,
+            side_effect=options.Options.get_fields,
+        ) as get_fields:
+            start = time.perf_counter()
+            test_models.MockModel.objects.bulk_create(
+                (test_models.MockModel() for _ in range(ROWS)),
+                batch_size=BATCH_SIZE,
+            )
+            elapsed = time.perf_counter() - start
+
+        print(f"\nMockModel bulk_create: {ROWS / elapsed:,.0f} rows/s")  # noqa: T201
+        get_fields.assert_not_called()
@@ -0,0 +1,27 @@
+import time
+import typing as t
+
+import pytest
+
+from server.utils.django.tests import models as test_models
+
+ROWS = 100_000
+BATCH_SIZE = 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestUUIDInserts:
+    @pytest.mark.parametrize("version", [4, 7])
+    def test_insert_throughput(self, version: int, settings: t.Any) -> None:
+        settings.UUID_VERSION = version
+
+        start = time.perf_counter()
+        for _ in range(ROWS // BATCH_SIZE):
+            test_models.MockModel.objects.bulk_create(
+                test_models.MockModel() for _ in range(BATCH_SIZE)
+            )
+        elapsed = time.perf_counter() - start
+
+        print(f"\nUUIDv{version}: {ROWS / elapsed:,.0f} rows/s")  # noqa: T201
+        assert test_models.MockModel.objects.count() == ROWS
@@ -11,9 +11,34 @@ class MockModel(base_models.BaseModel):
 class MockSoftDeletableModel(base_models.SoftDeletableModel):
     name = models.CharField(max_length=100)
 
+    soft_deletable_index_fields = ("name",)
+
 
 class ModelWithoutCreatedAt(models.Model):
     updated_at = util_fields.UpdatedAtField()
 
     def __str__(self) -> str:
         return f"{self.updated_at}"
+
+
+class MockSoftDeletableBaseModel(base_models.SoftDeletableModel, base_models.BaseModel):
+    name = models.CharField(max_length=100)
+
+
+class MockBaseSoftDeletableModel(base_models.BaseModel, base_models.SoftDeletableModel):
+    name = models.CharField(max_length=100)
+
+
+class MockParentModel(base_models.BaseModel):
+    name = models.CharField(max_length=100)
+
+
+class MockChildModel(base_models.BaseModel):
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    parent = models.ForeignKey(
+        MockParentModel,
+        on_delete=models.CASCADE,
+        related_name="children",
+    )
+    tags = models.ManyToManyField(MockModel, related_name="+")
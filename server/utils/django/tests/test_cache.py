@@ -0,0 +1,160 @@
+import typing as t
+from unittest import mock
+
+import pytest
+from django.core.cache import cache, caches
+from django.db.models import deletion
+from model_bakery import baker
+
+from server.app.authentication import models as auth_models
+from server.utils.django import cache as util_cache
+from server.utils.django import managers as util_managers
+from server.utils.django.tests import models as test_models
+
+
+@pytest.fixture(autouse=True)
+def _track_models() -> t.Iterator[None]:
+    with mock.patch.object(util_cache, "_tracked_aliases", {}):
+        util_cache.track_models(
+            [
+                test_models.MockModel,
+                test_models.MockSoftDeletableModel,
+                test_models.MockChildModel,
+            ],
+        )
+        yield
+
+
+def get_generation(model: type[t.Any]) -> int:
+    return util_cache.get_generations([model])[util_cache.get_generation_key(model)]
+
+
+@pytest.mark.django_db
+class TestGenerations:
+    def test_start_missing_generation(self) -> None:
+        cache.delete(util_cache.get_generation_key(test_models.MockModel))
+
+        generation = get_generation(test_models.MockModel)
+
+        assert generation == get_generation(test_models.MockModel)
+
+    def test_restart_above_evicted_generation(self) -> None:
+        generation = get_generation(test_models.MockModel)
+        cache.delete(util_cache.get_generation_key(test_models.MockModel))
+
+        util_cache.bump_generation(test_models.MockModel)
+
+        assert get_generation(test_models.MockModel) > generation
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda: baker.make(test_models.MockModel),
+            lambda: baker.make(test_models.MockModel).delete(),
+            lambda: test_models.MockModel.objects.update(name="updated"),
+            lambda: test_models.MockModel.objects.all().delete(),
+            lambda: test_models.MockModel.objects.bulk_create(
+                [test_models.MockModel()],
+            ),
+            lambda: test_models.MockModel.objects.bulk_update(
+                list(test_models.MockModel.objects.all()),
+                ["name"],
+            ),
+        ],
+    )
+    def test_bump_on_change(self, change: t.Callable[[], t.Any]) -> None:
+        baker.make(test_models.MockModel)
+        generation = get_generation(test_models.MockModel)
+
+        change()
+
+        assert get_generation(test_models.MockModel) > generation
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda: test_models.MockSoftDeletableModel.objects.get().delete(),
+            lambda: test_models.MockSoftDeletableModel.objects.get().undelete(),
+            lambda: test_models.MockSoftDeletableModel.objects.all().delete(),
+            lambda: test_models.MockSoftDeletableModel.objects.all().delete(
+                batch_size=1,  # pyright: ignore[reportCallIssue]
+            ),
+            lambda: test_models.MockSoftDeletableModel.all_objects.all().undelete(),  # pyright: ignore[reportAttributeAccessIssue]
+        ],
+    )
+    def test_bump_on_soft_delete(self, change: t.Callable[[], t.Any]) -> None:
+        baker.make(test_models.MockSoftDeletableModel)
+        generation = get_generation(test_models.MockSoftDeletableModel)
+
+        change()
+
+        assert get_generation(test_models.MockSoftDeletableModel) > generation
+
+    def test_bump_on_m2m_change(self) -> None:
+        child = baker.make(test_models.MockChildModel)
+        tag = baker.make(test_models.MockModel)
+        generation = get_generation(test_models.MockChildModel)
+
+        child.tags.add(tag)
+
+        assert get_generation(test_models.MockChildModel) > generation
+
+    def test_bump_on_commit(
+        self,
+        django_capture_on_commit_callbacks: t.Any,
+    ) -> None:
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            util_cache.bump_generation(test_models.MockModel)
+        generation = get_generation(test_models.MockModel)
+
+        for callback in callbacks:
+            callback()
+
+        assert get_generation(test_models.MockModel) == generation + 1
+
+    def test_skip_untracked_model(self) -> None:
+        with mock.patch.object(util_cache, "_incr_generation") as incr_generation:
+            baker.make(auth_models.User)
+
+        incr_generation.assert_not_called()
+
+    def test_keep_fast_delete_of_untracked_model(self) -> None:
+        collector = deletion.Collector("default")
+
+        assert collector.can_fast_delete(
+            test_models.ModelWithoutCreatedAt.objects.all()
+        )
+        assert not collector.can_fast_delete(test_models.MockModel.objects.all())
+
+    @mock.patch.object(util_cache, "_tracked_aliases", {})
+    def test_bump_in_tracked_alias(self, settings: t.Any) -> None:
+        settings.CACHES = {
+            **settings.CACHES,
+            "other": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "other",
+            },
+        }
+        util_cache.track_models([test_models.MockParentModel], "other")
+        key = util_cache.get_generation_key(test_models.MockParentModel)
+        cache.delete(key)
+        generation = util_cache.get_generations(
+            [test_models.MockParentModel],
+            "other",
+        )[key]
+
+        baker.make(test_models.MockParentModel)
+
+        assert caches["other"].get(key) > generation
+        assert cache.get(key) is None
+
+    def test_update_in_batches_bumps_once(self) -> None:
+        baker.make(test_models.MockModel)
+
+        with mock.patch.object(util_cache, "_incr_generation") as incr_generation:
+            util_managers.update_in_batches(
+                test_models.MockModel.objects.all(),
+                name="updated",
+            )
+
+        incr_generation.assert_called_once()
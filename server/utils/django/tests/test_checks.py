@@ -0,0 +1,24 @@
+import typing as t
+
+import pytest
+from django.core import checks
+
+from server.utils.django import checks as util_checks
+
+
+class TestCheckUUIDVersion:
+    @pytest.mark.parametrize("version", [4, 7])
+    def test_supported_version(self, version: int, settings: t.Any) -> None:
+        settings.UUID_VERSION = version
+
+        assert util_checks.check_uuid_version() == []
+
+    def test_unsupported_version(self, settings: t.Any) -> None:
+        settings.UUID_VERSION = 5
+
+        errors = util_checks.check_uuid_version()
+
+        assert [error.id for error in errors] == ["common.E001"]
+
+    def test_registered(self) -> None:
+        assert util_checks.check_uuid_version in checks.registry.registry.get_checks()
@@ -1,8 +1,12 @@
 import datetime
+import typing as t
 import uuid
+from unittest import mock
 
 import pytest
 import time_machine
+from django.core import exceptions
+from django.db.models import options
 from django.utils import timezone
 from model_bakery import baker
 
@@ -10,6 +14,55 @@ from server.utils.django import fields as util_fields
 from server.utils.django.tests import models as test_models
 
 
+class TestUUID7:
+    def test_version_and_variant(self) -> None:
+        value = util_fields.uuid7()
+
+        assert value.version == 7  # noqa: PLR2004
+        assert value.variant == uuid.RFC_4122
+
+    @time_machine.travel("2024-01-01 12:00:00", tick=False)
+    def test_timestamp(self) -> None:
+        value = util_fields.uuid7()
+
+        assert value.int >> 80 == int(
+            timezone.datetime(2024, 1, 1, 12, tzinfo=datetime.UTC).timestamp() * 1000
+        )
+
+    def test_time_ordered(self) -> None:
+        with time_machine.travel("2024-01-01 12:00:00"):
+            earlier = util_fields.uuid7()
+        with time_machine.travel("2024-01-01 12:00:01"):
+            later = util_fields.uuid7()
+
+        assert earlier < later
+
+    def test_unique(self) -> None:
+        assert len({util_fields.uuid7() for _ in range(1000)}) == 1000  # noqa: PLR2004
+
+
+class TestDefaultUUID:
+    @pytest.mark.parametrize("version", [4, 7])
+    def test_version_from_settings(self, version: int, settings: t.Any) -> None:
+        settings.UUID_VERSION = version
+
+        assert util_fields.default_uuid().version == version
+
+    def test_unsupported_version(self, settings: t.Any) -> None:
+        settings.UUID_VERSION = 5
+
+        with pytest.raises(exceptions.ImproperlyConfigured, match="UUID_VERSION"):
+            util_fields.default_uuid()
+
+    @pytest.mark.django_db
+    def test_primary_key(self, settings: t.Any) -> None:
+        settings.UUID_VERSION = 7
+
+        model = baker.make(test_models.MockModel)
+
+        assert model.id.version == 7  # noqa: PLR2004
+
+
 class TestUUIDAutoField:
     def test_default_configuration(self) -> None:
         field = util_fields.UUIDAutoField()
@@ -80,6 +133,34 @@ class TestUpdatedAtField:
 
         assert model.updated_at == model.created_at
 
+    def test_created_at_field_resolved_on_class_prepared(self) -> None:
+        opts = test_models.MockModel._meta  # noqa: SLF001
+        field = opts.get_field("updated_at")
+
+        assert isinstance(field, util_fields.UpdatedAtField)
+        assert field.created_at_field is opts.get_field("created_at")
+
+    def test_created_at_field_missing(self) -> None:
+        field = test_models.ModelWithoutCreatedAt._meta.get_field("updated_at")  # noqa: SLF001
+
+        assert isinstance(field, util_fields.UpdatedAtField)
+        assert field.created_at_field is None
+
+    @pytest.mark.django_db
+    def test_bulk_create_does_not_scan_fields(self) -> None:
+        with mock.patch.object(
+            options.Options,
+            "get_fields",
+            autospec=True,
+            side_effect=options.Options.get_fields,
+        ) as get_fields:
+            models = test_models.MockModel.objects.bulk_create(
+                test_models.MockModel() for _ in range(10)
+            )
+
+        get_fields.assert_not_called()
+        assert all(model.updated_at == model.created_at for model in models)
+
     @pytest.mark.django_db
     def test_pre_save_without_created_at(self) -> None:
         model = test_models.ModelWithoutCreatedAt()
@@ -1,7 +1,15 @@
+import datetime
+import typing as t
+
 import pytest
+import time_machine
+from asgiref import sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from model_bakery import baker
 
+from server.app.authentication import models as auth_models
 from server.utils.django import managers as util_managers
 from server.utils.django.tests import models as test_models
 
@@ -54,6 +62,149 @@ class TestSoftDeletableQuerySet:
 
         assert all(obj.deleted_at is None for obj in all_qs)
 
+    @pytest.mark.usefixtures("test_objects")
+    def test_delete_returns_counts(self) -> None:
+        result = test_models.MockSoftDeletableModel.objects.all().delete()
+
+        assert result == (2, {"tests.MockSoftDeletableModel": 2})
+
+    @pytest.mark.usefixtures("test_objects")
+    def test_undelete_returns_count(self) -> None:
+        queryset = test_models.MockSoftDeletableModel.all_objects.filter(name="deleted")
+
+        assert queryset.undelete() == 1  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_delete_in_batches(self) -> None:
+        baker.make(test_models.MockSoftDeletableModel, _quantity=5)
+
+        with CaptureQueriesContext(connection) as queries:
+            queryset = test_models.MockSoftDeletableModel.objects.all()
+            count, _ = queryset.delete(batch_size=2)  # pyright: ignore[reportCallIssue]
+
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        assert count == 5  # noqa: PLR2004
+        assert len(updates) == 3  # noqa: PLR2004
+        assert not test_models.MockSoftDeletableModel.objects.exists()
+
+    def test_undelete_in_batches(self) -> None:
+        baker.make(
+            test_models.MockSoftDeletableModel,
+            deleted_at=timezone.now(),
+            _quantity=4,
+        )
+        queryset = test_models.MockSoftDeletableModel.all_objects.all()
+
+        count = queryset.undelete(batch_size=2)  # pyright: ignore[reportAttributeAccessIssue]
+
+        assert count == 4  # noqa: PLR2004
+        assert test_models.MockSoftDeletableModel.objects.count() == 4  # noqa: PLR2004
+
+    def test_delete_with_updated_by(self) -> None:
+        user = baker.make(auth_models.User)
+        obj = baker.make(test_models.MockSoftDeletableBaseModel)
+
+        queryset = test_models.MockSoftDeletableBaseModel.objects.all()
+        queryset.delete(updated_by=user)  # pyright: ignore[reportCallIssue]
+
+        obj.refresh_from_db()
+        assert obj.deleted_at is not None
+        assert obj.updated_by == user
+
+    def test_delete_and_undelete_set_updated_at(self) -> None:
+        with time_machine.travel("2024-01-01 12:00:00", tick=False):
+            obj = baker.make(test_models.MockSoftDeletableBaseModel)
+
+        with time_machine.travel("2024-01-02 12:00:00", tick=False):
+            test_models.MockSoftDeletableBaseModel.objects.all().delete()
+        obj.refresh_from_db()
+        assert obj.updated_at == timezone.datetime(2024, 1, 2, 12, tzinfo=datetime.UTC)
+
+        with time_machine.travel("2024-01-03 12:00:00", tick=False):
+            test_models.MockSoftDeletableBaseModel.all_objects.all().undelete()  # pyright: ignore[reportAttributeAccessIssue]
+        obj.refresh_from_db()
+        assert obj.updated_at == timezone.datetime(2024, 1, 3, 12, tzinfo=datetime.UTC)
+        assert obj.created_at == timezone.datetime(2024, 1, 1, 12, tzinfo=datetime.UTC)
+
+    def test_delete_stamps_one_time(self) -> None:
+        obj = baker.make(test_models.MockSoftDeletableBaseModel)
+
+        test_models.MockSoftDeletableBaseModel.objects.all().delete()
+
+        obj.refresh_from_db()
+        assert obj.deleted_at == obj.updated_at
+
+    def test_delete_default_batch_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(util_managers.BaseQuerySet, "bulk_batch_size", 2)
+        baker.make(test_models.MockSoftDeletableModel, _quantity=5)
+
+        with CaptureQueriesContext(connection) as queries:
+            count, _ = test_models.MockSoftDeletableModel.objects.all().delete()
+
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        assert count == 5  # noqa: PLR2004
+        assert len(updates) == 3  # noqa: PLR2004
+
+    @pytest.mark.usefixtures("test_objects")
+    def test_adelete_and_aundelete(self) -> None:
+        queryset = test_models.MockSoftDeletableModel.objects.all()
+
+        result = sync.async_to_sync(queryset.adelete)(batch_size=1)  # pyright: ignore[reportCallIssue]
+
+        assert result == (2, {"tests.MockSoftDeletableModel": 2})
+        assert not test_models.MockSoftDeletableModel.objects.exists()
+
+        queryset = test_models.MockSoftDeletableModel.all_objects.all()
+        count = sync.async_to_sync(queryset.aundelete)()  # pyright: ignore[reportAttributeAccessIssue]
+
+        assert count == 3  # noqa: PLR2004
+        assert test_models.MockSoftDeletableModel.objects.count() == 3  # noqa: PLR2004
+
+
+class TestUpdateInBatches:
+    @pytest.mark.django_db
+    def test_without_batch_size_runs_single_update(self) -> None:
+        baker.make(test_models.MockSoftDeletableModel, _quantity=3)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = util_managers.update_in_batches(
+                test_models.MockSoftDeletableModel.objects.all(),
+                name="updated",
+            )
+
+        assert count == 3  # noqa: PLR2004
+        assert len(queries) == 1
+
+    @pytest.mark.django_db
+    def test_batches_keep_the_filter(self) -> None:
+        baker.make(test_models.MockSoftDeletableModel, name="old", _quantity=3)
+
+        with CaptureQueriesContext(connection) as queries:
+            util_managers.update_in_batches(
+                test_models.MockSoftDeletableModel.objects.filter(name="old"),
+                batch_size=2,
+                name="new",
+            )
+
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 2  # noqa: PLR2004
+        assert all("\"name\" = 'old'" in sql for sql in updates)
+        assert all('"deleted_at" IS NULL' in sql for sql in updates)
+
+    @pytest.mark.django_db
+    def test_batches_cover_all_rows(self) -> None:
+        baker.make(test_models.MockSoftDeletableModel, name="old", _quantity=7)
+
+        count = util_managers.update_in_batches(
+            test_models.MockSoftDeletableModel.objects.filter(name="old"),
+            batch_size=3,
+            name="new",
+        )
+
+        assert count == 7  # noqa: PLR2004
+        assert set(
+            test_models.MockSoftDeletableModel.objects.values_list("name", flat=True)
+        ) == {"new"}
+
 
 class TestSoftDeletableManager:
     @pytest.mark.django_db
@@ -80,6 +231,36 @@ class TestSoftDeletableManager:
             util_managers.SoftDeletableQuerySet,
         )
 
+    @pytest.mark.parametrize(
+        "model",
+        [
+            test_models.MockSoftDeletableBaseModel,
+            test_models.MockBaseSoftDeletableModel,
+        ],
+    )
+    @pytest.mark.django_db
+    def test_excludes_deleted_whatever_the_base_order(
+        self,
+        model: type[t.Any],
+    ) -> None:
+        baker.make(model, name="active")
+        baker.make(model, name="deleted", deleted_at=timezone.now())
+
+        assert isinstance(model.objects, util_managers.SoftDeletableManager)
+        assert list(model.objects.values_list("name", flat=True)) == ["active"]
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            test_models.MockSoftDeletableModel,
+            test_models.MockSoftDeletableBaseModel,
+            test_models.MockBaseSoftDeletableModel,
+        ],
+    )
+    def test_default_manager_whatever_the_base_order(self, model: type[t.Any]) -> None:
+        assert model._default_manager is model.all_objects  # noqa: SLF001
+        assert isinstance(model._default_manager, util_managers.GlobalManager)  # noqa: SLF001
+
 
 @pytest.mark.django_db
 class TestGlobalQuerySet:
@@ -100,6 +281,35 @@ class TestGlobalQuerySet:
 
         assert all(obj.deleted_at is None for obj in all_qs)
 
+    def test_soft_delete(
+        self,
+        test_objects: dict[str, test_models.MockSoftDeletableModel],
+    ) -> None:
+        deleted_at = test_objects["deleted"].deleted_at
+        queryset = test_models.MockSoftDeletableModel.all_objects.all()
+
+        result = queryset.soft_delete(batch_size=1)  # pyright: ignore[reportAttributeAccessIssue]
+
+        assert result == (2, {"tests.MockSoftDeletableModel": 2})
+        assert not test_models.MockSoftDeletableModel.objects.exists()
+        test_objects["deleted"].refresh_from_db()
+        assert test_objects["deleted"].deleted_at == deleted_at
+
+    @pytest.mark.usefixtures("test_objects")
+    def test_undelete_counts_only_deleted_rows(self) -> None:
+        queryset = test_models.MockSoftDeletableModel.all_objects.all()
+
+        assert queryset.undelete() == 1  # pyright: ignore[reportAttributeAccessIssue]
+
+    @pytest.mark.usefixtures("test_objects")
+    def test_asoft_delete_and_aundelete(self) -> None:
+        queryset = test_models.MockSoftDeletableModel.all_objects.all()
+
+        result = sync.async_to_sync(queryset.asoft_delete)()  # pyright: ignore[reportAttributeAccessIssue]
+
+        assert result == (2, {"tests.MockSoftDeletableModel": 2})
+        assert sync.async_to_sync(queryset.aundelete)() == 3  # pyright: ignore[reportAttributeAccessIssue]  # noqa: PLR2004
+
 
 @pytest.mark.django_db
 class TestGlobalManager:
@@ -125,3 +335,84 @@ class TestGlobalManager:
 
         assert len(queryset) == 1
         assert queryset[0].name == "deleted"
+
+
+@pytest.mark.django_db
+class TestBaseQuerySet:
+    def test_manager_queryset_class(self) -> None:
+        assert isinstance(
+            test_models.MockModel.objects.all(),
+            util_managers.BaseQuerySet,
+        )
+
+    def test_bulk_create_stamps_user(self) -> None:
+        user = baker.make(auth_models.User)
+
+        objs = test_models.MockModel.objects.bulk_create(
+            [test_models.MockModel(name="a"), test_models.MockModel(name="b")],
+            user=user,  # pyright: ignore[reportCallIssue]
+        )
+
+        assert len(objs) == 2  # noqa: PLR2004
+        for obj in test_models.MockModel.objects.all():
+            assert obj.created_by == user
+            assert obj.updated_by == user
+            assert obj.created_at is not None
+            assert obj.updated_at == obj.created_at
+
+    def test_bulk_create_keeps_existing_user(self) -> None:
+        user, other = baker.make(auth_models.User, _quantity=2)
+
+        test_models.MockModel.objects.bulk_create(
+            [test_models.MockModel(name="a", created_by=other)],
+            user=user,  # pyright: ignore[reportCallIssue]
+        )
+
+        obj = test_models.MockModel.objects.get()
+        assert obj.created_by == other
+        assert obj.updated_by == user
+
+    def test_bulk_create_in_batches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(util_managers.BaseQuerySet, "bulk_batch_size", 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            test_models.MockModel.objects.bulk_create(
+                test_models.MockModel(name=str(i)) for i in range(5)
+            )
+
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 3  # noqa: PLR2004
+
+    def test_bulk_update_stamps_user_and_updated_at(self) -> None:
+        user = baker.make(auth_models.User)
+        with time_machine.travel("2024-01-01 12:00:00", tick=False):
+            objs = baker.make(test_models.MockModel, name="old", _quantity=3)
+
+        for obj in objs:
+            obj.name = "new"
+        with time_machine.travel("2024-01-02 12:00:00", tick=False):
+            count = test_models.MockModel.objects.bulk_update(
+                objs,
+                ["name"],
+                user=user,  # pyright: ignore[reportCallIssue]
+            )
+
+        assert count == 3  # noqa: PLR2004
+        for obj in test_models.MockModel.objects.all():
+            assert obj.name == "new"
+            assert obj.updated_by == user
+            assert obj.updated_at == timezone.datetime(
+                2024, 1, 2, 12, tzinfo=datetime.UTC
+            )
+            assert obj.created_at == timezone.datetime(
+                2024, 1, 1, 12, tzinfo=datetime.UTC
+            )
+
+    def test_bulk_update_soft_deletable(self) -> None:
+        obj = baker.make(test_models.MockSoftDeletableBaseModel, name="old")
+        obj.name = "new"
+
+        test_models.MockSoftDeletableBaseModel.objects.bulk_update([obj], ["name"])
+
+        obj.refresh_from_db()
+        assert obj.name == "new"
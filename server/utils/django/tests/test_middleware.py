@@ -0,0 +1,99 @@
+import time
+import typing as t
+
+import pytest
+from asgiref import sync
+from django import http
+from django.test import client
+
+from server.utils.django import middleware, routers
+
+
+@pytest.fixture(autouse=True)
+def replicas(settings: t.Any) -> None:
+    settings.DATABASE_REPLICAS = ["replica_0"]
+    settings.DATABASE_REPLICA_PIN_SECONDS = 5
+
+
+@pytest.fixture
+def factory() -> client.RequestFactory:
+    return client.RequestFactory()
+
+
+def get_response(request: http.HttpRequest) -> http.HttpResponse:
+    # Whether the reads of the request may go to a replica.
+    return http.HttpResponse(str(routers.get_replica_alias() is not None))
+
+
+async def aget_response(request: http.HttpRequest) -> http.HttpResponse:
+    return get_response(request)
+
+
+class TestPrimaryPinMiddleware:
+    def test_pin_after_write(self, factory: client.RequestFactory) -> None:
+        response = middleware.PrimaryPinMiddleware(get_response)(factory.post("/"))
+
+        until = int(response[middleware.PRIMARY_PIN_HEADER])
+        assert until > time.time()
+        cookie = response.cookies[middleware.PRIMARY_PIN_COOKIE]
+        assert cookie.value == str(until)
+        assert cookie["max-age"] == 5  # noqa: PLR2004
+
+    def test_no_pin_after_failed_write(self, factory: client.RequestFactory) -> None:
+        response = middleware.PrimaryPinMiddleware(
+            lambda _: http.HttpResponseBadRequest(),
+        )(factory.post("/"))
+
+        assert middleware.PRIMARY_PIN_HEADER not in response
+        assert middleware.PRIMARY_PIN_COOKIE not in response.cookies
+
+    @pytest.mark.parametrize(
+        ("extra", "pinned"),
+        [
+            ({}, False),
+            ({"HTTP_X_PRIMARY_PIN": str(int(time.time()) + 60)}, True),
+            ({"HTTP_X_PRIMARY_PIN": str(int(time.time()) - 60)}, False),
+            ({"HTTP_X_PRIMARY_PIN": "invalid"}, False),
+        ],
+    )
+    def test_pinned_header(
+        self,
+        factory: client.RequestFactory,
+        extra: dict[str, t.Any],
+        *,
+        pinned: bool,
+    ) -> None:
+        response = middleware.PrimaryPinMiddleware(get_response)(
+            factory.get("/", **extra),
+        )
+
+        assert response.content == str(not pinned).encode()
+        assert middleware.PRIMARY_PIN_HEADER not in response
+
+    def test_pinned_cookie(self, factory: client.RequestFactory) -> None:
+        request = factory.get("/")
+        request.COOKIES[middleware.PRIMARY_PIN_COOKIE] = str(int(time.time()) + 60)
+
+        response = middleware.PrimaryPinMiddleware(get_response)(request)
+
+        assert response.content == b"False"
+
+    def test_async_pinned_header(self, factory: client.RequestFactory) -> None:
+        pin_middleware = middleware.PrimaryPinMiddleware(aget_response)
+        request = factory.get(
+            "/",
+            HTTP_X_PRIMARY_PIN=str(int(time.time()) + 60),
+        )
+
+        response = sync.async_to_sync(pin_middleware)(request)
+
+        assert sync.iscoroutinefunction(pin_middleware)
+        assert response.content == b"False"
+
+    def test_async_pin_after_write(self, factory: client.RequestFactory) -> None:
+        pin_middleware = middleware.PrimaryPinMiddleware(aget_response)
+
+        response = sync.async_to_sync(pin_middleware)(factory.post("/"))
+
+        assert response.content == b"True"
+        assert int(response[middleware.PRIMARY_PIN_HEADER]) > time.time()
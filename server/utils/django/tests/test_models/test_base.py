@@ -3,6 +3,9 @@ import uuid
 
 import pytest
 import time_machine
+from asgiref import sync
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from model_bakery import baker
 
@@ -108,7 +111,7 @@ class TestSoftDeletableModel:
 
         # Test soft delete return
         result = obj.delete()
-        assert result == (0, {})
+        assert result == (1, {"tests.MockSoftDeletableModel": 1})
 
         # Test hard delete return
         count, result = obj2.delete(soft=False)
@@ -124,6 +127,27 @@ class TestSoftDeletableModel:
 
         assert obj.deleted_at is None
 
+    def test_adelete_and_aundelete(self) -> None:
+        obj = baker.make(test_models.MockSoftDeletableModel)
+
+        assert sync.async_to_sync(obj.adelete)() == (
+            1,
+            {"tests.MockSoftDeletableModel": 1},
+        )
+        obj.refresh_from_db()
+        assert obj.deleted_at is not None
+
+        sync.async_to_sync(obj.aundelete)()
+        obj.refresh_from_db()
+        assert obj.deleted_at is None
+
+    def test_ahard_delete(self) -> None:
+        obj = baker.make(test_models.MockSoftDeletableModel)
+
+        sync.async_to_sync(obj.adelete)(soft=False)
+
+        assert not test_models.MockSoftDeletableModel.all_objects.exists()
+
     def test_objects_manager_excludes_deleted(self) -> None:
         active = baker.make(test_models.MockSoftDeletableModel)
         deleted = baker.make(test_models.MockSoftDeletableModel)
@@ -139,3 +163,43 @@ class TestSoftDeletableModel:
 
         objects = list(test_models.MockSoftDeletableModel.all_objects.all())
         assert objects == [active, deleted]
+
+    def test_soft_delete_updates_only_deleted_at(self) -> None:
+        obj = baker.make(test_models.MockSoftDeletableModel, name="original")
+        obj.name = "changed"
+
+        with CaptureQueriesContext(connection) as queries:
+            obj.delete()
+
+        obj.refresh_from_db()
+        assert obj.name == "original"
+        assert obj.deleted_at is not None
+        assert len(queries) == 1
+        assert '"name"' not in queries[0]["sql"]
+
+    def test_soft_delete_refreshes_updated_at(self) -> None:
+        with time_machine.travel("2024-01-01 12:00:00"):
+            obj = baker.make(test_models.MockSoftDeletableBaseModel)
+
+        with time_machine.travel("2024-01-02 12:00:00", tick=False):
+            obj.delete()
+
+        obj.refresh_from_db()
+        assert obj.updated_at == timezone.datetime(
+            2024, 1, 2, 12, 0, tzinfo=datetime.UTC
+        )
+        assert obj.deleted_at == obj.updated_at
+
+
+class TestSoftDeletableIndexes:
+    def test_partial_index_on_live_rows(self) -> None:
+        indexes = test_models.MockSoftDeletableModel._meta.indexes  # noqa: SLF001
+
+        assert len(indexes) == 1
+        assert indexes[0].fields == ["name"]
+        assert indexes[0].condition == models.Q(deleted_at__isnull=True)
+        assert indexes[0].name.endswith("_live")
+        assert len(indexes[0].name) <= models.Index.max_name_length
+
+    def test_no_index_without_fields(self) -> None:
+        assert test_models.MockSoftDeletableBaseModel._meta.indexes == []  # noqa: SLF001
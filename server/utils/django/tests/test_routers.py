@@ -0,0 +1,62 @@
+import typing as t
+
+import pytest
+from django import db
+from model_bakery import baker
+
+from server.utils.django import routers
+from server.utils.django.tests import models as test_models
+
+REPLICA = "replica_0"
+
+
+@pytest.fixture(autouse=True)
+def replicas(settings: t.Any) -> None:
+    settings.DATABASE_REPLICAS = [REPLICA]
+
+
+# The replica has its own connection, which only sees the committed rows.
+@pytest.mark.django_db(transaction=True, databases=["default", REPLICA])
+class TestReplicaRouter:
+    def test_read_replica(self) -> None:
+        mock_model = baker.make(test_models.MockModel)
+
+        with routers.read_replica() as alias:
+            queryset = test_models.MockModel.objects.all()
+            assert alias == REPLICA
+            assert queryset.db == REPLICA
+            # The replica mirrors `default` in the tests.
+            assert list(queryset) == [mock_model]
+
+        assert test_models.MockModel.objects.all().db == db.DEFAULT_DB_ALIAS
+
+    def test_pinned_to_primary(self) -> None:
+        with routers.pin_primary(), routers.read_replica() as alias:
+            assert alias is None
+            assert test_models.MockModel.objects.all().db == db.DEFAULT_DB_ALIAS
+
+    def test_no_replicas(self, settings: t.Any) -> None:
+        settings.DATABASE_REPLICAS = []
+
+        with routers.read_replica() as alias:
+            assert alias is None
+            assert test_models.MockModel.objects.all().db == db.DEFAULT_DB_ALIAS
+
+    def test_write_to_primary(self) -> None:
+        baker.make(test_models.MockModel)
+
+        with routers.read_replica():
+            mock_model = test_models.MockModel.objects.get()
+            assert mock_model._state.db == REPLICA  # noqa: SLF001
+
+            assert (
+                db.router.db_for_write(
+                    test_models.MockModel,
+                    instance=mock_model,
+                )
+                == db.DEFAULT_DB_ALIAS
+            )
+
+    def test_allow_migrate(self) -> None:
+        assert not db.router.allow_migrate(REPLICA, "tests")
+        assert db.router.allow_migrate(db.DEFAULT_DB_ALIAS, "tests")
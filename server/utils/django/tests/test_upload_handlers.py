@@ -0,0 +1,71 @@
+import typing as t
+
+import pytest
+from django.core.files import uploadedfile
+from rest_framework import request as drf_request
+from rest_framework import test
+
+from server.utils.django import upload_handlers
+from server.utils.rest_framework import parsers as util_parsers
+
+
+@pytest.fixture
+def parse_files(
+    settings: t.Any,
+) -> t.Generator[t.Callable[..., drf_request.Request], None, None]:
+    settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 10
+    requests: list[drf_request.Request] = []
+
+    def _parse_files(**files: bytes) -> drf_request.Request:
+        request = drf_request.Request(
+            test.APIRequestFactory().post(
+                "/",
+                {
+                    name: uploadedfile.SimpleUploadedFile(f"{name}.txt", content)
+                    for name, content in files.items()
+                },
+                format="multipart",
+            ),
+            parsers=[util_parsers.StreamingMultipartJsonParser()],
+        )
+        requests.append(request)
+        _ = request.FILES
+        return request
+
+    yield _parse_files
+
+    for request in requests:
+        for upload in request.FILES.values():
+            upload.close()
+
+
+class TestSpooledTemporaryFileUploadHandler:
+    def test_spool_large_files(
+        self,
+        parse_files: t.Callable[..., drf_request.Request],
+    ) -> None:
+        request = parse_files(small=b"small", large=b"x" * 100)
+
+        small = request.FILES["small"]
+        large = request.FILES["large"]
+        assert isinstance(small, upload_handlers.SpooledTemporaryUploadedFile)
+        assert isinstance(large, upload_handlers.SpooledTemporaryUploadedFile)
+        assert not small.rolled_to_disk
+        assert large.rolled_to_disk
+        assert large.size == 100  # noqa: PLR2004
+        assert large.read() == b"x" * 100
+
+    def test_memory_budget_per_request(
+        self,
+        parse_files: t.Callable[..., drf_request.Request],
+    ) -> None:
+        request = parse_files(first=b"123456", second=b"123456", third=b"1234")
+        files = t.cast(
+            dict[str, upload_handlers.SpooledTemporaryUploadedFile],
+            request.FILES,
+        )
+
+        assert not files["first"].rolled_to_disk
+        assert files["second"].rolled_to_disk
+        assert not files["third"].rolled_to_disk
+        assert files["second"].read() == b"123456"
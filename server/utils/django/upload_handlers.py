@@ -0,0 +1,83 @@
+import pathlib
+import tempfile
+import typing as t
+
+from django import http
+from django.conf import settings
+from django.core.files import uploadedfile, uploadhandler
+
+
+class SpooledTemporaryUploadedFile(uploadedfile.UploadedFile):
+    """
+    A file uploaded to memory that rolls over to a temporary file on disk.
+
+    The file stays in memory up to `max_size` bytes, straight on disk when it
+    is 0.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        content_type: str | None,
+        size: int | None,
+        charset: str | None,
+        content_type_extra: dict[str, str] | None = None,
+        *,
+        max_size: int,
+    ) -> None:
+        file = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            max_size=max_size,
+            suffix=f".upload{pathlib.Path(name).suffix}",
+            dir=settings.FILE_UPLOAD_TEMP_DIR,
+        )
+        # A `max_size` of 0 would never roll over.
+        if max_size <= 0:
+            file.rollover()
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+
+    @property
+    def rolled_to_disk(self) -> bool:
+        return bool(self.file._rolled)  # pyright: ignore[reportAttributeAccessIssue]  # noqa: SLF001
+
+
+class SpooledTemporaryFileUploadHandler(uploadhandler.FileUploadHandler):
+    """
+    Upload handler that spools the files of a request under a memory budget.
+
+    Django's `MemoryFileUploadHandler` keeps files in memory only when the
+    whole request is under `FILE_UPLOAD_MAX_MEMORY_SIZE`, so one large file
+    sends every small file of the request to disk. Here the files share that
+    budget in the order they arrive, each stays in memory within what is left
+    of it and rolls over to disk past it.
+    """
+
+    file: SpooledTemporaryUploadedFile
+
+    def __init__(self, request: http.HttpRequest | None = None) -> None:
+        super().__init__(request)
+        self.memory_left: int = settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+
+    def new_file(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().new_file(*args, **kwargs)
+        self.file = SpooledTemporaryUploadedFile(
+            t.cast(str, self.file_name),
+            self.content_type,
+            0,
+            self.charset,
+            self.content_type_extra,
+            max_size=self.memory_left,
+        )
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size: int) -> SpooledTemporaryUploadedFile:
+        if not self.file.rolled_to_disk:
+            self.memory_left -= file_size
+        self.file.seek(0)
+        self.file.size = file_size  # pyright: ignore[reportAttributeAccessIssue]
+        return self.file
+
+    def upload_interrupted(self) -> None:
+        if hasattr(self, "file"):
+            self.file.close()
@@ -0,0 +1,12 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions, status
+
+
+class PreconditionFailed(exceptions.APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = _("The resource has changed since it was read.")
+    default_code = "precondition_failed"
+
+
+class NotModified(Exception):  # noqa: N818
+    """Raised to answer a conditional `GET` with `304 Not Modified`."""
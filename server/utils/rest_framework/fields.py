@@ -1,9 +1,36 @@
+import typing as t
+
+from django.db import DEFAULT_DB_ALIAS, models
 from rest_framework import fields
 
+from server.app.authentication import models as auth_models
+
+
+def get_action_user(user: t.Any) -> models.Model | None:
+    """
+    Get the user to save in `created_by` and `updated_by`.
+
+    The `TokenUser` of a stateless JWT authentication is not a model instance, it
+    is replaced by a `User` with only its primary key loaded, without a query.
+
+    Args:
+        user (t.Any): The user of the request.
+
+    Returns:
+        models.Model | None: The user, `None` for an anonymous user.
+    """
+    if isinstance(user, models.Model):
+        return user
+    if user is None or not user.is_authenticated:
+        return None
+    # The claims are strings.
+    pk = auth_models.UserModel._meta.pk.to_python(user.pk)  # noqa: SLF001  # pyright: ignore[reportOptionalMemberAccess]
+    return auth_models.UserModel.from_db(DEFAULT_DB_ALIAS, ["id"], [pk])
+
 
 class CurrentUserDefault(fields.CurrentUserDefault):
-    def __call__(self, serializer_field: fields.Field) -> None:
+    def __call__(self, serializer_field: fields.Field) -> t.Any:
         request = serializer_field.context.get("request", None)
         if request is None:
             return None
-        return request.user
+        return get_action_user(request.user)
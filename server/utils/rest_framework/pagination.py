@@ -1,17 +1,184 @@
+import base64
+import datetime
+import functools
+import hashlib
+import json
 import typing as t
 
+from django.conf import settings
+from django.core import exceptions as django_exceptions
 from django.core import paginator
-from rest_framework import pagination, request, response
-from rest_framework.utils.urls import replace_query_param
+from django.core.cache import cache
+from django.db import connections, models
+from django.utils import functional
+from rest_framework import exceptions, pagination, response, views
+from rest_framework import request as drf_request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+CountStrategy = t.Literal["exact", "estimate", "cached"]
+
+
+class EstimatedPage(paginator.Page):
+    """Page of an estimated count, with `has_next` taken from an extra fetched row."""
+
+    has_more: bool = False
+
+    def has_next(self) -> bool:
+        return self.has_more
+
+
+class CountStrategyPaginator(paginator.Paginator):
+    """
+    Django paginator whose `count` can avoid a full `COUNT(*)`.
+
+    Strategies:
+        exact: Always run `COUNT(*)`.
+        estimate: On PostgreSQL, use the planner estimate (`pg_class.reltuples`
+            for unfiltered tables, `EXPLAIN` rows otherwise) once it reaches
+            `estimate_threshold`. Smaller results are counted exactly.
+        cached: Cache the exact count per query signature for `cache_timeout`
+            seconds.
+
+    `count_estimated` is `True` when `count` is a planner estimate. The estimate
+    can be below the real count, so page numbers past `num_pages` stay valid and
+    each page fetches one extra row to tell whether there is a next page.
+    """
+
+    error_messages: dict[str, str]
+
+    def __init__(  # noqa: PLR0913
+        self,
+        object_list: t.Any,
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,  # noqa: FBT001, FBT002
+        *,
+        count_strategy: CountStrategy = "exact",
+        estimate_threshold: int = 100_000,
+        cache_timeout: int = 60,
+    ) -> None:
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.count_strategy = count_strategy
+        self.estimate_threshold = estimate_threshold
+        self.cache_timeout = cache_timeout
+        self.count_estimated = False
+
+    @functional.cached_property
+    def count(self) -> int:
+        if not isinstance(self.object_list, models.QuerySet):
+            return super().count
+
+        if self.count_strategy == "estimate":
+            estimate = self.get_estimated_count(self.object_list)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                self.count_estimated = True
+                return estimate
+
+        if self.count_strategy == "cached":
+            key = self.get_count_cache_key(self.object_list)
+            count = cache.get(key)
+            if count is not None:
+                return count
+
+            count = super().count
+            cache.set(key, count, self.cache_timeout)
+            return count
+
+        return super().count
+
+    def validate_number(self, number: t.Any) -> int:
+        # Evaluating `count` sets `count_estimated`.
+        self.count  # noqa: B018
+        if not self.count_estimated:
+            return super().validate_number(number)
+
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError(number)  # noqa: TRY301
+            number = int(number)
+        except (TypeError, ValueError) as e:
+            raise paginator.PageNotAnInteger(self.error_messages["invalid_page"]) from e
+        if number < 1:
+            raise paginator.EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number: t.Any) -> paginator.Page:
+        number = self.validate_number(number)
+        if not self.count_estimated:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise paginator.EmptyPage(self.error_messages["no_results"])
+
+        page = EstimatedPage(rows[: self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def get_estimated_count(self, queryset: models.QuerySet[t.Any]) -> int | None:
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        if not queryset.query.where and not queryset.query.distinct:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],  # noqa: SLF001
+                )
+                row = cursor.fetchone()
+            # `reltuples` is -1 for tables that were never vacuumed or analyzed.
+            return row[0] if row and row[0] >= 0 else None
+
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def get_count_cache_key(self, queryset: models.QuerySet[t.Any]) -> str:
+        sql, params = queryset.order_by().query.sql_with_params()
+        signature = f"{queryset.db}:{sql}:{params!r}"
+        digest = hashlib.md5(signature.encode(), usedforsecurity=False).hexdigest()
+        return f"pagination:count:{digest}"
 
 
 class PageNumberPagination(pagination.PageNumberPagination):
     page: paginator.Page
-    request: request.Request
+    request: drf_request.Request
 
     page_size_query_param = "limit"
     max_page_size = 1000
 
+    # Fall back to the `PAGINATION_COUNT_*` settings when left as `None`.
+    count_strategy: CountStrategy | None = None
+    count_estimate_threshold: int | None = None
+    count_cache_timeout: int | None = None
+
+    def paginate_queryset(
+        self,
+        queryset: models.QuerySet[t.Any],
+        request: drf_request.Request,
+        view: views.APIView | None = None,
+    ) -> list[t.Any] | None:
+        self.django_paginator_class = functools.partial(  # pyright: ignore[reportAttributeAccessIssue]
+            CountStrategyPaginator,
+            count_strategy=(
+                settings.PAGINATION_COUNT_STRATEGY
+                if self.count_strategy is None
+                else self.count_strategy
+            ),
+            estimate_threshold=(
+                settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+                if self.count_estimate_threshold is None
+                else self.count_estimate_threshold
+            ),
+            cache_timeout=(
+                settings.PAGINATION_COUNT_CACHE_TIMEOUT
+                if self.count_cache_timeout is None
+                else self.count_cache_timeout
+            ),
+        )
+        return super().paginate_queryset(queryset, request, view)
+
     def get_first_link(self) -> str:
         url = self.request.build_absolute_uri()
         page_number = 1
@@ -29,6 +196,7 @@ class PageNumberPagination(pagination.PageNumberPagination):
                 "page": self.page.number,
                 "limit": self.page.paginator.per_page,
                 "last": self.page.paginator.num_pages,
+                "estimated": getattr(self.page.paginator, "count_estimated", False),
                 "results": data,
                 "links": {
                     "first": self.get_first_link(),
@@ -46,7 +214,7 @@ class PageNumberPagination(pagination.PageNumberPagination):
     ) -> dict[str, t.Any]:
         return {
             "type": "object",
-            "required": ["count", "page", "limit", "last", "results"],
+            "required": ["count", "page", "limit", "last", "estimated", "results"],
             "properties": {
                 "count": {
                     "type": "integer",
@@ -64,6 +232,11 @@ class PageNumberPagination(pagination.PageNumberPagination):
                     "type": "integer",
                     "example": 13,
                 },
+                "estimated": {
+                    "type": "boolean",
+                    "description": "Whether `count` and `last` are estimated.",
+                    "example": False,
+                },
                 "results": schema,
                 "links": {
                     "type": "object",
@@ -100,3 +273,359 @@ class PageNumberPagination(pagination.PageNumberPagination):
                 },
             },
         }
+
+
+class LookAheadPagination(PageNumberPagination):
+    """
+    Page number pagination for infinite scroll, without `count` and `last`.
+
+    Each page fetches `limit + 1` rows and uses the extra row to tell whether
+    there is a next page, so a list request runs one query instead of two.
+    """
+
+    page_number: int
+    page_rows: list[t.Any]
+    has_next: bool
+
+    def paginate_queryset(
+        self,
+        queryset: models.QuerySet[t.Any],
+        request: drf_request.Request,
+        view: views.APIView | None = None,
+    ) -> list[t.Any] | None:
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        page_number = request.query_params.get(self.page_query_param) or 1
+        try:
+            self.page_number = int(page_number)
+            if self.page_number < 1:
+                raise ValueError(page_number)  # noqa: TRY301
+        except ValueError as e:
+            msg = self.invalid_page_message.format(
+                page_number=page_number,
+                message=str(e),
+            )
+            raise exceptions.NotFound(msg) from e
+
+        self.page_size = page_size
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page_rows = rows[:page_size]
+
+        if not self.page_rows and self.page_number > 1:
+            msg = self.invalid_page_message.format(
+                page_number=page_number,
+                message="That page contains no results",
+            )
+            raise exceptions.NotFound(msg)
+
+        return self.page_rows
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self) -> str | None:
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        page_number = self.page_number - 1
+        if page_number == 1:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, page_number)
+
+    def get_paginated_response(self, data: t.Any) -> response.Response:
+        return response.Response(
+            {
+                "page": self.page_number,
+                "limit": self.page_size,
+                "results": data,
+                "links": {
+                    "first": self.get_first_link(),
+                    "previous": self.get_previous_link(),
+                    "current": self.request.build_absolute_uri(),
+                    "next": self.get_next_link(),
+                },
+            },
+        )
+
+    def get_paginated_response_schema(
+        self,
+        schema: dict[str, t.Any],
+    ) -> dict[str, t.Any]:
+        return {
+            "type": "object",
+            "required": ["page", "limit", "results"],
+            "properties": {
+                "page": {
+                    "type": "integer",
+                    "example": 3,
+                },
+                "limit": {
+                    "type": "integer",
+                    "example": 10,
+                },
+                "results": schema,
+                "links": {
+                    "type": "object",
+                    "required": ["first", "previous", "current", "next"],
+                    "properties": {
+                        "first": {
+                            "type": "string",
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.page_query_param}=1",
+                        },
+                        "previous": {
+                            "type": "string",
+                            "nullable": True,
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.page_query_param}=2",
+                        },
+                        "current": {
+                            "type": "string",
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.page_query_param}=3",
+                        },
+                        "next": {
+                            "type": "string",
+                            "nullable": True,
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.page_query_param}=4",
+                        },
+                    },
+                },
+            },
+        }
+
+
+class KeysetCursor(t.NamedTuple):
+    position: tuple[t.Any, ...] | None
+    reverse: bool
+
+
+class KeysetPagination(pagination.CursorPagination):
+    """
+    Keyset pagination seeking on the `BaseModel` default ordering.
+
+    Instead of `OFFSET` and `COUNT(*)`, every page filters on the position of the
+    last row seen, so the page fetch time stays flat no matter how deep the
+    client pages. Ordering is fixed to `-created_at` with `id` as tiebreaker.
+    """
+
+    page: list[t.Any]
+    base_url: str
+    cursor: KeysetCursor
+
+    page_size_query_param = "limit"
+    max_page_size = 1000
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(
+        self,
+        queryset: models.QuerySet[t.Any],
+        request: drf_request.Request,
+        view: views.APIView | None = None,
+    ) -> list[t.Any] | None:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.ordering_fields = [
+            queryset.model._meta.get_field(name.lstrip("-"))  # noqa: SLF001
+            for name in self.ordering
+        ]
+        self.cursor = self.decode_cursor(request)
+
+        ordering = self.ordering
+        if self.cursor.reverse:
+            ordering = tuple(
+                name[1:] if name.startswith("-") else f"-{name}" for name in ordering
+            )
+
+        queryset = queryset.order_by(*ordering)
+        if self.cursor.position is not None:
+            queryset = queryset.filter(
+                self.get_seek_filter(ordering, self.cursor.position),
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if self.cursor.reverse:
+            self.page.reverse()
+            self.has_next = self.cursor.position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor.position is not None
+
+        return self.page
+
+    def get_ordering(
+        self,
+        request: drf_request.Request,
+        queryset: models.QuerySet[t.Any],
+        view: views.APIView | None,
+    ) -> tuple[str, ...]:
+        # The seek filter needs a fixed, unique ordering, so the `ordering`
+        # query parameter of `OrderingFilter` does not apply here.
+        return tuple(self.ordering)
+
+    def get_seek_filter(
+        self,
+        ordering: tuple[str, ...],
+        position: tuple[t.Any, ...],
+    ) -> models.Q:
+        """
+        Build the row comparison against the cursor position.
+
+        For the ordering `("-created_at", "-id")` this is
+        `created_at < x OR (created_at = x AND id < y)`.
+        """
+        seek = models.Q()
+        for name, value in reversed(list(zip(ordering, position, strict=True))):
+            attr = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            condition = models.Q(**{f"{attr}__{lookup}": value})
+            seek = condition | (models.Q(**{attr: value}) & seek) if seek else condition
+        return seek
+
+    def decode_cursor(self, request: drf_request.Request) -> KeysetCursor:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return KeysetCursor(position=None, reverse=False)
+
+        try:
+            tokens = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            reverse = bool(tokens.get("r", False))
+            position = tokens.get("p")
+            if position is not None:
+                position = tuple(
+                    field.to_python(value)
+                    for field, value in zip(self.ordering_fields, position, strict=True)
+                )
+        except (
+            TypeError,
+            ValueError,
+            AttributeError,
+            django_exceptions.ValidationError,
+        ) as e:
+            raise exceptions.NotFound(self.invalid_cursor_message) from e
+
+        return KeysetCursor(position=position, reverse=reverse)
+
+    def encode_cursor(self, cursor: KeysetCursor) -> str:
+        tokens: dict[str, t.Any] = {"r": int(cursor.reverse)}
+        if cursor.position is not None:
+            tokens["p"] = [
+                value.isoformat() if isinstance(value, datetime.date) else str(value)
+                for value in cursor.position
+            ]
+
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(tokens, separators=(",", ":")).encode("ascii"),
+        ).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_first_link(self) -> str:
+        return remove_query_param(self.base_url, self.cursor_query_param)
+
+    def get_last_link(self) -> str:
+        return self.encode_cursor(KeysetCursor(position=None, reverse=True))
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(KeysetCursor(position=position, reverse=False))
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(KeysetCursor(position=position, reverse=True))
+
+    def get_paginated_response(self, data: t.Any) -> response.Response:
+        return response.Response(
+            {
+                "limit": self.page_size,
+                "results": data,
+                "links": {
+                    "first": self.get_first_link(),
+                    "previous": self.get_previous_link(),
+                    "current": self.request.build_absolute_uri(),
+                    "next": self.get_next_link(),
+                    "last": self.get_last_link(),
+                },
+            },
+        )
+
+    def get_paginated_response_schema(
+        self,
+        schema: dict[str, t.Any],
+    ) -> dict[str, t.Any]:
+        return {
+            "type": "object",
+            "required": ["limit", "results"],
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "example": 10,
+                },
+                "results": schema,
+                "links": {
+                    "type": "object",
+                    "required": ["first", "previous", "current", "next", "last"],
+                    "properties": {
+                        "first": {
+                            "type": "string",
+                            "format": "uri",
+                            "example": "http://api.example.org/accounts/",
+                        },
+                        "previous": {
+                            "type": "string",
+                            "nullable": True,
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.cursor_query_param}=eyJyIjoxLCJwIjpbIjIwMjQiXX0=",
+                        },
+                        "current": {
+                            "type": "string",
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.cursor_query_param}=eyJyIjowLCJwIjpbIjIwMjQiXX0=",
+                        },
+                        "next": {
+                            "type": "string",
+                            "nullable": True,
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.cursor_query_param}=eyJyIjowLCJwIjpbIjIwMjUiXX0=",
+                        },
+                        "last": {
+                            "type": "string",
+                            "format": "uri",
+                            "example": f"http://api.example.org/accounts/?{self.cursor_query_param}=eyJyIjoxfQ==",
+                        },
+                    },
+                },
+            },
+        }
+
+    def _get_position_from_instance(
+        self,
+        instance: t.Any,
+        ordering: t.Sequence[str],
+    ) -> tuple[t.Any, ...]:
+        if isinstance(instance, dict):
+            return tuple(instance[name.lstrip("-")] for name in ordering)
+        return tuple(getattr(instance, field.attname) for field in self.ordering_fields)
@@ -1,9 +1,43 @@
+import codecs
+import collections
 import io
-import json
 import typing as t
 
+import orjson
 from django import http
-from rest_framework import parsers, request
+from django.conf import settings
+from django.core import exceptions as django_exceptions
+from django.core.files import uploadedfile, uploadhandler
+from django.http import multipartparser
+from django.utils import datastructures
+from django.utils import http as http_utils
+from rest_framework import exceptions, parsers, request
+
+from server.utils.rest_framework import renderers as util_renderers
+
+
+class ORJSONParser(parsers.JSONParser):
+    """JSON parser backed by orjson, which rejects `NaN` and `Infinity`."""
+
+    renderer_class = util_renderers.ORJSONRenderer
+
+    def parse(
+        self,
+        stream: t.IO[bytes],
+        media_type: str | None = None,
+        parser_context: t.Mapping[str, t.Any] | None = None,
+    ) -> t.Any:
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            content = stream.read()
+            if codecs.lookup(encoding).name != "utf-8":
+                content = content.decode(encoding)
+            return orjson.loads(content)
+        except ValueError as exc:
+            msg = f"JSON parse error - {exc}"
+            raise exceptions.ParseError(msg) from exc
 
 
 class MultipartJsonParser(parsers.MultiPartParser):
@@ -23,7 +57,7 @@ class MultipartJsonParser(parsers.MultiPartParser):
         for key, value in result.data.items():
             if "{" in value or "[" in value:
                 try:
-                    data[key] = json.loads(value)
+                    data[key] = orjson.loads(value)
                 except ValueError:
                     data[key] = value
 
@@ -31,3 +65,277 @@ class MultipartJsonParser(parsers.MultiPartParser):
                 data[key] = value
 
         return parsers.DataAndFiles(data, result.files)
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _loads_part(key: str, value: str | bytes, charset: str | None = None) -> t.Any:
+    try:
+        if (
+            isinstance(value, bytes)
+            and charset
+            and codecs.lookup(charset).name != "utf-8"
+        ):
+            value = value.decode(charset)
+        return orjson.loads(value)
+    except (LookupError, ValueError) as exc:
+        msg = f"JSON parse error in '{key}' - {exc}"
+        raise exceptions.ParseError(msg) from exc
+
+
+class JsonUploadHandler(uploadhandler.FileUploadHandler):
+    """
+    Keep the file parts sent as `application/json` in memory to decode them.
+
+    Together they may not exceed `DATA_UPLOAD_MAX_MEMORY_SIZE`, the limit of
+    the other fields, since they are loaded in memory all the same.
+    """
+
+    def __init__(self, request: http.HttpRequest | None = None) -> None:
+        super().__init__(request)
+        self.activated = False
+        self.num_bytes_read = 0
+
+    def new_file(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().new_file(*args, **kwargs)
+        self.activated = self.content_type == JSON_MEDIA_TYPE
+        if self.activated:
+            self.file = io.BytesIO()
+            raise uploadhandler.StopFutureHandlers
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes | None:
+        if not self.activated:
+            return raw_data
+
+        self.num_bytes_read += len(raw_data)
+        max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        if max_size is not None and self.num_bytes_read > max_size:
+            msg = "Request body exceeded settings.DATA_UPLOAD_MAX_MEMORY_SIZE."
+            raise django_exceptions.RequestDataTooBig(msg)
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size: int) -> uploadedfile.UploadedFile | None:
+        if not self.activated:
+            return None
+
+        self.activated = False
+        self.file.seek(0)
+        return uploadedfile.InMemoryUploadedFile(
+            file=self.file,
+            field_name=self.field_name,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra or {},
+        )
+
+
+class _PartHeadersReader:
+    """
+    Read the headers of the parts of a multipart body as the parser reads it.
+
+    Django's parser only hands the headers of the file parts to the upload
+    handlers, this keeps the content type of the fields, in order.
+    """
+
+    max_header_size = 1024
+
+    def __init__(self, stream: t.Any) -> None:
+        self.stream = stream
+        self.delimiter = b""
+        self.fields: list[tuple[str, str]] = []
+        # The first delimiter starts the body, without the preceding CRLF.
+        self._buffer = b"\r\n"
+        self._in_headers = False
+        self._done = False
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        if data and not self._done:
+            self._feed(data)
+        return data
+
+    def _feed(self, data: bytes) -> None:
+        buffer = self._buffer + data
+        while not self._done:
+            if not self._in_headers:
+                index = buffer.find(self.delimiter)
+                if index == -1:
+                    buffer = buffer[1 - len(self.delimiter) :]
+                    break
+                buffer = buffer[index + len(self.delimiter) :]
+                self._in_headers = True
+                continue
+
+            if buffer.startswith(b"--"):
+                self._done = True
+                break
+            end = buffer.find(b"\r\n\r\n")
+            next_part = buffer.find(self.delimiter)
+            if next_part != -1 and (end == -1 or next_part < end):
+                # A part without headers, which the parser skips as well.
+                self._in_headers = False
+                continue
+            if end == -1:
+                if len(buffer) > self.max_header_size:
+                    self._in_headers = False
+                    continue
+                break
+
+            self._add_part(buffer[:end])
+            buffer = buffer[end + 4 :]
+            self._in_headers = False
+        self._buffer = buffer
+
+    def _add_part(self, header: bytes) -> None:
+        headers: dict[str, tuple[str, dict[str, str]]] = {}
+        for line in header.split(b"\r\n"):
+            try:
+                main_value_pair, params = http_utils.parse_header_parameters(  # pyright: ignore[reportAttributeAccessIssue]
+                    line.decode(),
+                )
+                name, value = main_value_pair.split(":", 1)
+            except ValueError:
+                continue
+            headers[name] = value.strip(), params
+
+        _, disposition = headers.get("content-disposition", ("", {}))
+        if "name" in disposition and not disposition.get("filename"):
+            content_type, _ = headers.get("content-type", ("", {}))
+            self.fields.append((disposition["name"].strip(), content_type))
+
+
+class JsonMultiPartParser(multipartparser.MultiPartParser):
+    """
+    Django's multipart parser that decodes the JSON parts of the form.
+
+    The parts sent as `application/json`, fields and files alike, are decoded
+    into the data, within `DATA_UPLOAD_MAX_MEMORY_SIZE`, and so are the fields
+    in `json_fields`. The files go through the upload handlers.
+    """
+
+    _boundary: bytes
+
+    def __init__(
+        self,
+        META: dict[str, t.Any],  # noqa: N803
+        input_data: t.Any,
+        upload_handlers: t.Iterable[uploadhandler.FileUploadHandler],
+        encoding: str | None = None,
+        *,
+        json_fields: t.Collection[str] = (),
+    ) -> None:
+        self.part_headers = _PartHeadersReader(input_data)
+        super().__init__(
+            META,
+            self.part_headers,  # pyright: ignore[reportArgumentType]
+            [JsonUploadHandler(), *upload_handlers],
+            encoding,
+        )
+        self.part_headers.delimiter = b"\r\n--" + self._boundary
+        self.json_fields = frozenset(json_fields)
+
+    def parse(self) -> tuple[http.QueryDict, datastructures.MultiValueDict]:
+        data, files = super().parse()
+        json_values = self.get_json_values()
+        json_uploads = {
+            key: [
+                upload for upload in uploads if upload.content_type == JSON_MEDIA_TYPE
+            ]
+            for key, uploads in files.lists()
+        }
+        if not (
+            self.json_fields & data.keys() or json_values or any(json_uploads.values())
+        ):
+            return data, files
+
+        data = data.copy()
+        for key, values in data.lists():
+            indexes = json_values.get(key, set())
+            data.setlist(
+                key,
+                [
+                    _loads_part(key, value)
+                    if isinstance(value, str)
+                    and (key in self.json_fields or index in indexes)
+                    else value
+                    for index, value in enumerate(values)
+                ],
+            )
+
+        files = files.copy()
+        for key, uploads in json_uploads.items():
+            if not uploads:
+                continue
+            for upload in uploads:
+                with upload:
+                    data.appendlist(
+                        key, _loads_part(key, upload.read(), upload.charset)
+                    )
+            other_uploads = [
+                upload for upload in files.getlist(key) if upload not in uploads
+            ]
+            if other_uploads:
+                files.setlist(key, other_uploads)
+            else:
+                del files[key]
+
+        data._mutable = False  # noqa: SLF001
+        return data, files
+
+    def get_json_values(self) -> dict[str, set[int]]:
+        """Get the indexes, in the values of each field, of the JSON ones."""
+        indexes: dict[str, set[int]] = {}
+        counts: collections.Counter[str] = collections.Counter()
+        for name, content_type in self.part_headers.fields:
+            if content_type == JSON_MEDIA_TYPE:
+                indexes.setdefault(name, set()).add(counts[name])
+            counts[name] += 1
+        return indexes
+
+
+class StreamingMultipartJsonParser(parsers.MultiPartParser):
+    """
+    Multipart parser that decodes the JSON parts while it streams the form.
+
+    Unlike `MultipartJsonParser`, only the parts sent as `application/json`,
+    like a `Blob` in a browser `FormData`, and the fields listed in
+    `json_fields` or in the `multipart_json_fields` of the view are decoded,
+    other values stay strings. The JSON parts never reach `request.FILES`.
+
+    The data is a `QueryDict`, so a key sent more than once keeps every value
+    for `getlist` and serializers read it as form input.
+    """
+
+    json_fields: t.ClassVar[tuple[str, ...]] = ()
+
+    def parse(
+        self,
+        stream: io.BytesIO | request.Request | http.HttpRequest,
+        media_type: str | None = None,
+        parser_context: dict[str, t.Any] | None = None,
+    ) -> parsers.DataAndFiles:
+        parser_context = parser_context or {}
+        drf_request: request.Request = parser_context["request"]
+        view = parser_context.get("view")
+        meta = drf_request.META.copy()
+        meta["CONTENT_TYPE"] = media_type
+
+        try:
+            data, files = JsonMultiPartParser(
+                meta,
+                stream,
+                drf_request.upload_handlers,
+                parser_context.get("encoding", settings.DEFAULT_CHARSET),
+                json_fields={
+                    *self.json_fields,
+                    *getattr(view, "multipart_json_fields", ()),
+                },
+            ).parse()
+        except multipartparser.MultiPartParserError as exc:
+            msg = f"Multipart form parse error - {exc}"
+            raise exceptions.ParseError(msg) from exc
+        return parsers.DataAndFiles(data, files)
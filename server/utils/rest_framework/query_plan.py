@@ -0,0 +1,287 @@
+import dataclasses
+import functools
+import typing as t
+
+from django.core import exceptions as django_exceptions
+from django.db import models
+from rest_framework import relations, serializers
+
+from server.utils.rest_framework.serializers import base as base_serializers
+from server.utils.rest_framework.serializers import compiled
+
+
+@dataclasses.dataclass(frozen=True)
+class PrefetchPlan:
+    lookup: str
+    model: type[models.Model]
+    plan: "QueryPlan"
+
+    def to_prefetch(self) -> models.Prefetch:
+        if not self.plan:
+            return models.Prefetch(self.lookup)
+
+        queryset = self.model._default_manager.all()  # noqa: SLF001
+        return models.Prefetch(self.lookup, queryset=self.plan.apply(queryset))
+
+
+@dataclasses.dataclass(frozen=True)
+class QueryPlan:
+    """The relations and columns a serializer reads, to apply to a queryset."""
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[PrefetchPlan, ...] = ()
+    only: tuple[str, ...] = ()
+    # The `values()` names of a list rendered by a `CompiledListSerializer`.
+    values_fields: tuple[str, ...] | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.select_related or self.prefetch_related or self.only)
+
+    def apply(self, queryset: models.QuerySet[t.Any]) -> models.QuerySet[t.Any]:
+        if self.only:
+            queryset = queryset.only(*self.only)
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(
+                *(prefetch.to_prefetch() for prefetch in self.prefetch_related),
+            )
+        return queryset
+
+
+class _QueryPlanBuilder:
+    def __init__(self) -> None:
+        self.select_related: dict[str, None] = {}
+        self.prefetch_related: dict[str, PrefetchPlan] = {}
+        self.only: dict[str, None] = {}
+        # Lookups of the relations, `""` for the root model, whose columns can
+        # not be pruned because they are read by code the builder can't follow.
+        self.all_columns: set[str] = set()
+
+    def build(self) -> QueryPlan:
+        only: tuple[str, ...] = ()
+        if "" not in self.all_columns:
+            only = tuple(
+                name
+                for name in self.only
+                if not any(
+                    name.startswith(f"{lookup}__") for lookup in self.all_columns
+                )
+            )
+
+        return QueryPlan(
+            select_related=tuple(self.select_related),
+            prefetch_related=tuple(self.prefetch_related.values()),
+            only=only,
+        )
+
+    def add_prefetch(
+        self,
+        lookup: str,
+        model: type[models.Model],
+        plan: QueryPlan | None = None,
+    ) -> None:
+        # Django rejects the same lookup with different querysets, first wins.
+        self.prefetch_related.setdefault(
+            lookup,
+            PrefetchPlan(lookup=lookup, model=model, plan=plan or QueryPlan()),
+        )
+
+    def walk(
+        self,
+        serializer: serializers.BaseSerializer,
+        model: type[models.Model],
+        prefix: str = "",
+    ) -> None:
+        relation = prefix.removesuffix("__")
+        if (
+            type(serializer).to_representation
+            is not serializers.Serializer.to_representation
+        ):
+            self.all_columns.add(relation)
+
+        for field in getattr(serializer, "fields", {}).values():
+            if field.write_only:
+                continue
+
+            if field.source == "*":
+                if isinstance(field, serializers.BaseSerializer):
+                    self.walk(field, model, prefix)
+                else:
+                    self.all_columns.add(relation)
+                continue
+
+            self.walk_field(field, model, prefix)
+
+    def walk_field(
+        self,
+        field: serializers.Field,
+        model: type[models.Model],
+        prefix: str,
+    ) -> None:
+        current_model = model
+        relation = prefix.removesuffix("__")
+        path: list[str] = []
+
+        for index, attr in enumerate(field.source_attrs):
+            try:
+                model_field = current_model._meta.get_field(attr)  # noqa: SLF001
+            except django_exceptions.FieldDoesNotExist:
+                self.all_columns.add(relation)
+                return
+
+            path.append(attr)
+            lookup = f"{prefix}{'__'.join(path)}"
+            if not model_field.is_relation or model_field.related_model is None:
+                if getattr(model_field, "concrete", False):
+                    self.only[lookup] = None
+                else:
+                    self.all_columns.add(relation)
+                return
+
+            related_model = t.cast(type[models.Model], model_field.related_model)
+            is_last = index == len(field.source_attrs) - 1
+
+            if model_field.many_to_many or model_field.one_to_many:
+                child = getattr(field, "child", None) if is_last else None
+                self.walk_to_many(model_field, child, lookup)
+                return
+
+            if getattr(model_field, "concrete", False):
+                self.only[lookup] = None
+
+            if is_last:
+                if isinstance(field, serializers.BaseSerializer):
+                    self.select_related[lookup] = None
+                    self.walk(field, related_model, f"{lookup}__")
+                elif not (
+                    isinstance(field, relations.RelatedField)
+                    and field.use_pk_only_optimization()
+                ):
+                    self.select_related[lookup] = None
+                    self.all_columns.add(lookup)
+                return
+
+            self.select_related[lookup] = None
+            current_model = related_model
+            relation = lookup
+
+    def walk_to_many(
+        self,
+        model_field: models.Field[t.Any, t.Any] | models.ForeignObjectRel,
+        child: serializers.Field | None,
+        lookup: str,
+    ) -> None:
+        related_model = t.cast(type[models.Model], model_field.related_model)
+        if not isinstance(child, serializers.BaseSerializer):
+            self.add_prefetch(lookup, related_model)
+            return
+
+        plan = get_plan(child, related_model)
+        if plan.only and model_field.one_to_many:
+            # The prefetch matches the rows to their parent by the foreign key,
+            # which must not be deferred.
+            plan = dataclasses.replace(
+                plan,
+                only=(*plan.only, model_field.remote_field.name),
+            )
+        self.add_prefetch(lookup, related_model, plan)
+
+
+def get_plan(
+    serializer: serializers.BaseSerializer,
+    model: type[models.Model],
+) -> QueryPlan:
+    """
+    Build the query plan of the relations and columns that a serializer reads.
+
+    To-one relations that are rendered by a nested serializer, a related field
+    other than a primary key or a dotted `source` are joined with
+    `select_related`. To-many relations are prefetched, with the plan of their
+    nested serializer applied to the prefetch queryset.
+
+    Only the columns of the model fields that are read are loaded with `only()`.
+    A model, or a joined relation, loads all of its columns once a field reads
+    a property or method, the whole instance (`source="*"`), or the serializer
+    overrides `to_representation`.
+
+    Args:
+        serializer (serializers.BaseSerializer): The serializer to walk.
+        model (type[models.Model]): The model of the serialized instances.
+
+    Returns:
+        QueryPlan: The plan to apply to the queryset.
+    """
+    builder = _QueryPlanBuilder()
+    builder.walk(serializer, model)
+    return builder.build()
+
+
+@functools.lru_cache(maxsize=256)
+def get_field_names(serializer_class: type[serializers.Serializer]) -> frozenset[str]:
+    return frozenset(serializer_class().fields)
+
+
+def get_query_plan(
+    serializer_class: type[serializers.ModelSerializer],
+    sparse_fieldset: base_serializers.SparseFieldset | None = None,
+) -> QueryPlan:
+    """
+    Build the query plan of a model serializer once per serializer class.
+
+    The fieldset comes from the query params, so it is restricted to the
+    fields of the serializer before it keys the cache of the plans. The plan is
+    built from a serializer without context, serializers whose fields depend on
+    it set `context_dependent_fields` and go through `get_serializer_query_plan`.
+
+    Args:
+        serializer_class (type[serializers.ModelSerializer]): The serializer.
+        sparse_fieldset (base_serializers.SparseFieldset | None): The fields
+            selected from a `BaseSerializer` subclass.
+
+    Returns:
+        QueryPlan: The plan to apply to the queryset.
+    """
+    if sparse_fieldset is None or not issubclass(
+        serializer_class,
+        base_serializers.BaseSerializer,
+    ):
+        return _get_query_plan(serializer_class)
+    return _get_query_plan(
+        serializer_class,
+        sparse_fieldset.restrict(get_field_names(serializer_class)),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_query_plan(
+    serializer_class: type[serializers.ModelSerializer],
+    sparse_fieldset: base_serializers.SparseFieldset | None = None,
+) -> QueryPlan:
+    if sparse_fieldset is not None and issubclass(
+        serializer_class,
+        base_serializers.BaseSerializer,
+    ):
+        serializer = serializer_class(sparse_fieldset=sparse_fieldset)
+    else:
+        serializer = serializer_class()
+    return get_serializer_query_plan(serializer)
+
+
+def get_serializer_query_plan(serializer: serializers.ModelSerializer) -> QueryPlan:
+    """
+    Build the query plan of a model serializer bound to its context, uncached.
+
+    Args:
+        serializer (serializers.ModelSerializer): The serializer to plan.
+
+    Returns:
+        QueryPlan: The plan to apply to the queryset.
+    """
+    plan = get_plan(serializer, serializer.Meta.model)
+    if compiled.uses_compiled_list(type(serializer)):
+        plan = dataclasses.replace(
+            plan,
+            values_fields=compiled.get_values_fields(serializer),
+        )
+    return plan
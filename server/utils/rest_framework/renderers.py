@@ -0,0 +1,63 @@
+import typing as t
+
+import orjson
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+_encoder = encoders.JSONEncoder()
+
+# Options that match the output of `JSONRenderer` with the default settings.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def orjson_default(obj: t.Any) -> t.Any:
+    """
+    Encode the types that orjson does not support like the DRF `JSONEncoder`.
+
+    UUIDs, datetimes and dataclasses are encoded by orjson, `Decimal`, lazy
+    strings, timedeltas, querysets and the rest fall back to `JSONEncoder`.
+
+    Args:
+        obj (t.Any): The object to encode.
+
+    Returns:
+        t.Any: An object that orjson can encode.
+    """
+    return _encoder.default(obj)
+
+
+def dumps(data: t.Any, option: int = 0) -> bytes:
+    return orjson.dumps(data, default=orjson_default, option=ORJSON_OPTIONS | option)
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSON renderer backed by orjson, with the same output as `JSONRenderer`.
+
+    Falls back to `JSONRenderer` when the output can't be matched, for an ASCII
+    only or non compact output, or an indent other than 2.
+    """
+
+    def render(
+        self,
+        data: t.Any,
+        accepted_media_type: str | None = None,
+        renderer_context: t.Mapping[str, t.Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type or "", renderer_context)
+        if self.ensure_ascii or not self.compact or indent not in (None, 2):
+            return t.cast(
+                bytes,
+                super().render(data, accepted_media_type, renderer_context),
+            )
+
+        ret = dumps(data, orjson.OPT_INDENT_2 if indent else 0)
+        # U+2028 and U+2029 are valid JSON but not valid JavaScript.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9",
+            b"\\u2029",
+        )
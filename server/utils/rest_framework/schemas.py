@@ -0,0 +1,46 @@
+import typing as t
+
+from drf_spectacular import openapi
+from drf_spectacular import utils as docs_utils
+
+from server.utils.rest_framework.serializers import base as base_serializers
+
+
+class AutoSchema(openapi.AutoSchema):
+    def get_override_parameters(self) -> list[t.Any]:
+        return [
+            *self.get_sparse_fieldset_parameters(),
+            *super().get_override_parameters(),
+        ]
+
+    def get_sparse_fieldset_parameters(self) -> list[docs_utils.OpenApiParameter]:
+        """Document the `?fields=` and `?omit=` params of `BaseSerializer` reads."""
+        if self.method != "GET":
+            return []
+
+        serializer = self.get_response_serializers()
+        if isinstance(serializer, type):
+            serializer = serializer()
+        if not isinstance(serializer, base_serializers.BaseSerializer):
+            return []
+
+        schema = {
+            "type": "array",
+            "items": {"type": "string", "enum": list(serializer.fields)},
+        }
+        return [
+            docs_utils.OpenApiParameter(
+                name=base_serializers.FIELDS_QUERY_PARAM,
+                type=schema,
+                style="form",
+                explode=False,
+                description="Return only these fields of the objects.",
+            ),
+            docs_utils.OpenApiParameter(
+                name=base_serializers.OMIT_QUERY_PARAM,
+                type=schema,
+                style="form",
+                explode=False,
+                description="Return the objects without these fields.",
+            ),
+        ]
@@ -1,4 +1,11 @@
-from rest_framework import serializers
+import functools
+import typing as t
+
+from django.core import exceptions as django_exceptions
+from django.db import models
+from drf_spectacular import utils as docs_utils
+from rest_framework import exceptions, permissions, relations, serializers
+from rest_framework import request as drf_request
 
 from server.app.authentication import models as auth_models
 from server.utils.rest_framework import fields as util_fields
@@ -15,7 +22,139 @@ class UserActionLogSerializer(serializers.ModelSerializer):
         )
 
 
+class UserIdentityMap:
+    """The serialized users of a request by primary key, loaded in batches."""
+
+    def __init__(self) -> None:
+        self.users: dict[t.Any, dict[str, t.Any] | None] = {}
+
+    def load(self, pks: t.Iterable[t.Any]) -> None:
+        """
+        Load the users that are not in the map yet with one `IN` query.
+
+        Args:
+            pks (t.Iterable[t.Any]): The primary keys, `None` ones are ignored.
+        """
+        missing = {pk for pk in pks if pk is not None and pk not in self.users}
+        if not missing:
+            return
+
+        serializer = UserActionLogSerializer()
+        users = auth_models.UserModel.objects.filter(pk__in=missing).only(
+            *UserActionLogSerializer.Meta.fields,
+        )
+        for user in users:
+            self.users[user.pk] = serializer.to_representation(user)
+        # Users deleted since the rows were read are not looked up again.
+        for pk in missing:
+            self.users.setdefault(pk, None)
+
+
+USER_IDENTITY_MAP_ATTR = "_user_identity_map"
+
+
+@docs_utils.extend_schema_field(UserActionLogSerializer)
+class UserActionLogIdentityField(relations.RelatedField):
+    """
+    Render a user action log relation from a request scoped `UserIdentityMap`.
+
+    A drop-in for a `UserActionLogSerializer` field that does not join the user
+    of every row. The first row rendered loads the distinct users of the whole
+    page in one query, and every row of the same user reuses its serialized dict,
+    so the dicts must not be mutated.
+    """
+
+    def __init__(self, **kwargs: t.Any) -> None:
+        kwargs.setdefault("read_only", True)
+        super().__init__(**kwargs)
+
+    def use_pk_only_optimization(self) -> bool:
+        return True
+
+    def get_identity_map(self) -> UserIdentityMap:
+        # Shared by every serializer of the request, or of the root serializer.
+        holder = self.context.get("request") or self.root
+        identity_map = getattr(holder, USER_IDENTITY_MAP_ATTR, None)
+        if identity_map is None:
+            identity_map = UserIdentityMap()
+            setattr(holder, USER_IDENTITY_MAP_ATTR, identity_map)
+        return identity_map
+
+    def get_page_pks(self) -> t.Iterator[t.Any]:
+        """Get the user keys of every identity field of the rows of the root list."""
+        root = self.root
+        parent = self.parent
+        if (
+            not isinstance(root, serializers.ListSerializer)
+            or parent is not root.child
+            or not isinstance(parent, serializers.ModelSerializer)
+            or isinstance(root.instance, models.Manager)
+            or not isinstance(root.instance, t.Iterable)
+        ):
+            return
+
+        opts = parent.Meta.model._meta  # noqa: SLF001
+        attnames = [
+            opts.get_field(field.source_attrs[0]).attname
+            for field in parent.fields.values()
+            if isinstance(field, UserActionLogIdentityField)
+            and len(field.source_attrs) == 1
+        ]
+        for instance in root.instance:
+            for attname in attnames:
+                yield getattr(instance, attname, None)
+
+    def to_representation(self, value: relations.PKOnlyObject) -> t.Any:
+        identity_map = self.get_identity_map()
+        if value.pk not in identity_map.users:
+            identity_map.load([value.pk, *self.get_page_pks()])
+        return identity_map.users[value.pk]
+
+
+class SparseFieldset(t.NamedTuple):
+    fields: frozenset[str] | None = None
+    omit: frozenset[str] = frozenset()
+
+    def restrict(self, names: t.AbstractSet[str]) -> "SparseFieldset":
+        """Keep only the names in `names`, e.g. the fields of a serializer."""
+        return SparseFieldset(
+            fields=None if self.fields is None else self.fields & names,
+            omit=self.omit & names,
+        )
+
+
+FIELDS_QUERY_PARAM = "fields"
+OMIT_QUERY_PARAM = "omit"
+
+
+def get_sparse_fieldset(request: drf_request.Request | None) -> SparseFieldset:
+    """
+    Parse the comma separated `?fields=` and `?omit=` query params of a request.
+
+    Only read requests select fields, a write must validate the full payload.
+
+    Args:
+        request (drf_request.Request | None): The request.
+
+    Returns:
+        SparseFieldset: The fields to return, `None` for all, and to omit.
+    """
+    if request is None or request.method not in permissions.SAFE_METHODS:
+        return SparseFieldset()
+
+    def parse(param: str) -> frozenset[str]:
+        value = request.query_params.get(param, "")
+        return frozenset(name.strip() for name in value.split(",") if name.strip())
+
+    fields = parse(FIELDS_QUERY_PARAM)
+    return SparseFieldset(fields=fields or None, omit=parse(OMIT_QUERY_PARAM))
+
+
 class BaseSerializer(serializers.ModelSerializer):
+    # Whether the fields depend on the context, e.g. on the request user. The
+    # query plan of the views is then built per request instead of per class.
+    context_dependent_fields: t.ClassVar[bool] = False
+
     created_by = UserActionLogSerializer(
         default=util_fields.CurrentUserDefault(),
         read_only=True,
@@ -25,6 +164,75 @@ class BaseSerializer(serializers.ModelSerializer):
         read_only=True,
     )
 
+    def __init__(
+        self,
+        *args: t.Any,
+        sparse_fieldset: SparseFieldset | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        self.sparse_fieldset = sparse_fieldset
+        super().__init__(*args, **kwargs)
+
+    def get_sparse_fieldset(self) -> SparseFieldset:
+        if self.sparse_fieldset is not None:
+            return self.sparse_fieldset
+
+        # Query params select the fields of the top level objects only, not
+        # those of nested serializers.
+        root = self.root
+        if self is not root and not (
+            isinstance(root, serializers.ListSerializer) and self.parent is root
+        ):
+            return SparseFieldset()
+        return get_sparse_fieldset(self.context.get("request"))
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        fields = super().get_fields()
+        sparse_fieldset = self.get_sparse_fieldset()
+        return {
+            name: field
+            for name, field in fields.items()
+            if (sparse_fieldset.fields is None or name in sparse_fieldset.fields)
+            and name not in sparse_fieldset.omit
+        }
+
+
+def to_pk(model: type[models.Model], value: t.Any) -> t.Any | None:
+    """Convert a payload id to a primary key of `model`, `None` if it is invalid."""
+    try:
+        return model._meta.pk.to_python(value)  # noqa: SLF001  # pyright: ignore[reportOptionalMemberAccess]
+    except django_exceptions.ValidationError:
+        return None
+
+
+class BulkUpdateListSerializer(serializers.ListSerializer):
+    """Validate every item of a list payload against the instance with its `id`."""
+
+    instance: t.Sequence[models.Model]
+    child: serializers.ModelSerializer
+
+    @functools.cached_property
+    def instance_map(self) -> dict[t.Any, models.Model]:
+        return {instance.pk: instance for instance in self.instance}
+
+    def get_instance(self, data: t.Any) -> models.Model | None:
+        if not isinstance(data, dict):
+            return None
+        return self.instance_map.get(to_pk(self.child.Meta.model, data.get("id")))
+
+    def run_child_validation(self, data: t.Any) -> t.Any:
+        instance = self.get_instance(data)
+        if instance is None:
+            pk = data.get("id") if isinstance(data, dict) else None
+            message = relations.PrimaryKeyRelatedField.default_error_messages[
+                "does_not_exist"
+            ].format(pk_value=pk)
+            raise exceptions.ValidationError({"id": [message]}, code="does_not_exist")
+
+        self.child.instance = instance
+        self.child.initial_data = data
+        return super().run_child_validation(data)  # pyright: ignore[reportAttributeAccessIssue]
+
 
 uuid_primary_key_fields = ("id",)
 timestamp_fields = ("created_at", "updated_at")
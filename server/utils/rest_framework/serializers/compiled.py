@@ -0,0 +1,340 @@
+import datetime
+import functools
+import operator
+import typing as t
+
+from django.core import exceptions as django_exceptions
+from django.db import models
+from django.utils import timezone
+from rest_framework import ISO_8601, relations, serializers
+from rest_framework import fields as drf_fields
+from rest_framework import settings as drf_settings
+
+Converter = t.Callable[[t.Any], dict[str, t.Any]]
+Extractor = t.Callable[[t.Any], t.Any]
+
+_SKIP = object()
+
+# Fields whose `to_representation` is a plain type conversion.
+_SIMPLE_REPRESENTATIONS: dict[type[serializers.Field], t.Callable[[t.Any], t.Any]] = {
+    serializers.CharField: str,
+    serializers.EmailField: str,
+    serializers.SlugField: str,
+    serializers.IntegerField: int,
+    serializers.BooleanField: bool,
+}
+
+
+class _FieldExtractor(t.NamedTuple):
+    name: str
+    extract: Extractor
+    # Only generic extractors can skip their field, like `SkipField`.
+    may_skip: bool = False
+
+    @classmethod
+    def of(
+        cls,
+        field: serializers.Field,
+        extract: Extractor,
+        *,
+        may_skip: bool = False,
+    ) -> "_FieldExtractor":
+        return cls(t.cast(str, field.field_name), extract, may_skip)
+
+
+def is_compilable(serializer: t.Any) -> t.TypeGuard[serializers.ModelSerializer]:
+    return (
+        isinstance(serializer, serializers.ModelSerializer)
+        and type(serializer).to_representation
+        is serializers.Serializer.to_representation
+    )
+
+
+def _datetime_representation(
+    field: serializers.DateTimeField,
+) -> t.Callable[[t.Any], t.Any]:
+    output_format = getattr(
+        field,
+        "format",
+        drf_settings.api_settings.DATETIME_FORMAT,
+    )
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+    # Resolved once per compiled converter instead of once per value.
+    field_timezone: datetime.tzinfo | None = (
+        field.timezone if hasattr(field, "timezone") else field.default_timezone()  # pyright: ignore[reportAssignmentType]
+    )
+    if field_timezone is None:
+        return field.to_representation
+
+    def to_representation(value: t.Any) -> t.Any:
+        if not isinstance(value, datetime.datetime) or not timezone.is_aware(value):
+            return field.to_representation(value)
+        try:
+            output = value.astimezone(field_timezone).isoformat()
+        except OverflowError:
+            return field.to_representation(value)
+        return output[:-6] + "Z" if output.endswith("+00:00") else output
+
+    return to_representation
+
+
+def _get_representation(field: serializers.Field) -> t.Callable[[t.Any], t.Any]:
+    if (representation := _SIMPLE_REPRESENTATIONS.get(type(field))) is not None:
+        return representation
+    if type(field) is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        return str
+    if type(field) is serializers.DateTimeField:
+        return _datetime_representation(field)
+    return field.to_representation
+
+
+def _get_model_field(
+    model: type[models.Model],
+    field: serializers.Field,
+) -> models.Field[t.Any, t.Any] | None:
+    if len(field.source_attrs) != 1:
+        return None
+    try:
+        model_field = model._meta.get_field(field.source_attrs[0])  # noqa: SLF001
+    except django_exceptions.FieldDoesNotExist:
+        return None
+    if not getattr(model_field, "concrete", False):
+        return None
+    return t.cast(models.Field[t.Any, t.Any], model_field)
+
+
+def _is_pk_only(field: serializers.Field) -> bool:
+    return (
+        type(field) is relations.PrimaryKeyRelatedField
+        and field.pk_field is None
+        and field.use_pk_only_optimization()
+    )
+
+
+def _is_nested(field: serializers.Field) -> t.TypeGuard[serializers.ModelSerializer]:
+    return not isinstance(field, serializers.ListSerializer) and is_compilable(field)
+
+
+def _nullable(
+    getter: Extractor, representation: t.Callable[[t.Any], t.Any]
+) -> Extractor:
+    def extract(instance: t.Any) -> t.Any:
+        value = getter(instance)
+        return None if value is None else representation(value)
+
+    return extract
+
+
+def _generic(field: serializers.Field) -> _FieldExtractor:
+    # The same steps as `Serializer.to_representation` for a single field.
+    def extract(instance: t.Any) -> t.Any:
+        try:
+            attribute = field.get_attribute(instance)
+        except drf_fields.SkipField:
+            return _SKIP
+
+        if isinstance(attribute, relations.PKOnlyObject):
+            check_for_none = attribute.pk
+        else:
+            check_for_none = attribute
+        return None if check_for_none is None else field.to_representation(attribute)
+
+    return _FieldExtractor.of(field, extract, may_skip=True)
+
+
+def _many(field: serializers.ListSerializer, child: Converter) -> _FieldExtractor:
+    def extract(instance: t.Any) -> t.Any:
+        value = field.get_attribute(instance)
+        if value is None:
+            return None
+        if isinstance(value, models.Manager):
+            value = value.all()
+        return [child(item) for item in value]
+
+    return _FieldExtractor.of(field, extract)
+
+
+def _build_converter(extractors: list[_FieldExtractor]) -> Converter:
+    if any(extractor.may_skip for extractor in extractors):
+
+        def convert_with_skips(instance: t.Any) -> dict[str, t.Any]:
+            ret: dict[str, t.Any] = {}
+            for name, extract, _ in extractors:
+                value = extract(instance)
+                if value is not _SKIP:
+                    ret[name] = value
+            return ret
+
+        return convert_with_skips
+
+    pairs = [(name, extract) for name, extract, _ in extractors]
+
+    def convert(instance: t.Any) -> dict[str, t.Any]:
+        return {name: extract(instance) for name, extract in pairs}
+
+    return convert
+
+
+def _instance_extractor(
+    field: serializers.Field,
+    model: type[models.Model],
+) -> _FieldExtractor:
+    if isinstance(field, serializers.ListSerializer) and is_compilable(field.child):
+        return _many(field, compile_instance_converter(field.child))
+
+    model_field = _get_model_field(model, field)
+    if model_field is None:
+        return _generic(field)
+
+    if not model_field.is_relation:
+        getter = operator.attrgetter(model_field.attname)
+        return _FieldExtractor.of(
+            field,
+            _nullable(getter, _get_representation(field)),
+        )
+    if _is_pk_only(field):
+        return _FieldExtractor.of(
+            field,
+            operator.attrgetter(model_field.attname),
+        )
+    if _is_nested(field):
+        getter = operator.attrgetter(model_field.name)
+        return _FieldExtractor.of(
+            field,
+            _nullable(getter, compile_instance_converter(field)),
+        )
+    return _generic(field)
+
+
+def compile_instance_converter(serializer: serializers.ModelSerializer) -> Converter:
+    """
+    Compile the readable fields of a bound serializer into an instance converter.
+
+    Plain columns are read with `operator.attrgetter` and converted by type,
+    primary key related fields read the foreign key column and nested model
+    serializers are compiled recursively. Any other field falls back to its own
+    `get_attribute` and `to_representation`, so the output is identical to
+    `Serializer.to_representation`.
+
+    Args:
+        serializer (serializers.ModelSerializer): The bound serializer.
+
+    Returns:
+        Converter: A function from a model instance to a dict.
+    """
+    model = serializer.Meta.model
+    return _build_converter(
+        [
+            _instance_extractor(field, model)
+            for field in serializer._readable_fields  # noqa: SLF001
+        ],
+    )
+
+
+def compile_row_converter(
+    serializer: serializers.ModelSerializer,
+    prefix: str = "",
+) -> tuple[Converter, list[str]] | None:
+    """
+    Compile the readable fields of a bound serializer into a `values()` converter.
+
+    Args:
+        serializer (serializers.ModelSerializer): The bound serializer.
+        prefix (str): The lookup prefix of a nested serializer.
+
+    Returns:
+        tuple[Converter, list[str]] | None: A function from a row to a dict and
+            the names to pass to `values()`, or `None` when a field can not be
+            read from a row, such as a to-many relation or a property.
+    """
+    model = serializer.Meta.model
+    extractors: list[_FieldExtractor] = []
+    columns: list[str] = []
+
+    for field in serializer._readable_fields:  # noqa: SLF001
+        model_field = _get_model_field(model, field)
+        if model_field is None:
+            return None
+
+        key = f"{prefix}{model_field.name}"
+        columns.append(key)
+        if not model_field.is_relation:
+            extract = _nullable(operator.itemgetter(key), _get_representation(field))
+        elif _is_pk_only(field):
+            extract = operator.itemgetter(key)
+        elif _is_nested(field) and model_field.many_to_one:
+            nested = compile_row_converter(field, f"{key}__")
+            if nested is None:
+                return None
+            nested_convert, nested_columns = nested
+            columns.extend(nested_columns)
+            # The foreign key is `None` when there is no related row.
+            extract = functools.partial(_convert_nested_row, key, nested_convert)
+        else:
+            return None
+
+        extractors.append(_FieldExtractor.of(field, extract))
+
+    return _build_converter(extractors), columns
+
+
+def _convert_nested_row(
+    key: str,
+    convert: Converter,
+    row: dict[str, t.Any],
+) -> dict[str, t.Any] | None:
+    return None if row[key] is None else convert(row)
+
+
+class CompiledListSerializer(serializers.ListSerializer):
+    """
+    List serializer that renders its items with converters compiled from the child.
+
+    Opt in with `Meta.list_serializer_class` on a `ModelSerializer` whose
+    `to_representation` is not overridden. Items may be model instances or
+    `values()` rows from `get_values_fields`.
+    """
+
+    child: serializers.ModelSerializer
+
+    @functools.cached_property
+    def instance_converter(self) -> Converter:
+        return compile_instance_converter(self.child)
+
+    @functools.cached_property
+    def row_converter(self) -> Converter:
+        compiled = compile_row_converter(self.child)
+        if compiled is None:
+            msg = f"{type(self.child).__name__} can not be rendered from rows."
+            raise TypeError(msg)
+        return compiled[0]
+
+    def to_representation(self, data: t.Any) -> list[dict[str, t.Any]]:
+        if not is_compilable(self.child):
+            return super().to_representation(data)
+
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        return [
+            self.row_converter(item)
+            if isinstance(item, dict)
+            else self.instance_converter(item)
+            for item in iterable
+        ]
+
+
+def uses_compiled_list(serializer_class: type[serializers.BaseSerializer]) -> bool:
+    meta = getattr(serializer_class, "Meta", None)
+    list_serializer_class = getattr(meta, "list_serializer_class", None)
+    return isinstance(list_serializer_class, type) and issubclass(
+        list_serializer_class,
+        CompiledListSerializer,
+    )
+
+
+def get_values_fields(serializer: serializers.BaseSerializer) -> tuple[str, ...] | None:
+    """Get the `values()` names of a compiled list, `None` if unsupported."""
+    if not is_compilable(serializer):
+        return None
+    compiled = compile_row_converter(serializer)
+    return None if compiled is None else tuple(dict.fromkeys(compiled[1]))
@@ -0,0 +1,69 @@
+import time
+import typing as t
+
+import pytest
+from model_bakery import baker
+
+from server.app.authentication import models as auth_models
+from server.utils.django.tests import models as test_models
+from server.utils.rest_framework.serializers import base as base_serializers
+from server.utils.rest_framework.serializers import compiled
+
+ROWS = 10_000
+
+
+class MockSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockModel
+        fields = (*base_serializers.base_model_fields, "name")
+
+
+class MockCompiledSerializer(MockSerializer):
+    class Meta(MockSerializer.Meta):
+        list_serializer_class = compiled.CompiledListSerializer
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestCompiledSerializer:
+    @pytest.fixture(autouse=True)
+    def mock_models(self) -> None:
+        user = baker.make(auth_models.User)
+        test_models.MockModel.objects.bulk_create(
+            test_models.MockModel(name=f"name {i}", created_by=user, updated_by=user)
+            for i in range(ROWS)
+        )
+
+    def measure(self, label: str, serialize: t.Callable[[], t.Any]) -> t.Any:
+        start = time.perf_counter()
+        data = serialize()
+        elapsed = time.perf_counter() - start
+
+        print(f"\n{label}: {elapsed * 1000:,.0f} ms, {ROWS / elapsed:,.0f} rows/s")  # noqa: T201
+        return data
+
+    def test_serialize(self) -> None:
+        queryset = test_models.MockModel.objects.select_related(
+            "created_by",
+            "updated_by",
+        )
+        instances = list(queryset)
+        values_fields = compiled.get_values_fields(MockCompiledSerializer())
+        assert values_fields is not None
+        rows = list(queryset.values(*values_fields))
+
+        expected = self.measure(
+            "ModelSerializer",
+            lambda: MockSerializer(instances, many=True).data,
+        )
+        from_instances = self.measure(
+            "Compiled instances",
+            lambda: MockCompiledSerializer(instances, many=True).data,
+        )
+        from_rows = self.measure(
+            "Compiled values() rows",
+            lambda: MockCompiledSerializer(rows, many=True).data,
+        )
+
+        assert from_instances == expected
+        assert from_rows == expected
@@ -0,0 +1,65 @@
+import time
+import typing as t
+
+import pytest
+from model_bakery import baker
+from rest_framework import renderers, test
+from rest_framework import request as drf_request
+
+from server.app.authentication import models as auth_models
+from server.utils.django.tests import models as test_models
+from server.utils.rest_framework import pagination
+from server.utils.rest_framework import renderers as util_renderers
+from server.utils.rest_framework.serializers import base as base_serializers
+
+PAGE_SIZE = 1000
+ROUNDS = 50
+
+
+class MockSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockModel
+        fields = (*base_serializers.base_model_fields, "name")
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestRenderers:
+    @pytest.fixture
+    def payload(self) -> t.Any:
+        user = baker.make(auth_models.User)
+        test_models.MockModel.objects.bulk_create(
+            test_models.MockModel(name=f"name {i}", created_by=user, updated_by=user)
+            for i in range(PAGE_SIZE)
+        )
+        queryset = test_models.MockModel.objects.select_related(
+            "created_by",
+            "updated_by",
+        )
+        request = test.APIRequestFactory().get("/items", {"limit": PAGE_SIZE})
+
+        paginator = pagination.PageNumberPagination()
+        page = paginator.paginate_queryset(queryset, drf_request.Request(request))
+        data = MockSerializer(page, many=True).data
+        return paginator.get_paginated_response(data).data
+
+    @pytest.mark.parametrize(
+        "renderer_class",
+        [renderers.JSONRenderer, util_renderers.ORJSONRenderer],
+    )
+    def test_render_page(
+        self,
+        renderer_class: type[renderers.BaseRenderer],
+        payload: t.Any,
+    ) -> None:
+        renderer = renderer_class()
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            renderer.render(payload)
+        elapsed = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"\n{renderer_class.__name__}: "
+            f"{elapsed / ROUNDS * 1000:,.2f} ms per {PAGE_SIZE} row page",
+        )
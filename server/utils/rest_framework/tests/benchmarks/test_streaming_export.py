@@ -0,0 +1,75 @@
+import tracemalloc
+import typing as t
+
+import pytest
+from model_bakery import baker
+from rest_framework import mixins, test
+
+from server.app.authentication import models as auth_models
+from server.utils.django.tests import models as test_models
+from server.utils.rest_framework import viewsets as util_viewsets
+from server.utils.rest_framework.serializers import base as base_serializers
+
+BATCH_SIZE = 1000
+
+
+class MockSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockModel
+        fields = (*base_serializers.base_model_fields, "name")
+
+
+class MockViewSet(
+    util_viewsets.StreamingListMixin,
+    mixins.ListModelMixin,
+    util_viewsets.BaseGenericViewSet,
+):
+    queryset = test_models.MockModel.objects.all()
+    serializer_class = MockSerializer
+    pagination_class = None
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestStreamingExport:
+    @pytest.fixture
+    def user(self) -> auth_models.User:
+        return baker.make(auth_models.User)
+
+    def add_rows(self, user: auth_models.User, quantity: int) -> None:
+        for _ in range(quantity // BATCH_SIZE):
+            test_models.MockModel.objects.bulk_create(
+                test_models.MockModel(name="name", created_by=user, updated_by=user)
+                for _ in range(BATCH_SIZE)
+            )
+
+    def measure(self, user: auth_models.User, action: str) -> int:
+        request = test.APIRequestFactory().get("/items")
+        test.force_authenticate(request, user=user)
+        view: t.Any = MockViewSet.as_view({"get": action})
+
+        tracemalloc.start()
+        response = view(request)
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        else:
+            response.render()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    def test_peak_memory(self, user: auth_models.User) -> None:
+        peaks: dict[int, dict[str, int]] = {}
+        rows = 0
+        for quantity in (10_000, 50_000):
+            self.add_rows(user, quantity - rows)
+            rows = quantity
+            peaks[rows] = {
+                action: self.measure(user, action) for action in ("list", "export")
+            }
+            for action, peak in peaks[rows].items():
+                print(f"\n{action} {rows:,} rows: {peak / 2**20:,.1f} MiB peak")  # noqa: T201
+
+        assert peaks[50_000]["export"] < peaks[10_000]["export"] * 2
+        assert peaks[50_000]["export"] < peaks[50_000]["list"] / 4
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+from django.db import connection
+from django.test import utils as test_utils
+from model_bakery import baker
+from rest_framework import request as drf_request
+from rest_framework import serializers, test
+
+from server.app.authentication import models as auth_models
+from server.utils.django.tests import models as test_models
+from server.utils.rest_framework import fields as util_fields
+from server.utils.rest_framework import query_plan
+from server.utils.rest_framework.serializers import base as base_serializers
+
+PAGE_SIZE = 1000
+USERS = 5
+ROUNDS = 20
+
+
+class MockSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockModel
+        fields = (*base_serializers.base_model_fields, "name")
+
+
+class MockIdentitySerializer(MockSerializer):
+    created_by = base_serializers.UserActionLogIdentityField(
+        default=util_fields.CurrentUserDefault(),
+    )
+    updated_by = base_serializers.UserActionLogIdentityField(
+        default=util_fields.CurrentUserDefault(),
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestUserIdentityMap:
+    @pytest.fixture(autouse=True)
+    def mock_models(self) -> None:
+        users = baker.make(auth_models.User, _quantity=USERS)
+        test_models.MockModel.objects.bulk_create(
+            test_models.MockModel(
+                name=f"name {i}",
+                created_by=users[i % USERS],
+                updated_by=users[(i + 1) % USERS],
+            )
+            for i in range(PAGE_SIZE)
+        )
+
+    @pytest.mark.parametrize(
+        "serializer_class",
+        [MockSerializer, MockIdentitySerializer],
+    )
+    def test_serialize_page(
+        self,
+        serializer_class: type[serializers.ModelSerializer],
+    ) -> None:
+        plan = query_plan.get_query_plan(serializer_class)
+
+        start = time.perf_counter()
+        with test_utils.CaptureQueriesContext(connection) as queries:
+            for _ in range(ROUNDS):
+                request = drf_request.Request(test.APIRequestFactory().get("/items"))
+                page = list(plan.apply(test_models.MockModel.objects.all()))
+                _ = serializer_class(page, many=True, context={"request": request}).data
+        elapsed = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"\n{serializer_class.__name__}: "
+            f"{elapsed / ROUNDS * 1000:,.2f} ms per {PAGE_SIZE} row page, "
+            f"{len(queries) // ROUNDS} queries",
+        )
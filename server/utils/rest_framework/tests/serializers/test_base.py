@@ -1,11 +1,13 @@
 import pytest
 from model_bakery import baker
+from pytest_django import fixtures
 from rest_framework import request as drf_request
 from rest_framework import test
 
 from server.app.authentication import models as auth_models
 from server.utils.django.tests import models as test_models
 from server.utils.rest_framework import fields as util_fields
+from server.utils.rest_framework import query_plan
 from server.utils.rest_framework.serializers import base as base_serializers
 
 
@@ -15,6 +17,15 @@ class MockSerializer(base_serializers.BaseSerializer):
         fields = base_serializers.base_model_fields
 
 
+class MockIdentitySerializer(MockSerializer):
+    created_by = base_serializers.UserActionLogIdentityField(
+        default=util_fields.CurrentUserDefault(),
+    )
+    updated_by = base_serializers.UserActionLogIdentityField(
+        default=util_fields.CurrentUserDefault(),
+    )
+
+
 @pytest.fixture
 def factory() -> test.APIRequestFactory:
     return test.APIRequestFactory()
@@ -121,6 +132,146 @@ class TestBaseSerializer:
         assert serializer.data["updated_by"]["username"] == str(user.username)
 
 
+@pytest.mark.django_db
+class TestUserActionLogIdentityField:
+    @pytest.fixture
+    def mock_models(self, user: auth_models.User) -> list[test_models.MockModel]:
+        other_user = baker.make(auth_models.User)
+        return [
+            *baker.make(
+                test_models.MockModel,
+                created_by=user,
+                updated_by=other_user,
+                _quantity=3,
+            ),
+            baker.make(test_models.MockModel, created_by=None, updated_by=None),
+        ]
+
+    def test_load_page_once(
+        self,
+        mock_request: drf_request.Request,
+        mock_models: list[test_models.MockModel],
+        django_assert_num_queries: fixtures.DjangoAssertNumQueries,
+    ) -> None:
+        expected = MockSerializer(mock_models, many=True).data
+        instances = list(
+            test_models.MockModel.objects.filter(
+                pk__in=[mock_model.pk for mock_model in mock_models],
+            )
+        )
+        instances.sort(key=mock_models.index)
+
+        with django_assert_num_queries(1):
+            data = MockIdentitySerializer(
+                instances,
+                many=True,
+                context={"request": mock_request},
+            ).data
+
+        assert data == expected
+        assert data[0]["created_by"] is data[1]["created_by"]
+        assert data[-1]["created_by"] is None
+
+    def test_identity_map_per_request(
+        self,
+        mock_request: drf_request.Request,
+        mock_models: list[test_models.MockModel],
+        django_assert_num_queries: fixtures.DjangoAssertNumQueries,
+    ) -> None:
+        _ = MockIdentitySerializer(
+            mock_models,
+            many=True,
+            context={"request": mock_request},
+        ).data
+
+        with django_assert_num_queries(0):
+            data = MockIdentitySerializer(
+                mock_models[0],
+                context={"request": mock_request},
+            ).data
+
+        assert data["created_by"] == MockSerializer(mock_models[0]).data["created_by"]
+
+    def test_no_join(self) -> None:
+        plan = query_plan.get_query_plan(MockIdentitySerializer)
+
+        assert plan.select_related == ()
+        assert {"created_by", "updated_by"} <= set(plan.only)
+
+    def test_create_with_user(
+        self,
+        mock_request: drf_request.Request,
+        user: auth_models.User,
+    ) -> None:
+        serializer = MockIdentitySerializer(data={}, context={"request": mock_request})
+        serializer.is_valid()
+
+        assert serializer.data["created_by"]["username"] == str(user.username)
+        assert serializer.data["updated_by"]["username"] == str(user.username)
+
+
+class TestSparseFieldset:
+    def get_request(
+        self, factory: test.APIRequestFactory, path: str
+    ) -> drf_request.Request:
+        return drf_request.Request(factory.get(path))
+
+    def test_without_params(self, factory: test.APIRequestFactory) -> None:
+        request = self.get_request(factory, "/")
+
+        assert base_serializers.get_sparse_fieldset(request) == (
+            base_serializers.SparseFieldset()
+        )
+
+    def test_fields(self, factory: test.APIRequestFactory) -> None:
+        request = self.get_request(factory, "/?fields=id,created_by")
+        serializer = MockSerializer(context={"request": request})
+
+        assert list(serializer.fields) == ["id", "created_by"]
+
+    def test_fields_with_spaces(self, factory: test.APIRequestFactory) -> None:
+        request = self.get_request(factory, "/?fields= id , created_by ,,")
+        serializer = MockSerializer(context={"request": request})
+
+        assert list(serializer.fields) == ["id", "created_by"]
+
+    def test_omit(self, factory: test.APIRequestFactory) -> None:
+        request = self.get_request(factory, "/?omit=created_by,updated_by")
+        serializer = MockSerializer(context={"request": request})
+
+        assert list(serializer.fields) == ["id", "created_at", "updated_at"]
+
+    def test_nested_serializers_keep_fields(
+        self,
+        factory: test.APIRequestFactory,
+    ) -> None:
+        request = self.get_request(factory, "/?fields=created_by")
+        serializer = MockSerializer(context={"request": request})
+
+        created_by = serializer.fields["created_by"]
+        assert isinstance(created_by, base_serializers.UserActionLogSerializer)
+        assert len(created_by.fields) == 4  # noqa: PLR2004
+
+    def test_list_child(self, factory: test.APIRequestFactory) -> None:
+        request = self.get_request(factory, "/?fields=id")
+        serializer = MockSerializer(many=True, context={"request": request})
+
+        assert list(serializer.child.fields) == ["id"]  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_ignored_on_write(self, factory: test.APIRequestFactory) -> None:
+        request = drf_request.Request(factory.post("/?fields=id"))
+        serializer = MockSerializer(context={"request": request})
+
+        assert len(serializer.fields) == len(base_serializers.base_model_fields)
+
+    def test_explicit_fieldset(self) -> None:
+        serializer = MockSerializer(
+            sparse_fieldset=base_serializers.SparseFieldset(omit=frozenset({"id"})),
+        )
+
+        assert "id" not in serializer.fields
+
+
 class TestBaseModelFields:
     def test_base_model_fields(self) -> None:
         expected_fields = ("id", "created_at", "updated_at", "created_by", "updated_by")
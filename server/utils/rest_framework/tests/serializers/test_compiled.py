@@ -0,0 +1,163 @@
+import typing as t
+
+import pytest
+from model_bakery import baker
+from rest_framework import mixins, serializers, status, test
+
+from server.app.authentication import models as auth_models
+from server.utils.django.tests import models as test_models
+from server.utils.rest_framework import query_plan
+from server.utils.rest_framework import viewsets as util_viewsets
+from server.utils.rest_framework.serializers import base as base_serializers
+from server.utils.rest_framework.serializers import compiled
+
+
+class MockSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockModel
+        fields = (*base_serializers.base_model_fields, "name")
+
+
+class MockCompiledSerializer(MockSerializer):
+    class Meta(MockSerializer.Meta):
+        list_serializer_class = compiled.CompiledListSerializer
+
+
+class MockChildSerializer(base_serializers.BaseSerializer):
+    label = serializers.SerializerMethodField()
+
+    class Meta:
+        model = test_models.MockChildModel
+        fields = (*base_serializers.base_model_fields, "name", "parent", "label")
+        list_serializer_class = compiled.CompiledListSerializer
+
+    def get_label(self, obj: test_models.MockChildModel) -> str:
+        return f"{obj.name}: {obj.description}"
+
+
+class MockParentSerializer(base_serializers.BaseSerializer):
+    children = MockSerializer(many=True, read_only=True, source="children.all")
+
+    class Meta:
+        model = test_models.MockParentModel
+        fields = (*base_serializers.base_model_fields, "name")
+        list_serializer_class = compiled.CompiledListSerializer
+
+
+@pytest.fixture
+def user() -> auth_models.User:
+    return baker.make(auth_models.User)
+
+
+@pytest.fixture
+def mock_models(user: auth_models.User) -> list[test_models.MockModel]:
+    return [
+        *baker.make(
+            test_models.MockModel,
+            created_by=user,
+            updated_by=user,
+            _quantity=2,
+        ),
+        baker.make(test_models.MockModel, created_by=None, updated_by=None),
+    ]
+
+
+@pytest.mark.django_db
+class TestCompiledListSerializer:
+    def test_instances(self, mock_models: list[test_models.MockModel]) -> None:
+        expected = MockSerializer(mock_models, many=True).data
+
+        assert MockCompiledSerializer(mock_models, many=True).data == expected
+
+    def test_rows(self, mock_models: list[test_models.MockModel]) -> None:
+        values_fields = compiled.get_values_fields(MockCompiledSerializer())
+        assert values_fields is not None
+        rows = test_models.MockModel.objects.values(*values_fields)
+
+        data = MockCompiledSerializer(rows, many=True).data
+
+        expected = MockSerializer(test_models.MockModel.objects.all(), many=True).data
+        assert data == expected
+        assert any(item["created_by"] is None for item in data)
+
+    def test_generic_fields(self, user: auth_models.User) -> None:
+        children = baker.make(
+            test_models.MockChildModel,
+            description="text",
+            created_by=user,
+            _quantity=2,
+        )
+
+        data = MockChildSerializer(children, many=True).data
+
+        assert data[0]["parent"] == children[0].parent.pk
+        assert data[0]["label"] == f"{children[0].name}: text"
+        assert compiled.get_values_fields(MockChildSerializer()) is None
+
+    def test_to_many(self, user: auth_models.User) -> None:
+        parent = baker.make(test_models.MockParentModel, created_by=user)
+        baker.make(test_models.MockChildModel, parent=parent, _quantity=2)
+
+        class MockNestedSerializer(MockParentSerializer):
+            children = MockChildSerializer(many=True, read_only=True)
+
+            class Meta(MockParentSerializer.Meta):
+                fields = (*MockParentSerializer.Meta.fields, "children")
+
+        data = MockNestedSerializer([parent], many=True).data
+
+        assert len(data[0]["children"]) == 2  # noqa: PLR2004
+        assert data[0]["children"][0]["parent"] == parent.pk
+        assert compiled.get_values_fields(MockNestedSerializer()) is None
+
+    def test_rows_unsupported(self) -> None:
+        baker.make(test_models.MockChildModel)
+        serializer = MockChildSerializer(
+            test_models.MockChildModel.objects.values("id"),
+            many=True,
+        )
+
+        with pytest.raises(TypeError):
+            _ = serializer.data
+
+    def test_custom_representation(
+        self,
+        mock_models: list[test_models.MockModel],
+    ) -> None:
+        class MockRepresentationSerializer(MockCompiledSerializer):
+            def to_representation(self, instance: t.Any) -> t.Any:
+                return {"name": instance.name}
+
+        data = MockRepresentationSerializer(mock_models, many=True).data
+
+        assert data == [{"name": mock_model.name} for mock_model in mock_models]
+
+
+@pytest.mark.django_db
+class TestBaseGenericViewSetCompiled:
+    def test_list_values(
+        self,
+        user: auth_models.User,
+        mock_models: list[test_models.MockModel],
+    ) -> None:
+        class MockViewSet(mixins.ListModelMixin, util_viewsets.BaseGenericViewSet):
+            queryset = test_models.MockModel.objects.all()
+            serializer_class = MockCompiledSerializer
+
+        assert query_plan.get_query_plan(MockCompiledSerializer).values_fields
+        request = test.APIRequestFactory().get("/mocks")
+        test.force_authenticate(request, user=user)
+
+        view: t.Any = MockViewSet.as_view({"get": "list"})
+        response = view(request)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_200_OK
+        expected = MockSerializer(
+            test_models.MockModel.objects.order_by("-created_at"),
+            many=True,
+        ).data
+        assert response_data["results"] == expected
+        assert {str(mock_model.pk) for mock_model in mock_models} == {
+            item["id"] for item in response_data["results"]
+        }
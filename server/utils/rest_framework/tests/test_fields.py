@@ -1,7 +1,13 @@
+import typing as t
+
 import pytest
+from django.contrib.auth import models as django_auth_models
 from model_bakery import baker
+from pytest_django import fixtures
 from rest_framework import request as drf_request
 from rest_framework import serializers, test
+from rest_framework_simplejwt import models as jwt_models
+from rest_framework_simplejwt import tokens
 
 from server.app.authentication import models as auth_models
 from server.utils.rest_framework import fields as util_fields
@@ -36,3 +42,39 @@ class TestCurrentUserDefault:
     def test_current_user_default_without_request(self) -> None:
         serializer = MockSerializer()
         assert serializer.fields["user"].get_default() is None
+
+    def test_current_user_default_with_token_user(
+        self,
+        mock_request: drf_request.Request,
+    ) -> None:
+        user = t.cast(auth_models.User, mock_request.user)
+        token_user = jwt_models.TokenUser(tokens.AccessToken.for_user(user))
+        mock_request.user = token_user  # pyright: ignore[reportAttributeAccessIssue]
+        serializer = MockSerializer(context={"request": mock_request})
+
+        assert serializer.fields["user"].get_default() == user
+
+
+@pytest.mark.django_db
+class TestGetActionUser:
+    def test_user(self) -> None:
+        user = baker.make(auth_models.User)
+
+        assert util_fields.get_action_user(user) is user
+
+    def test_token_user(
+        self,
+        django_assert_num_queries: fixtures.DjangoAssertNumQueries,
+    ) -> None:
+        user = baker.make(auth_models.User)
+        token_user = jwt_models.TokenUser(tokens.AccessToken.for_user(user))
+
+        with django_assert_num_queries(0):
+            action_user = util_fields.get_action_user(token_user)
+
+        assert isinstance(action_user, auth_models.User)
+        assert action_user.pk == user.pk
+        assert action_user.username == user.username
+
+    def test_anonymous_user(self) -> None:
+        assert util_fields.get_action_user(django_auth_models.AnonymousUser()) is None
@@ -1,10 +1,18 @@
 import typing as t
+import urllib.parse
+from unittest import mock
 
 import pytest
+import time_machine
 from django.core import paginator as django_paginator
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import exceptions, test
 from rest_framework import request as drf_request
-from rest_framework import test
 
+from server.utils.django.tests import models as test_models
 from server.utils.rest_framework import pagination as util_pagination
 
 
@@ -13,6 +21,13 @@ def factory() -> test.APIRequestFactory:
     return test.APIRequestFactory()
 
 
+@pytest.fixture
+def clear_cache() -> t.Generator[None, None, None]:
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def pagination() -> util_pagination.PageNumberPagination:
     return util_pagination.PageNumberPagination()
@@ -170,3 +185,463 @@ class TestPageNumberPagination:
             assert f"page={expected_previous}" in links["previous"]
         else:
             assert links["previous"] is None
+
+    def test_paginated_response_not_estimated(
+        self,
+        paginated_request: util_pagination.PageNumberPagination,
+    ) -> None:
+        response = paginated_request.get_paginated_response(data=[1, 2, 3])
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response_data["estimated"] is False
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("clear_cache")
+    def test_count_strategy_from_settings(
+        self,
+        factory: test.APIRequestFactory,
+        pagination: util_pagination.PageNumberPagination,
+        settings: t.Any,
+    ) -> None:
+        settings.PAGINATION_COUNT_STRATEGY = "cached"
+        request = drf_request.Request(factory.get("/api/items"))
+
+        pagination.paginate_queryset(test_models.MockModel.objects.all(), request)
+
+        assert isinstance(
+            pagination.page.paginator,
+            util_pagination.CountStrategyPaginator,
+        )
+        assert pagination.page.paginator.count_strategy == "cached"
+
+    @pytest.mark.django_db
+    def test_zero_overrides_settings(
+        self,
+        factory: test.APIRequestFactory,
+        settings: t.Any,
+    ) -> None:
+        settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD = 100
+        settings.PAGINATION_COUNT_CACHE_TIMEOUT = 60
+        pagination = util_pagination.PageNumberPagination()
+        pagination.count_estimate_threshold = 0
+        pagination.count_cache_timeout = 0
+        request = drf_request.Request(factory.get("/api/items"))
+
+        pagination.paginate_queryset(test_models.MockModel.objects.all(), request)
+        paginator = t.cast(
+            util_pagination.CountStrategyPaginator,
+            pagination.page.paginator,
+        )
+
+        assert paginator.estimate_threshold == 0
+        assert paginator.cache_timeout == 0
+
+
+@pytest.mark.django_db
+class TestCountStrategyPaginator:
+    def test_exact_count(self) -> None:
+        baker.make(test_models.MockModel, _quantity=3)
+        paginator = util_pagination.CountStrategyPaginator(
+            test_models.MockModel.objects.all(),
+            per_page=2,
+        )
+
+        assert paginator.count == 3  # noqa: PLR2004
+        assert paginator.num_pages == 2  # noqa: PLR2004
+        assert paginator.count_estimated is False
+
+    def test_estimate_falls_back_to_exact_count_on_sqlite(self) -> None:
+        baker.make(test_models.MockModel, _quantity=3)
+        paginator = util_pagination.CountStrategyPaginator(
+            test_models.MockModel.objects.all(),
+            per_page=2,
+            count_strategy="estimate",
+            estimate_threshold=0,
+        )
+
+        assert paginator.count == 3  # noqa: PLR2004
+        assert paginator.count_estimated is False
+
+    @pytest.mark.parametrize(
+        ("estimate", "expected_count", "expected_estimated"),
+        [(1_000_000, 1_000_000, True), (50, 3, False)],
+    )
+    def test_estimate_threshold(
+        self,
+        estimate: int,
+        expected_count: int,
+        expected_estimated: bool,  # noqa: FBT001
+    ) -> None:
+        baker.make(test_models.MockModel, _quantity=3)
+        paginator = util_pagination.CountStrategyPaginator(
+            test_models.MockModel.objects.all(),
+            per_page=2,
+            count_strategy="estimate",
+            estimate_threshold=100,
+        )
+
+        with mock.patch.object(
+            paginator,
+            "get_estimated_count",
+            return_value=estimate,
+        ):
+            assert paginator.count == expected_count
+
+        assert paginator.count_estimated is expected_estimated
+
+    def test_estimate_below_real_count_keeps_trailing_pages(self) -> None:
+        baker.make(test_models.MockModel, _quantity=5)
+        paginator = util_pagination.CountStrategyPaginator(
+            test_models.MockModel.objects.order_by("name"),
+            per_page=2,
+            count_strategy="estimate",
+            estimate_threshold=1,
+        )
+
+        with mock.patch.object(paginator, "get_estimated_count", return_value=2):
+            assert paginator.num_pages == 1
+            pages = [paginator.page(number) for number in (1, 2, 3)]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [page.has_next() for page in pages] == [True, True, False]
+        with pytest.raises(django_paginator.EmptyPage):
+            paginator.page(4)
+
+    def test_estimate_validates_page_number(self) -> None:
+        paginator = util_pagination.CountStrategyPaginator(
+            test_models.MockModel.objects.all(),
+            per_page=2,
+            count_strategy="estimate",
+            estimate_threshold=1,
+        )
+
+        with mock.patch.object(paginator, "get_estimated_count", return_value=10):
+            assert paginator.validate_number("100") == 100  # noqa: PLR2004
+            with pytest.raises(django_paginator.PageNotAnInteger):
+                paginator.validate_number("x")
+            with pytest.raises(django_paginator.EmptyPage):
+                paginator.validate_number(0)
+
+    @pytest.mark.usefixtures("clear_cache")
+    def test_cached_count(self) -> None:
+        baker.make(test_models.MockModel, _quantity=3)
+
+        def make_paginator() -> util_pagination.CountStrategyPaginator:
+            return util_pagination.CountStrategyPaginator(
+                test_models.MockModel.objects.filter(name__isnull=False),
+                per_page=2,
+                count_strategy="cached",
+            )
+
+        miss = make_paginator()
+        assert miss.count == 3  # noqa: PLR2004
+        assert miss.count_estimated is False
+
+        baker.make(test_models.MockModel)
+        hit = make_paginator()
+        with CaptureQueriesContext(connection) as queries:
+            assert hit.count == 3  # noqa: PLR2004
+
+        assert hit.count_estimated is False
+        assert len(queries) == 0
+
+    @pytest.mark.usefixtures("clear_cache")
+    def test_cached_count_per_filter_signature(self) -> None:
+        baker.make(test_models.MockModel, name="a", _quantity=2)
+        baker.make(test_models.MockModel, name="b")
+
+        counts = [
+            util_pagination.CountStrategyPaginator(
+                test_models.MockModel.objects.filter(name=name),
+                per_page=2,
+                count_strategy="cached",
+            ).count
+            for name in ("a", "b")
+        ]
+
+        assert counts == [2, 1]
+
+    def test_list_object_uses_len(self) -> None:
+        paginator = util_pagination.CountStrategyPaginator(
+            list(range(5)),
+            per_page=2,
+            count_strategy="cached",
+        )
+
+        assert paginator.count == 5  # noqa: PLR2004
+        assert paginator.count_estimated is False
+
+
+def look_ahead_paginate(
+    factory: test.APIRequestFactory,
+    url: str,
+) -> tuple[util_pagination.LookAheadPagination, list[test_models.MockModel]]:
+    pagination = util_pagination.LookAheadPagination()
+    request = drf_request.Request(factory.get(url))
+    queryset = test_models.MockModel.objects.order_by("name")
+    page = pagination.paginate_queryset(queryset, request)
+    assert page is not None
+    return pagination, page
+
+
+@pytest.mark.django_db
+class TestLookAheadPagination:
+    @pytest.fixture
+    def mock_instances(self) -> list[test_models.MockModel]:
+        return [
+            baker.make(test_models.MockModel, name=f"item-{index:02}")
+            for index in range(7)
+        ]
+
+    @pytest.mark.parametrize(
+        ("page_number", "expected_slice", "expected_previous", "expected_next"),
+        [
+            (1, slice(0, 3), None, 2),
+            (2, slice(3, 6), 1, 3),
+            (3, slice(6, 7), 2, None),
+        ],
+    )
+    def test_pages(  # noqa: PLR0913
+        self,
+        factory: test.APIRequestFactory,
+        mock_instances: list[test_models.MockModel],
+        page_number: int,
+        expected_slice: slice,
+        expected_previous: int | None,
+        expected_next: int | None,
+    ) -> None:
+        pagination, page = look_ahead_paginate(
+            factory,
+            f"/api/items?limit=3&page={page_number}",
+        )
+
+        assert page == mock_instances[expected_slice]
+
+        next_link = pagination.get_next_link()
+        if expected_next:
+            assert next_link is not None
+            assert f"page={expected_next}" in next_link
+        else:
+            assert next_link is None
+
+        previous_link = pagination.get_previous_link()
+        if expected_previous == 1:
+            assert previous_link == "http://testserver/api/items?limit=3"
+        elif expected_previous:
+            assert previous_link is not None
+            assert f"page={expected_previous}" in previous_link
+        else:
+            assert previous_link is None
+
+    @pytest.mark.usefixtures("mock_instances")
+    def test_single_query_without_count(
+        self,
+        factory: test.APIRequestFactory,
+    ) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            look_ahead_paginate(factory, "/api/items?limit=3&page=2")
+
+        assert len(queries) == 1
+        assert "COUNT(" not in queries[0]["sql"].upper()
+
+    @pytest.mark.parametrize("page_number", ["0", "-1", "invalid", "last", "4"])
+    @pytest.mark.usefixtures("mock_instances")
+    def test_invalid_page(
+        self,
+        factory: test.APIRequestFactory,
+        page_number: str,
+    ) -> None:
+        with pytest.raises(exceptions.NotFound):
+            look_ahead_paginate(factory, f"/api/items?limit=3&page={page_number}")
+
+    def test_empty_first_page(self, factory: test.APIRequestFactory) -> None:
+        pagination, page = look_ahead_paginate(factory, "/api/items")
+
+        assert page == []
+        assert pagination.get_next_link() is None
+        assert pagination.get_previous_link() is None
+
+    @pytest.mark.usefixtures("mock_instances")
+    def test_paginated_response_structure(
+        self,
+        factory: test.APIRequestFactory,
+    ) -> None:
+        pagination, page = look_ahead_paginate(factory, "/api/items?limit=3&page=2")
+
+        response = pagination.get_paginated_response(data=[obj.name for obj in page])
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response_data["page"] == 2  # noqa: PLR2004
+        assert response_data["limit"] == 3  # noqa: PLR2004
+        assert response_data["results"] == ["item-03", "item-04", "item-05"]
+        assert "count" not in response_data
+        assert "last" not in response_data
+        assert set(response_data["links"]) == {"first", "previous", "current", "next"}
+
+    def test_schema_generation(self) -> None:
+        pagination = util_pagination.LookAheadPagination()
+        test_schema = {"type": "array", "items": {"type": "integer"}}
+
+        schema = pagination.get_paginated_response_schema(test_schema)
+
+        assert schema["required"] == ["page", "limit", "results"]
+        assert set(schema["properties"]) == {"page", "limit", "results", "links"}
+        links = schema["properties"]["links"]
+        assert links["required"] == ["first", "previous", "current", "next"]
+        assert "last" not in links["properties"]
+
+
+@pytest.fixture
+def keyset_pagination() -> util_pagination.KeysetPagination:
+    return util_pagination.KeysetPagination()
+
+
+@pytest.fixture
+def mock_instances() -> list[test_models.MockModel]:
+    instances = []
+    for day in range(1, 6):
+        with time_machine.travel(f"2024-01-0{day} 12:00:00"):
+            # Two rows per timestamp, so the `id` tiebreaker is exercised.
+            instances += baker.make(test_models.MockModel, _quantity=2)
+    return sorted(instances, key=lambda obj: (obj.created_at, obj.id), reverse=True)
+
+
+def paginate(
+    factory: test.APIRequestFactory,
+    url: str,
+) -> tuple[util_pagination.KeysetPagination, list[test_models.MockModel]]:
+    pagination = util_pagination.KeysetPagination()
+    request = drf_request.Request(factory.get(url))
+    page = pagination.paginate_queryset(test_models.MockModel.objects.all(), request)
+    assert page is not None
+    return pagination, page
+
+
+def get_path(url: str) -> str:
+    parsed = urllib.parse.urlsplit(url)
+    return f"{parsed.path}?{parsed.query}"
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def test_page_size_query_param(
+        self,
+        keyset_pagination: util_pagination.KeysetPagination,
+    ) -> None:
+        assert keyset_pagination.page_size_query_param == "limit"
+        assert keyset_pagination.max_page_size == 1000  # noqa: PLR2004
+
+    def test_first_page(
+        self,
+        factory: test.APIRequestFactory,
+        mock_instances: list[test_models.MockModel],
+    ) -> None:
+        pagination, page = paginate(factory, "/api/items?limit=3")
+
+        assert page == mock_instances[:3]
+        assert pagination.get_previous_link() is None
+        assert pagination.get_next_link() is not None
+
+    def test_walk_forward_through_all_pages(
+        self,
+        factory: test.APIRequestFactory,
+        mock_instances: list[test_models.MockModel],
+    ) -> None:
+        url: str | None = "/api/items?limit=3"
+        results: list[test_models.MockModel] = []
+        while url is not None:
+            pagination, page = paginate(factory, url)
+            results += page
+            next_link = pagination.get_next_link()
+            url = get_path(next_link) if next_link else None
+
+        assert results == mock_instances
+
+    def test_walk_backward_with_previous_link(
+        self,
+        factory: test.APIRequestFactory,
+        mock_instances: list[test_models.MockModel],
+    ) -> None:
+        pagination, _ = paginate(factory, "/api/items?limit=3")
+        next_link = pagination.get_next_link()
+        assert next_link is not None
+
+        pagination, page = paginate(factory, get_path(next_link))
+        assert page == mock_instances[3:6]
+
+        previous_link = pagination.get_previous_link()
+        assert previous_link is not None
+        pagination, page = paginate(factory, get_path(previous_link))
+
+        assert page == mock_instances[:3]
+        assert pagination.get_previous_link() is None
+        assert pagination.get_next_link() is not None
+
+    def test_last_page(
+        self,
+        factory: test.APIRequestFactory,
+        mock_instances: list[test_models.MockModel],
+    ) -> None:
+        pagination, _ = paginate(factory, "/api/items?limit=3")
+
+        pagination, page = paginate(factory, get_path(pagination.get_last_link()))
+
+        assert page == mock_instances[-3:]
+        assert pagination.get_next_link() is None
+        assert pagination.get_previous_link() is not None
+
+    def test_invalid_cursor(self, factory: test.APIRequestFactory) -> None:
+        with pytest.raises(exceptions.NotFound):
+            paginate(factory, "/api/items?cursor=invalid")
+
+    @pytest.mark.usefixtures("mock_instances")
+    def test_single_query_without_count_or_offset(
+        self,
+        factory: test.APIRequestFactory,
+    ) -> None:
+        pagination, _ = paginate(factory, "/api/items?limit=3")
+        next_link = pagination.get_next_link()
+        assert next_link is not None
+
+        with CaptureQueriesContext(connection) as queries:
+            paginate(factory, get_path(next_link))
+
+        assert len(queries) == 1
+        sql = queries[0]["sql"].upper()
+        assert "COUNT(" not in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.usefixtures("mock_instances")
+    def test_paginated_response_structure(
+        self,
+        factory: test.APIRequestFactory,
+    ) -> None:
+        pagination, page = paginate(factory, "/api/items?limit=3")
+
+        response = pagination.get_paginated_response(data=[obj.name for obj in page])
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response_data["limit"] == 3  # noqa: PLR2004
+        assert len(response_data["results"]) == 3  # noqa: PLR2004
+        assert "count" not in response_data
+        links = response_data["links"]
+        assert links["first"] == "http://testserver/api/items?limit=3"
+        assert links["previous"] is None
+        assert links["current"] == "http://testserver/api/items?limit=3"
+        assert "cursor=" in links["next"]
+        assert "cursor=" in links["last"]
+
+    def test_schema_generation(
+        self,
+        keyset_pagination: util_pagination.KeysetPagination,
+    ) -> None:
+        test_schema = {"type": "array", "items": {"type": "integer"}}
+        schema = keyset_pagination.get_paginated_response_schema(test_schema)
+
+        assert schema["required"] == ["limit", "results"]
+        assert "count" not in schema["properties"]
+        assert schema["properties"]["results"] == test_schema
+
+        links = schema["properties"]["links"]["properties"]
+        assert set(links) == {"first", "previous", "current", "next", "last"}
+        assert "cursor=" in links["next"]["example"]
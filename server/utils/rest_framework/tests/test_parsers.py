@@ -1,9 +1,15 @@
+import io
 import typing as t
 from unittest import mock
 
 import pytest
+from django import http
+from django.core import exceptions as django_exceptions
+from django.core.files import uploadedfile, uploadhandler
 from django.http import HttpRequest
-from rest_framework import parsers
+from django.utils import datastructures
+from rest_framework import exceptions, parsers, test
+from rest_framework import request as drf_request
 
 from server.utils.rest_framework import parsers as util_parsers
 
@@ -19,6 +25,94 @@ def mock_parse() -> t.Generator[mock.MagicMock, None, None]:
         yield mocker
 
 
+class MockView:
+    multipart_json_fields = ("user",)
+
+
+BOUNDARY = "BoUnDaRy"
+
+ParseMultipart = t.Callable[[dict[str, t.Any]], drf_request.Request]
+
+
+@pytest.fixture
+def parse_multipart() -> t.Generator[ParseMultipart, None, None]:
+    requests: list[drf_request.Request] = []
+
+    def _parse_multipart(data: dict[str, t.Any]) -> drf_request.Request:
+        request = drf_request.Request(
+            test.APIRequestFactory().post("/", data, format="multipart"),
+            parsers=[util_parsers.StreamingMultipartJsonParser()],
+            parser_context={"view": MockView()},
+        )
+        requests.append(request)
+        _ = request.data
+        return request
+
+    yield _parse_multipart
+
+    for request in requests:
+        for upload in request.FILES.values():
+            upload.close()
+
+
+def multipart_body(*parts: tuple[str, str | None, bytes]) -> bytes:
+    body = b""
+    for name, content_type, content in parts:
+        body += f"--{BOUNDARY}\r\n".encode()
+        body += f'Content-Disposition: form-data; name="{name}"\r\n'.encode()
+        if content_type:
+            body += f"Content-Type: {content_type}\r\n".encode()
+        body += b"\r\n" + content + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+def parse_body(
+    body: bytes,
+    chunk_size: int | None = None,
+) -> tuple[http.QueryDict, datastructures.MultiValueDict]:
+    handler = uploadhandler.MemoryFileUploadHandler()
+    handler.activated = True
+    if chunk_size is not None:
+        handler.chunk_size = chunk_size
+    meta = {
+        "CONTENT_TYPE": f"multipart/form-data; boundary={BOUNDARY}",
+        "CONTENT_LENGTH": len(body),
+    }
+    return util_parsers.JsonMultiPartParser(meta, io.BytesIO(body), [handler]).parse()
+
+
+def json_file(name: str, content: bytes) -> uploadedfile.SimpleUploadedFile:
+    return uploadedfile.SimpleUploadedFile(
+        name,
+        content,
+        content_type="application/json",
+    )
+
+
+class TestORJSONParser:
+    def test_parse(self) -> None:
+        stream = io.BytesIO('{"name": "中文", "items": [1, 2.5, null]}'.encode())
+
+        result = util_parsers.ORJSONParser().parse(stream)
+
+        assert result == {"name": "中文", "items": [1, 2.5, None]}
+
+    def test_parse_encoding(self) -> None:
+        stream = io.BytesIO('{"name": "café"}'.encode("latin-1"))
+
+        result = util_parsers.ORJSONParser().parse(
+            stream,
+            parser_context={"encoding": "latin-1"},
+        )
+
+        assert result == {"name": "café"}
+
+    @pytest.mark.parametrize("content", [b"{invalid}", b'{"value": NaN}'])
+    def test_parse_error(self, content: bytes) -> None:
+        with pytest.raises(exceptions.ParseError):
+            util_parsers.ORJSONParser().parse(io.BytesIO(content))
+
+
 class TestMultipartJsonParser:
     def test_parse_regular_form_data(
         self,
@@ -129,3 +223,95 @@ class TestMultipartJsonParser:
             mock_stream, media_type=media_type, parser_context=parser_context
         )
         assert result.data == {"data": {"key": "value"}}
+
+
+class TestStreamingMultipartJsonParser:
+    def test_parse_regular_form_data(self, parse_multipart: ParseMultipart) -> None:
+        request = parse_multipart({"name": "John", "age": "30"})
+
+        assert isinstance(request.data, http.QueryDict)
+        assert request.data.dict() == {"name": "John", "age": "30"}
+
+    def test_parse_json_fields(self, parse_multipart: ParseMultipart) -> None:
+        request = parse_multipart(
+            {
+                "user": '{"name": "John", "age": 30}',
+                "preferences": '["reading", "gaming"]',
+            },
+        )
+
+        assert request.data["user"] == {"name": "John", "age": 30}
+        assert request.data["preferences"] == '["reading", "gaming"]'
+
+    def test_parse_invalid_json_field(self, parse_multipart: ParseMultipart) -> None:
+        with pytest.raises(exceptions.ParseError, match="'user'"):
+            parse_multipart({"user": "{invalid_json}"})
+
+    def test_parse_multiple_values(self, parse_multipart: ParseMultipart) -> None:
+        request = parse_multipart({"tags": ["a", "b"], "name": "John"})
+        data = t.cast(http.QueryDict, request.data)
+
+        assert data.getlist("tags") == ["a", "b"]
+        assert data.getlist("name") == ["John"]
+
+    def test_parse_json_parts_and_files(
+        self,
+        parse_multipart: ParseMultipart,
+    ) -> None:
+        request = parse_multipart(
+            {
+                "title": "Document",
+                "metadata": [
+                    json_file("blob", b'{"tags": ["important"]}'),
+                    json_file("blob", b"[1, 2]"),
+                ],
+                "document": uploadedfile.SimpleUploadedFile("document.txt", b"content"),
+            },
+        )
+
+        data = t.cast(http.QueryDict, request.data)
+        assert data["title"] == "Document"
+        assert data.getlist("metadata") == [{"tags": ["important"]}, [1, 2]]
+        assert list(request.FILES) == ["document"]
+        assert request.FILES["document"].read() == b"content"
+
+    def test_parse_invalid_json_part(self, parse_multipart: ParseMultipart) -> None:
+        with pytest.raises(exceptions.ParseError, match="'metadata'"):
+            parse_multipart({"metadata": json_file("blob", b"{invalid_json}")})
+
+    def test_parse_too_big_json_part(
+        self,
+        parse_multipart: ParseMultipart,
+        settings: t.Any,
+    ) -> None:
+        settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 10
+
+        with pytest.raises(django_exceptions.RequestDataTooBig):
+            parse_multipart({"metadata": json_file("blob", b'{"tags": ["important"]}')})
+
+
+class TestJsonMultiPartParser:
+    @pytest.mark.parametrize("chunk_size", [None, 8, 1])
+    def test_parse_json_field_parts(self, chunk_size: int | None) -> None:
+        body = multipart_body(
+            ("metadata", "application/json", b'{"tags": ["important"]}'),
+            ("metadata", None, b'{"tags": []}'),
+            ("title", "text/plain", b"Document"),
+            ("metadata", "application/json", b"[1, 2]"),
+        )
+
+        data, files = parse_body(body, chunk_size)
+
+        assert data.getlist("metadata") == [
+            {"tags": ["important"]},
+            '{"tags": []}',
+            [1, 2],
+        ]
+        assert data["title"] == "Document"
+        assert not files
+
+    def test_parse_invalid_json_field_part(self) -> None:
+        body = multipart_body(("metadata", "application/json", b"{invalid_json}"))
+
+        with pytest.raises(exceptions.ParseError, match="'metadata'"):
+            parse_body(body)
@@ -0,0 +1,362 @@
+import typing as t
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import mixins, permissions, serializers, status, test
+from rest_framework import request as drf_request
+
+from server.app.authentication import models as auth_models
+from server.utils.django.tests import models as test_models
+from server.utils.rest_framework import pagination, query_plan
+from server.utils.rest_framework import viewsets as util_viewsets
+from server.utils.rest_framework.serializers import base as base_serializers
+
+
+class MockChildSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockChildModel
+        fields = (*base_serializers.base_model_fields, "name", "parent", "tags")
+
+
+class MockParentSerializer(base_serializers.BaseSerializer):
+    children = MockChildSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = test_models.MockParentModel
+        fields = (*base_serializers.base_model_fields, "name", "children")
+
+
+class MockChildDetailSerializer(serializers.ModelSerializer):
+    parent_name = serializers.CharField(source="parent.name")
+    creator = serializers.StringRelatedField(source="created_by")
+
+    class Meta:
+        model = test_models.MockChildModel
+        fields = ("id", "parent", "parent_name", "creator")
+
+
+@pytest.fixture
+def user() -> auth_models.User:
+    return baker.make(auth_models.User)
+
+
+@pytest.fixture
+def make_parents(user: auth_models.User) -> t.Callable[[int], None]:
+    def _make_parents(quantity: int) -> None:
+        tags = baker.make(test_models.MockModel, _quantity=2)
+        for parent in baker.make(
+            test_models.MockParentModel,
+            created_by=user,
+            updated_by=user,
+            _quantity=quantity,
+        ):
+            for child in baker.make(
+                test_models.MockChildModel,
+                parent=parent,
+                created_by=user,
+                updated_by=user,
+                _quantity=2,
+            ):
+                child.tags.set(tags)
+
+    return _make_parents
+
+
+class TestGetPlan:
+    def test_nested_serializers(self) -> None:
+        plan = query_plan.get_plan(MockParentSerializer(), test_models.MockParentModel)
+
+        assert plan.select_related == ("created_by", "updated_by")
+        (children,) = plan.prefetch_related
+        assert children.lookup == "children"
+        assert children.model is test_models.MockChildModel
+        assert children.plan.select_related == ("created_by", "updated_by")
+        assert [prefetch.lookup for prefetch in children.plan.prefetch_related] == [
+            "tags"
+        ]
+
+    def test_pk_only_and_dotted_sources(self) -> None:
+        plan = query_plan.get_plan(
+            MockChildDetailSerializer(),
+            test_models.MockChildModel,
+        )
+
+        assert plan.select_related == ("parent", "created_by")
+        assert plan.prefetch_related == ()
+        assert plan.only == ("id", "parent", "parent__name", "created_by")
+
+    def test_only_serializer_columns(self) -> None:
+        plan = query_plan.get_plan(MockParentSerializer(), test_models.MockParentModel)
+        user_columns = ("id", "username", "first_name", "last_name")
+
+        assert set(plan.only) == {
+            "id",
+            "created_at",
+            "updated_at",
+            "created_by",
+            *(f"created_by__{column}" for column in user_columns),
+            "updated_by",
+            *(f"updated_by__{column}" for column in user_columns),
+            "name",
+        }
+        (children,) = plan.prefetch_related
+        assert "parent" in children.plan.only
+        assert "description" not in children.plan.only
+
+    def test_all_columns_for_method_fields(self) -> None:
+        class MockMethodSerializer(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = test_models.MockChildModel
+                fields = ("id", "label")
+
+            def get_label(self, obj: test_models.MockChildModel) -> str:
+                return f"{obj.name}: {obj.description}"
+
+        plan = query_plan.get_plan(MockMethodSerializer(), test_models.MockChildModel)
+
+        assert plan.only == ()
+
+    def test_all_columns_for_custom_representation(self) -> None:
+        class MockRepresentationSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = test_models.MockChildModel
+                fields = ("id",)
+
+            def to_representation(self, instance: t.Any) -> t.Any:
+                return {**super().to_representation(instance), "extra": instance.name}
+
+        plan = query_plan.get_plan(
+            MockRepresentationSerializer(),
+            test_models.MockChildModel,
+        )
+
+        assert plan.only == ()
+
+    def test_empty_plan(self) -> None:
+        plan = query_plan.get_plan(serializers.Serializer(), auth_models.User)
+
+        assert not plan
+        assert plan.apply(auth_models.User.objects.all()).query.select_related is False
+
+    def test_sparse_fieldset(self) -> None:
+        plan = query_plan.get_query_plan(
+            MockParentSerializer,
+            base_serializers.SparseFieldset(fields=frozenset({"id", "name"})),
+        )
+
+        assert plan.select_related == ()
+        assert plan.prefetch_related == ()
+        assert plan.only == ("id", "name")
+
+    def test_sparse_fieldset_restricted_to_serializer_fields(self) -> None:
+        plan = query_plan.get_query_plan(
+            MockParentSerializer,
+            base_serializers.SparseFieldset(
+                fields=frozenset({"id", "name", "unknown"}),
+                omit=frozenset({"other"}),
+            ),
+        )
+
+        assert plan is query_plan.get_query_plan(
+            MockParentSerializer,
+            base_serializers.SparseFieldset(fields=frozenset({"id", "name"})),
+        )
+
+    def test_cached_per_serializer_class(self) -> None:
+        assert query_plan.get_query_plan(
+            MockParentSerializer
+        ) is query_plan.get_query_plan(MockParentSerializer)
+
+    def test_serializer_plan_from_context(self) -> None:
+        request = drf_request.Request(
+            test.APIRequestFactory().get("/parents", {"fields": "id,name"}),
+        )
+
+        plan = query_plan.get_serializer_query_plan(
+            MockParentSerializer(context={"request": request}),
+        )
+
+        assert plan.prefetch_related == ()
+        assert plan.only == ("id", "name")
+
+
+@pytest.mark.django_db
+class TestBaseGenericViewSetQueryPlan:
+    @pytest.fixture
+    def view(self) -> t.Any:
+        class MockParentViewSet(
+            mixins.ListModelMixin,
+            mixins.RetrieveModelMixin,
+            util_viewsets.BaseGenericViewSet,
+        ):
+            queryset = test_models.MockParentModel.objects.all()
+            serializer_class = MockParentSerializer
+
+        return MockParentViewSet.as_view({"get": "list"})
+
+    def count_list_queries(
+        self,
+        view: t.Any,
+        user: auth_models.User,
+    ) -> int:
+        request = test.APIRequestFactory().get("/parents")
+        test.force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        return len(queries)
+
+    def test_list_queries_do_not_grow_with_rows(
+        self,
+        view: t.Any,
+        user: auth_models.User,
+        make_parents: t.Callable[[int], None],
+    ) -> None:
+        make_parents(1)
+        one = self.count_list_queries(view, user)
+
+        make_parents(4)
+        many = self.count_list_queries(view, user)
+
+        assert one == many == 4  # noqa: PLR2004
+
+    def test_list_skips_unused_columns(
+        self,
+        view: t.Any,
+        user: auth_models.User,
+        make_parents: t.Callable[[int], None],
+    ) -> None:
+        make_parents(2)
+        request = test.APIRequestFactory().get("/parents")
+        test.force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            view(request)
+
+        sql = " ".join(query["sql"] for query in queries)
+        assert '"name"' in sql
+        assert '"description"' not in sql
+        assert '"password"' not in sql
+
+    def test_list_sparse_fieldset(
+        self,
+        view: t.Any,
+        user: auth_models.User,
+        make_parents: t.Callable[[int], None],
+    ) -> None:
+        make_parents(2)
+        request = test.APIRequestFactory().get("/parents", {"omit": "children"})
+        test.force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert "children" not in response_data["results"][0]
+        assert len(queries) == 2  # noqa: PLR2004
+
+    def test_list_uses_the_cached_plan(
+        self,
+        view: t.Any,
+        user: auth_models.User,
+        make_parents: t.Callable[[int], None],
+    ) -> None:
+        make_parents(1)
+
+        with mock.patch.object(query_plan, "get_serializer_query_plan") as build:
+            assert self.count_list_queries(view, user) == 4  # noqa: PLR2004
+
+        build.assert_not_called()
+
+    def test_list_plans_with_serializer_context(
+        self,
+        user: auth_models.User,
+        make_parents: t.Callable[[int], None],
+    ) -> None:
+        class MockStaffSerializer(MockParentSerializer):
+            context_dependent_fields = True
+
+            def get_fields(self) -> dict[str, serializers.Field]:
+                fields = super().get_fields()
+                if not self.context["request"].user.is_staff:
+                    fields.pop("children")
+                return fields
+
+        class MockStaffViewSet(mixins.ListModelMixin, util_viewsets.BaseGenericViewSet):
+            queryset = test_models.MockParentModel.objects.all()
+            serializer_class = MockStaffSerializer
+
+        make_parents(2)
+        view = MockStaffViewSet.as_view({"get": "list"})
+
+        assert self.count_list_queries(view, user) == 2  # noqa: PLR2004
+        user.is_staff = True
+        assert self.count_list_queries(view, user) == 4  # noqa: PLR2004
+
+
+class MockParentNameSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = test_models.MockParentModel
+        fields = ("id", "name")
+
+
+class MockChildNameSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = test_models.MockChildModel
+        fields = ("id", "name")
+
+
+class IsNotLocked(permissions.IsAuthenticated):
+    def has_object_permission(self, request: t.Any, view: t.Any, obj: t.Any) -> bool:
+        return obj.description != "Locked"
+
+
+@pytest.mark.django_db
+class TestOnlyFields:
+    def test_keyset_ordering_fields(self, user: auth_models.User) -> None:
+        class MockKeysetViewSet(
+            mixins.ListModelMixin, util_viewsets.BaseGenericViewSet
+        ):
+            queryset = test_models.MockParentModel.objects.all()
+            serializer_class = MockParentNameSerializer
+            pagination_class = pagination.KeysetPagination
+
+        baker.make(test_models.MockParentModel, _quantity=3)
+        request = test.APIRequestFactory().get("/parents", {"limit": 2})
+        test.force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = MockKeysetViewSet.as_view({"get": "list"})(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+
+    def test_object_permission_fields(self, user: auth_models.User) -> None:
+        class MockPermissionViewSet(
+            mixins.RetrieveModelMixin,
+            util_viewsets.BaseGenericViewSet,
+        ):
+            queryset = test_models.MockChildModel.objects.all()
+            serializer_class = MockChildNameSerializer
+            permission_classes = (IsNotLocked,)
+            only_fields = ("description",)
+
+        child = baker.make(test_models.MockChildModel)
+        request = test.APIRequestFactory().get("/children")
+        test.force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = MockPermissionViewSet.as_view({"get": "retrieve"})(
+                request,
+                pk=child.pk,
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
@@ -0,0 +1,74 @@
+import datetime
+import decimal
+import typing as t
+import uuid
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import renderers
+
+from server.utils.rest_framework import renderers as util_renderers
+
+
+@pytest.fixture
+def renderer() -> util_renderers.ORJSONRenderer:
+    return util_renderers.ORJSONRenderer()
+
+
+@pytest.fixture
+def data() -> dict[t.Any, t.Any]:
+    return {
+        "id": uuid.uuid4(),
+        "timestamp": timezone.now(),
+        "naive": datetime.datetime(2024, 1, 1, 12, 30),  # noqa: DTZ001
+        "offset": datetime.datetime(
+            2024,
+            1,
+            1,
+            tzinfo=datetime.timezone(datetime.timedelta(hours=8)),
+        ),
+        "date": datetime.date(2024, 1, 1),
+        "duration": datetime.timedelta(minutes=1),
+        "price": decimal.Decimal("1.50"),
+        "detail": _("Not found."),
+        "text": "中文\u2028\u2029",
+        "messages": {0: ["error"]},
+    }
+
+
+class TestORJSONRenderer:
+    def test_same_as_json_renderer(
+        self,
+        renderer: util_renderers.ORJSONRenderer,
+        data: dict[t.Any, t.Any],
+    ) -> None:
+        assert renderer.render(data) == renderers.JSONRenderer().render(data)
+
+    def test_indent(
+        self,
+        renderer: util_renderers.ORJSONRenderer,
+        data: dict[t.Any, t.Any],
+    ) -> None:
+        media_type = "application/json; indent=2"
+
+        assert renderer.render(data, media_type) == renderers.JSONRenderer().render(
+            data,
+            media_type,
+        )
+
+    def test_fallback_indent(
+        self,
+        renderer: util_renderers.ORJSONRenderer,
+        data: dict[t.Any, t.Any],
+    ) -> None:
+        context = {"indent": 4}
+
+        assert renderer.render(data, None, context) == renderers.JSONRenderer().render(
+            data,
+            None,
+            context,
+        )
+
+    def test_none(self, renderer: util_renderers.ORJSONRenderer) -> None:
+        assert renderer.render(None) == b""
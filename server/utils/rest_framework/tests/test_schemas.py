@@ -0,0 +1,49 @@
+import typing as t
+
+from drf_spectacular import generators
+from rest_framework import mixins, routers, viewsets
+
+from server.utils.django.tests import models as test_models
+from server.utils.rest_framework.serializers import base as base_serializers
+
+
+class MockSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockModel
+        fields = ("id", "name")
+
+
+class MockViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = test_models.MockModel.objects.all()
+    serializer_class = MockSerializer
+
+
+def get_schema() -> dict[str, t.Any]:
+    router = routers.SimpleRouter()
+    router.register("items", MockViewSet, basename="items")
+    generator = generators.SchemaGenerator(patterns=router.urls)
+    return generator.get_schema(request=None, public=True)
+
+
+class TestAutoSchema:
+    def test_sparse_fieldset_parameters(self) -> None:
+        operation = get_schema()["paths"]["/items/"]["get"]
+        parameters = {
+            parameter["name"]: parameter for parameter in operation["parameters"]
+        }
+
+        for name in ("fields", "omit"):
+            assert parameters[name]["in"] == "query"
+            assert parameters[name]["explode"] is False
+            assert parameters[name]["schema"]["items"]["enum"] == ["id", "name"]
+
+    def test_no_parameters_on_write(self) -> None:
+        operation = get_schema()["paths"]["/items/"]["post"]
+
+        assert "fields" not in {
+            parameter["name"] for parameter in operation.get("parameters", [])
+        }
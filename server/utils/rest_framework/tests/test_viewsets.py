@@ -1,10 +1,23 @@
+import json
 import typing as t
+from unittest import mock
 
 import pytest
+from asgiref import sync
+from django.core.cache import cache
+from django.db import connection, connections, models
+from django.test import client as test_client
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
-from rest_framework import mixins, status, test, views
+from rest_framework import mixins, permissions, routers, status, test, views
+from rest_framework import response as drf_response
+from rest_framework_simplejwt import models as jwt_models
+from rest_framework_simplejwt import tokens
 
+from server.app.authentication import authentication
 from server.app.authentication import models as auth_models
+from server.utils.django import cache as util_cache
+from server.utils.django import middleware
 from server.utils.django.tests import models as test_models
 from server.utils.rest_framework import viewsets as util_viewsets
 from server.utils.rest_framework.serializers import base as base_serializers
@@ -86,6 +99,79 @@ def model_viewset_factory() -> ModelViewSetFactory:
     return _create_viewset
 
 
+class MockSoftDeletableBaseModelSerializer(base_serializers.BaseSerializer):
+    class Meta:
+        model = test_models.MockSoftDeletableBaseModel
+        fields = (*base_serializers.base_model_fields, "name")
+
+
+BulkViewSetFactory = t.Callable[[type[models.Model]], t.Any]
+
+
+@pytest.fixture
+def bulk_viewset_factory() -> BulkViewSetFactory:
+    def _create_viewset(model: type[models.Model]) -> t.Any:
+        class MockBulkViewSet(
+            util_viewsets.BulkModelMixin,
+            util_viewsets.BaseModelViewSet,
+        ):
+            queryset = model._default_manager.all()  # noqa: SLF001
+            serializer_class = (
+                MockBaseModelSerializer
+                if model is test_models.MockModel
+                else MockSoftDeletableBaseModelSerializer
+            )
+
+        return MockBulkViewSet.as_view(
+            {
+                "post": "bulk_create",
+                "patch": "bulk_partial_update",
+                "delete": "bulk_destroy",
+            },
+        )
+
+    return _create_viewset
+
+
+class MockAsyncModelViewSet(util_viewsets.AsyncBaseModelViewSet):
+    queryset = test_models.MockSoftDeletableBaseModel.objects.order_by("name")
+    serializer_class = MockSoftDeletableBaseModelSerializer
+    conditional_list = True
+
+
+# Served by `TestAsyncEndToEnd` through the ASGI handler and the middleware.
+async_router = routers.SimpleRouter(trailing_slash=False)
+async_router.register("items", MockAsyncModelViewSet, basename="async-items")
+urlpatterns = async_router.urls
+
+
+@pytest.fixture
+def async_view() -> t.Any:
+    actions = {
+        "get": "retrieve",
+        "put": "update",
+        "patch": "partial_update",
+        "delete": "destroy",
+    }
+    return {
+        "list": MockAsyncModelViewSet.as_view({"get": "list", "post": "create"}),
+        "detail": MockAsyncModelViewSet.as_view(actions),
+    }
+
+
+@pytest.fixture
+def streaming_view() -> t.Any:
+    class MockStreamingViewSet(
+        util_viewsets.StreamingListMixin,
+        util_viewsets.BaseModelViewSet,
+    ):
+        queryset = test_models.MockModel.objects.order_by("name")
+        serializer_class = MockBaseModelSerializer
+        stream_chunk_size = 2
+
+    return MockStreamingViewSet.as_view({"get": "export"})
+
+
 @pytest.mark.django_db
 class TestUserActionLogMixins:
     def test_create_user_action_log(
@@ -185,6 +271,94 @@ class TestBaseGenericViewSet:
         assert response_data["updated_by"]["id"] == str(user.id)
 
 
+# The replica has its own connection, which only sees the committed rows.
+@pytest.mark.django_db(transaction=True, databases=["default", "replica_0"])
+class TestReadReplica:
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings: t.Any) -> None:
+        settings.DATABASE_REPLICAS = ["replica_0"]
+
+    @pytest.mark.parametrize("action", ["list", "retrieve"])
+    def test_read_action(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        viewset_factory: ViewSetFactory,
+        action: str,
+    ) -> None:
+        request = factory.get("/items")
+        test.force_authenticate(request, user=user)
+        view = viewset_factory(MockSerializer, {"get": action})
+
+        with (
+            CaptureQueriesContext(connection) as primary_queries,
+            CaptureQueriesContext(connections["replica_0"]) as replica_queries,
+        ):
+            response = view(request, pk=mock_instance.pk)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(primary_queries) == 0, [q["sql"] for q in primary_queries]
+        assert len(replica_queries) > 0
+
+    @pytest.mark.usefixtures("mock_instance")
+    def test_export_streams_from_replica(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        streaming_view: t.Any,
+    ) -> None:
+        request = factory.get("/items/export")
+        test.force_authenticate(request, user=user)
+        response = streaming_view(request)
+
+        with (
+            CaptureQueriesContext(connection) as primary_queries,
+            CaptureQueriesContext(connections["replica_0"]) as replica_queries,
+        ):
+            content = b"".join(response.streaming_content)
+
+        assert len(json.loads(content)) == 1
+        assert len(primary_queries) == 0, [q["sql"] for q in primary_queries]
+        assert len(replica_queries) > 0
+
+    @pytest.mark.parametrize("action", ["list", "retrieve"])
+    def test_cached_action(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        action: str,
+    ) -> None:
+        cache.clear()
+        request = factory.get("/items")
+        test.force_authenticate(request, user=user)
+        view = MockCacheViewSet.as_view({"get": action})
+
+        with CaptureQueriesContext(connections["replica_0"]) as replica_queries:
+            response = view(request, pk=mock_instance.pk)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(replica_queries) == 0
+
+    def test_write_action(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        model_viewset_factory: ModelViewSetFactory,
+    ) -> None:
+        request = factory.put(f"/items/{mock_instance.pk}", {"name": "updated"})
+        test.force_authenticate(request, user=user)
+        view = model_viewset_factory(MockSerializer)
+
+        with CaptureQueriesContext(connections["replica_0"]) as replica_queries:
+            response = view(request, pk=mock_instance.pk)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(replica_queries) == 0
+
+
 @pytest.mark.django_db
 class TestBaseModelViewSet:
     def test_retrieve_with_user_fields(
@@ -247,6 +421,27 @@ class TestBaseModelViewSet:
         assert mock_instance.created_by == mock_instance.created_by
         assert mock_instance.updated_by == user
 
+    def test_create_with_token_user(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        model_viewset_factory: ModelViewSetFactory,
+    ) -> None:
+        # The user of a stateless JWT authentication, see `JWT_STATELESS_USER`.
+        token_user = jwt_models.TokenUser(tokens.AccessToken.for_user(user))
+        request = factory.post("/items", {"name": "Test Item"}, format="json")
+        test.force_authenticate(request, user=token_user)  # pyright: ignore[reportArgumentType]
+
+        view = model_viewset_factory(MockBaseModelSerializer)
+        response = view(request)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        created_item = test_models.MockModel.objects.get(name="Test Item")
+        assert created_item.created_by == user
+        assert created_item.updated_by == user
+        assert response_data["created_by"]["username"] == user.username
+
     def test_unauthorized_access(
         self,
         factory: test.APIRequestFactory,
@@ -257,3 +452,891 @@ class TestBaseModelViewSet:
         response = view(request)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestAsyncBaseModelViewSet:
+    @pytest.fixture
+    def instance(
+        self, user: auth_models.User
+    ) -> test_models.MockSoftDeletableBaseModel:
+        return baker.make(
+            test_models.MockSoftDeletableBaseModel,
+            name="Item",
+            created_by=user,
+            updated_by=user,
+        )
+
+    def call(
+        self,
+        view: t.Any,
+        request: t.Any,
+        user: auth_models.User,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        test.force_authenticate(request, user=user)
+        return sync.async_to_sync(view)(request, **kwargs)
+
+    def test_list(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        instance: test_models.MockSoftDeletableBaseModel,
+        async_view: t.Any,
+    ) -> None:
+        response = self.call(async_view["list"], factory.get("/items"), user)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response_data["results"]] == [str(instance.id)]
+
+    @pytest.mark.usefixtures("instance")
+    def test_list_not_modified(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        async_view: t.Any,
+    ) -> None:
+        etag = self.call(async_view["list"], factory.get("/items"), user)["ETag"]
+
+        request = factory.get("/items", HTTP_IF_NONE_MATCH=etag)
+        response = self.call(async_view["list"], request, user)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_retrieve(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        instance: test_models.MockSoftDeletableBaseModel,
+        async_view: t.Any,
+    ) -> None:
+        request = factory.get(f"/items/{instance.id}")
+        response = self.call(async_view["detail"], request, user, pk=instance.id)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response_data["name"] == "Item"
+        assert response_data["created_by"]["id"] == str(user.id)
+        assert response["ETag"]
+
+    @pytest.mark.parametrize("pk", ["00000000-0000-0000-0000-000000000000", "bad"])
+    def test_retrieve_not_found(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        async_view: t.Any,
+        pk: str,
+    ) -> None:
+        request = factory.get(f"/items/{pk}")
+        response = self.call(async_view["detail"], request, user, pk=pk)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_create_with_user_fields(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        async_view: t.Any,
+    ) -> None:
+        request = factory.post("/items", {"name": "Created"}, format="json")
+        response = self.call(async_view["list"], request, user)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        created = test_models.MockSoftDeletableBaseModel.objects.get(name="Created")
+        assert created.created_by == user
+        assert created.updated_by == user
+
+    def test_create_invalid(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        async_view: t.Any,
+    ) -> None:
+        request = factory.post("/items", {"name": ""}, format="json")
+        response = self.call(async_view["list"], request, user)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_partial_update_with_user_fields(
+        self,
+        factory: test.APIRequestFactory,
+        instance: test_models.MockSoftDeletableBaseModel,
+        async_view: t.Any,
+    ) -> None:
+        other_user = baker.make(auth_models.User)
+
+        request = factory.patch(
+            f"/items/{instance.id}",
+            {"name": "Updated"},
+            format="json",
+        )
+        response = self.call(async_view["detail"], request, other_user, pk=instance.id)
+
+        assert response.status_code == status.HTTP_200_OK
+        instance.refresh_from_db()
+        assert instance.name == "Updated"
+        assert instance.updated_by == other_user
+
+    def test_destroy_soft_deletes(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        instance: test_models.MockSoftDeletableBaseModel,
+        async_view: t.Any,
+    ) -> None:
+        request = factory.delete(f"/items/{instance.id}")
+        response = self.call(async_view["detail"], request, user, pk=instance.id)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not test_models.MockSoftDeletableBaseModel.objects.exists()
+        instance.refresh_from_db()
+        assert instance.deleted_at is not None
+
+    def test_unauthorized_access(
+        self,
+        factory: test.APIRequestFactory,
+        async_view: t.Any,
+    ) -> None:
+        request = factory.post("/items", {"name": "Created"}, format="json")
+        response = sync.async_to_sync(async_view["list"])(request)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica_0"])
+@pytest.mark.urls(__name__)
+class TestAsyncEndToEnd:
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings: t.Any) -> None:
+        settings.DATABASE_REPLICAS = ["replica_0"]
+
+    @pytest.fixture
+    def client(self) -> t.Any:
+        return test_client.AsyncClient()  # pyright: ignore[reportAttributeAccessIssue]
+
+    @pytest.fixture
+    def authorization(self, user: auth_models.User) -> dict[str, str]:
+        # The `headers` of `AsyncClient` itself are not sent in the ASGI scope.
+        return {"Authorization": f"Bearer {tokens.AccessToken.for_user(user)}"}
+
+    def get_items(
+        self,
+        client: t.Any,
+        headers: dict[str, str],
+    ) -> tuple[t.Any, int, int]:
+        with (
+            CaptureQueriesContext(connection) as primary_queries,
+            CaptureQueriesContext(connections["replica_0"]) as replica_queries,
+        ):
+            response = sync.async_to_sync(client.get)("/items", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        return response, len(primary_queries), len(replica_queries)
+
+    def test_write_pins_reads_to_primary(
+        self,
+        user: auth_models.User,
+        client: t.Any,
+        authorization: dict[str, str],
+    ) -> None:
+        cache.clear()
+
+        response = sync.async_to_sync(client.post)(
+            "/items",
+            {"name": "Created"},
+            content_type="application/json",
+            headers=authorization,
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["created_by"]["id"] == str(user.id)
+        assert cache.get(authentication.get_user_cache_key(str(user.id))) == user
+        pin = response[middleware.PRIMARY_PIN_HEADER]
+
+        # The client sends the pin back in the cookie.
+        response, primary, replica = self.get_items(client, authorization)
+        assert response.json()["results"][0]["name"] == "Created"
+        assert primary > 0
+        assert replica == 0
+
+        client.cookies.clear()
+        headers = {**authorization, middleware.PRIMARY_PIN_HEADER: pin}
+        _, primary, replica = self.get_items(client, headers)
+        assert primary > 0
+        assert replica == 0
+
+        # The user comes from the cache and the list from the replica.
+        _, primary, replica = self.get_items(client, authorization)
+        assert primary == 0
+        assert replica > 0
+
+    def test_invalid_token(self, client: t.Any) -> None:
+        response = sync.async_to_sync(client.get)(
+            "/items",
+            headers={"Authorization": "Bearer invalid"},
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class IsNotLocked(permissions.IsAuthenticated):
+    def has_object_permission(self, request: t.Any, view: t.Any, obj: t.Any) -> bool:
+        return obj.name != "Locked"
+
+
+@pytest.mark.django_db
+class TestBulkModelMixin:
+    def test_bulk_create(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        request = factory.post(
+            "/items/bulk",
+            [{"name": f"Item {i}"} for i in range(5)],
+            format="json",
+        )
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request)
+        response_data = t.cast(list[dict[str, t.Any]], response.data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item["name"] for item in response_data] == [
+            f"Item {i}" for i in range(5)
+        ]
+        assert response_data[0]["created_by"]["id"] == str(user.id)
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+        created = test_models.MockModel.objects.filter(created_by=user, updated_by=user)
+        assert created.count() == 5  # noqa: PLR2004
+
+    def test_bulk_create_per_item_errors(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        request = factory.post(
+            "/items/bulk",
+            [{"name": "Valid"}, {}],
+            format="json",
+        )
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        response = view(request)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response_data["code"] == "invalid"
+        assert response_data["messages"][0] == {}
+        assert "name" in response_data["messages"][1]
+        assert not test_models.MockModel.objects.exists()
+
+    def test_bulk_create_not_a_list(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        request = factory.post("/items/bulk", {"name": "Item"}, format="json")
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        response = view(request)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "non_field_errors" in response_data["messages"]
+
+    def test_bulk_partial_update(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        other = baker.make(auth_models.User)
+        items = baker.make(
+            test_models.MockModel,
+            created_by=other,
+            updated_by=other,
+            _quantity=3,
+        )
+        request = factory.patch(
+            "/items/bulk",
+            [
+                {"id": str(item.id), "name": f"Updated {i}"}
+                for i, item in enumerate(items)
+            ],
+            format="json",
+        )
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request)
+        response_data = t.cast(list[dict[str, t.Any]], response.data)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["name"] for item in response_data] == [
+            f"Updated {i}" for i in range(3)
+        ]
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        for i, item in enumerate(items):
+            item.refresh_from_db()
+            assert item.name == f"Updated {i}"
+            assert item.created_by == other
+            assert item.updated_by == user
+
+    def test_bulk_partial_update_unknown_id(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        request = factory.patch(
+            "/items/bulk",
+            [
+                {"id": str(mock_instance.id), "name": "Updated"},
+                {"id": "unknown", "name": "Updated"},
+            ],
+            format="json",
+        )
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        response = view(request)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response_data["messages"][0] == {}
+        assert "id" in response_data["messages"][1]
+        mock_instance.refresh_from_db()
+        assert mock_instance.name != "Updated"
+
+    def test_bulk_destroy(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        items = baker.make(test_models.MockModel, _quantity=3)
+        request = factory.delete(
+            "/items/bulk",
+            [str(item.id) for item in items[:2]],
+            format="json",
+        )
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        response = view(request)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert list(test_models.MockModel.objects.all()) == [items[2]]
+
+    def test_bulk_partial_update_only_changed_fields(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        changed, unchanged = baker.make(test_models.MockModel, _quantity=2)
+        request = factory.patch(
+            "/items/bulk",
+            [{"id": str(changed.id), "name": "Updated"}, {"id": str(unchanged.id)}],
+            format="json",
+        )
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assert changed.id.hex in updates[0]
+        assert unchanged.id.hex not in updates[0]
+        updated_at = unchanged.updated_at
+        unchanged.refresh_from_db()
+        assert unchanged.updated_at == updated_at
+
+    @pytest.mark.parametrize("method", ["patch", "delete"])
+    def test_bulk_object_permissions(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+        method: str,
+    ) -> None:
+        allowed = baker.make(test_models.MockModel, name="Allowed")
+        locked = baker.make(test_models.MockModel, name="Locked")
+        ids = [str(allowed.id), str(locked.id)]
+        data = ids if method == "delete" else [{"id": pk, "name": "New"} for pk in ids]
+        request = getattr(factory, method)("/items/bulk", data, format="json")
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        with mock.patch.object(
+            util_viewsets.BaseModelViewSet,
+            "permission_classes",
+            [IsNotLocked],
+        ):
+            response = view(request)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert list(
+            test_models.MockModel.objects.order_by("name").values_list(
+                "name", flat=True
+            ),
+        ) == ["Allowed", "Locked"]
+
+    def test_bulk_destroy_soft_deletable(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        item = baker.make(test_models.MockSoftDeletableBaseModel)
+        request = factory.delete("/items/bulk", [str(item.id)], format="json")
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockSoftDeletableBaseModel)
+        response = view(request)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        item = test_models.MockSoftDeletableBaseModel.all_objects.get(pk=item.pk)
+        assert item.deleted_at is not None
+        assert item.updated_by == user
+
+    def test_bulk_destroy_unknown_id(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        bulk_viewset_factory: BulkViewSetFactory,
+    ) -> None:
+        request = factory.delete(
+            "/items/bulk",
+            [str(mock_instance.id), "unknown"],
+            format="json",
+        )
+        test.force_authenticate(request, user=user)
+
+        view = bulk_viewset_factory(test_models.MockModel)
+        response = view(request)
+        response_data = t.cast(dict[str, t.Any], response.data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response_data["messages"]) == [1]
+        assert test_models.MockModel.objects.filter(pk=mock_instance.pk).exists()
+
+
+@pytest.mark.django_db
+class TestStreamingListMixin:
+    def test_export(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        streaming_view: t.Any,
+    ) -> None:
+        baker.make(test_models.MockModel, created_by=user, _quantity=5)
+        request = factory.get("/items/export")
+        test.force_authenticate(request, user=user)
+
+        response = streaming_view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/json"
+        expected = MockBaseModelSerializer(
+            test_models.MockModel.objects.order_by("name"),
+            many=True,
+        ).data
+        assert json.loads(b"".join(response.streaming_content)) == expected
+
+    def test_export_empty(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        streaming_view: t.Any,
+    ) -> None:
+        request = factory.get("/items/export")
+        test.force_authenticate(request, user=user)
+
+        response = streaming_view(request)
+
+        assert b"".join(response.streaming_content) == b"[]"
+
+    def test_export_queries_per_chunk(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        streaming_view: t.Any,
+    ) -> None:
+        baker.make(
+            test_models.MockModel,
+            created_by=user,
+            updated_by=user,
+            _quantity=6,
+        )
+        request = factory.get("/items/export")
+        test.force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = streaming_view(request)
+            content = b"".join(response.streaming_content)
+
+        assert len(json.loads(content)) == 6  # noqa: PLR2004
+        assert len(queries) == 1
+
+    def test_export_under_asgi(
+        self,
+        user: auth_models.User,
+        streaming_view: t.Any,
+    ) -> None:
+        baker.make(test_models.MockModel, created_by=user, _quantity=5)
+        request = test_client.AsyncRequestFactory().get("/items/export")  # pyright: ignore[reportAttributeAccessIssue]
+        test.force_authenticate(request, user=user)
+
+        response = streaming_view(request)
+
+        async def read() -> list[bytes]:
+            return [chunk async for chunk in response.streaming_content]
+
+        assert response.is_async
+        chunks = sync.async_to_sync(read)()
+        assert len(chunks) == 5  # noqa: PLR2004
+        assert len(json.loads(b"".join(chunks))) == 5  # noqa: PLR2004
+
+    def test_list_actions(self) -> None:
+        class MockStreamingViewSet(
+            util_viewsets.BaseModelViewSet,
+            util_viewsets.StreamingListMixin,
+        ):
+            queryset = test_models.MockModel.objects.all()
+            serializer_class = MockBaseModelSerializer
+
+        assert MockStreamingViewSet.list_actions == ("list", "export")
+
+
+@pytest.mark.django_db
+class TestConditionalRequests:
+    def retrieve(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        instance: test_models.MockModel,
+        view: t.Any,
+        **extra: t.Any,
+    ) -> t.Any:
+        request = factory.get(f"/items/{instance.id}", **extra)
+        test.force_authenticate(request, user=user)
+        return view(request, pk=instance.id)
+
+    def test_retrieve_validators(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        model_viewset_factory: ModelViewSetFactory,
+    ) -> None:
+        view = model_viewset_factory(MockBaseModelSerializer)
+
+        response = self.retrieve(factory, user, mock_instance, view)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('"')
+        assert response["Last-Modified"]
+
+    @pytest.mark.parametrize("header", ["HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE"])
+    def test_retrieve_not_modified(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        model_viewset_factory: ModelViewSetFactory,
+        header: str,
+    ) -> None:
+        view = model_viewset_factory(MockBaseModelSerializer)
+        validators = self.retrieve(factory, user, mock_instance, view)
+        value = validators[
+            "ETag" if header == "HTTP_IF_NONE_MATCH" else "Last-Modified"
+        ]
+
+        with mock.patch.object(MockBaseModelSerializer, "to_representation") as mocker:
+            response = self.retrieve(
+                factory,
+                user,
+                mock_instance,
+                view,
+                **{header: value},
+            )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == validators["ETag"]
+        mocker.assert_not_called()
+
+    def test_retrieve_modified(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        model_viewset_factory: ModelViewSetFactory,
+    ) -> None:
+        view = model_viewset_factory(MockBaseModelSerializer)
+        etag = self.retrieve(factory, user, mock_instance, view)["ETag"]
+        mock_instance.save()
+
+        response = self.retrieve(
+            factory,
+            user,
+            mock_instance,
+            view,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    @pytest.mark.usefixtures("mock_instance")
+    def test_list_without_validators(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        viewset_factory: ViewSetFactory,
+    ) -> None:
+        view = viewset_factory(MockBaseModelSerializer, {"get": "list"})
+        request = factory.get("/items")
+        test.force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "ETag" not in response
+        assert not any("MAX(" in query["sql"] for query in queries)
+
+    @mock.patch.object(util_viewsets.BaseGenericViewSet, "conditional_list", True)  # noqa: FBT003
+    def test_list_not_modified(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        viewset_factory: ViewSetFactory,
+    ) -> None:
+        view = viewset_factory(MockBaseModelSerializer, {"get": "list"})
+
+        def get_list(**extra: t.Any) -> t.Any:
+            request = factory.get("/items", **extra)
+            test.force_authenticate(request, user=user)
+            return view(request)
+
+        etag = get_list()["ETag"]
+        not_modified = get_list(HTTP_IF_NONE_MATCH=etag)
+        baker.make(test_models.MockModel, updated_at=mock_instance.updated_at)
+        modified = get_list(HTTP_IF_NONE_MATCH=etag)
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert modified.status_code == status.HTTP_200_OK
+        assert modified["ETag"] != etag
+
+    def test_update_if_match(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        model_viewset_factory: ModelViewSetFactory,
+    ) -> None:
+        view = model_viewset_factory(MockBaseModelSerializer)
+        etag = self.retrieve(factory, user, mock_instance, view)["ETag"]
+
+        def update(name: str) -> t.Any:
+            request = factory.put(
+                f"/items/{mock_instance.id}",
+                {"name": name},
+                format="json",
+                HTTP_IF_MATCH=etag,
+            )
+            test.force_authenticate(request, user=user)
+            return view(request, pk=mock_instance.id)
+
+        first = update("First")
+        lost = update("Lost")
+        response_data = t.cast(dict[str, t.Any], lost.data)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert "ETag" not in first
+        assert lost.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert response_data["code"] == "precondition_failed"
+        mock_instance.refresh_from_db()
+        assert mock_instance.name == "First"
+
+
+class MockCacheViewSet(
+    util_viewsets.CacheResponseMixin,
+    util_viewsets.BaseModelViewSet,
+):
+    queryset = test_models.MockModel.objects.all()
+    serializer_class = MockSerializer
+
+
+@pytest.mark.django_db
+class TestCacheResponseMixin:
+    @pytest.fixture(autouse=True)
+    def lookups(self) -> t.Generator[list[bool], None, None]:
+        cache.clear()
+        hits: list[bool] = []
+
+        def receiver(hit: bool, **kwargs: t.Any) -> None:  # noqa: FBT001
+            hits.append(hit)
+
+        util_cache.response_cache_lookup.connect(receiver, sender=MockCacheViewSet)
+        yield hits
+        util_cache.response_cache_lookup.disconnect(
+            receiver,
+            sender=MockCacheViewSet,
+        )
+
+    def get(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        path: str = "/items",
+        **params: str,
+    ) -> t.Any:
+        request = factory.get(path, params)
+        test.force_authenticate(request, user=user)
+        response = MockCacheViewSet.as_view({"get": "list"})(request)
+        if isinstance(response, drf_response.Response):
+            response.render()
+        return response
+
+    def test_list_hit(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        lookups: list[bool],
+    ) -> None:
+        first = self.get(factory, user)
+        second = self.get(factory, user)
+
+        assert lookups == [False, True]
+        assert second.status_code == status.HTTP_200_OK
+        assert second.content == first.content
+        assert second["Content-Type"] == first["Content-Type"]
+        assert str(mock_instance.id).encode() in second.content
+
+    def test_retrieve_hit(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        lookups: list[bool],
+    ) -> None:
+        view = MockCacheViewSet.as_view({"get": "retrieve"})
+        for _ in range(2):
+            request = factory.get(f"/items/{mock_instance.id}")
+            test.force_authenticate(request, user=user)
+            response = view(request, pk=mock_instance.id)
+            if isinstance(response, drf_response.Response):
+                response.render()
+
+        assert lookups == [False, True]
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_retrieve_hit_checks_object_permissions(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        lookups: list[bool],
+    ) -> None:
+        view = MockCacheViewSet.as_view({"get": "retrieve"})
+        responses = []
+        for allowed in (True, False):
+            request = factory.get(f"/items/{mock_instance.id}")
+            test.force_authenticate(request, user=user)
+            with (
+                mock.patch.object(
+                    MockCacheViewSet, "permission_classes", [IsNotLocked]
+                ),
+                mock.patch.object(
+                    IsNotLocked,
+                    "has_object_permission",
+                    return_value=allowed,
+                ),
+            ):
+                response = view(request, pk=mock_instance.id)
+            if isinstance(response, drf_response.Response):
+                response.render()
+            responses.append(response)
+
+        assert lookups == [False, True]
+        assert responses[1].status_code == status.HTTP_403_FORBIDDEN
+
+    def test_invalidate_on_change(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        mock_instance: test_models.MockModel,
+        lookups: list[bool],
+    ) -> None:
+        self.get(factory, user)
+        test_models.MockModel.objects.filter(pk=mock_instance.pk).update(
+            name="Updated",
+        )
+
+        response = self.get(factory, user)
+
+        assert lookups == [False, False]
+        assert b"Updated" in response.content
+
+    @pytest.mark.usefixtures("mock_instance")
+    def test_key_per_user_and_params(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        lookups: list[bool],
+    ) -> None:
+        self.get(factory, user)
+        self.get(factory, baker.make(auth_models.User))
+        self.get(factory, user, page="1")
+
+        assert lookups == [False, False, False]
+
+    @pytest.mark.usefixtures("mock_instance")
+    @mock.patch.object(MockCacheViewSet, "conditional_list", True)  # noqa: FBT003
+    def test_hit_not_modified(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        lookups: list[bool],
+    ) -> None:
+        etag = self.get(factory, user)["ETag"]
+        request = factory.get("/items", HTTP_IF_NONE_MATCH=etag)
+        test.force_authenticate(request, user=user)
+
+        response = MockCacheViewSet.as_view({"get": "list"})(request)
+
+        assert lookups == [False, True]
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.usefixtures("mock_instance")
+    def test_skip_browsable_api(
+        self,
+        factory: test.APIRequestFactory,
+        user: auth_models.User,
+        lookups: list[bool],
+    ) -> None:
+        self.get(factory, user, format="api")
+
+        assert lookups == []
@@ -1,43 +1,661 @@
+import dataclasses
+import datetime
+import functools
+import hashlib
+import itertools
 import typing as t
 
-from django.db import models
-from rest_framework import mixins, request, serializers, viewsets
+import orjson
+from adrf import viewsets as adrf_viewsets
+from asgiref import sync
+from django import http
+from django.core import exceptions as django_exceptions
+from django.core.cache import caches
+from django.core.handlers import asgi
+from django.db import models, transaction
+from django.utils import cache as django_cache
+from django.utils import http as http_utils
+from rest_framework import (
+    decorators,
+    exceptions,
+    mixins,
+    permissions,
+    relations,
+    renderers,
+    response,
+    serializers,
+    status,
+    viewsets,
+)
+from rest_framework import request as drf_request
+
+from server.utils.django import cache as util_cache
+from server.utils.django import managers as util_managers
+from server.utils.django import routers
+from server.utils.rest_framework import exceptions as util_exceptions
+from server.utils.rest_framework import fields as util_fields
+from server.utils.rest_framework import query_plan
+from server.utils.rest_framework import renderers as util_renderers
+from server.utils.rest_framework.serializers import base as base_serializers
 
 Model = t.TypeVar("Model", bound=models.Model)
 Serializer = t.TypeVar("Serializer", bound=serializers.BaseSerializer)
 
 
 class CreateUserActionLogMixin(mixins.CreateModelMixin):
-    request: request.Request
+    request: drf_request.Request
 
     def perform_create(self, serializer: serializers.BaseSerializer) -> None:
-        serializer.save(created_by=self.request.user, updated_by=self.request.user)
+        user = util_fields.get_action_user(self.request.user)
+        serializer.save(created_by=user, updated_by=user)
 
 
 class UpdateUserActionLogMixin(mixins.UpdateModelMixin):
-    request: request.Request
+    request: drf_request.Request
 
     def perform_update(self, serializer: serializers.BaseSerializer) -> None:
-        serializer.save(updated_by=self.request.user)
+        serializer.save(updated_by=util_fields.get_action_user(self.request.user))
+
+
+class BulkModelMixin:
+    """
+    Opt-in bulk actions with a list payload on the `bulk` route.
+
+    - `POST` creates the items, `PATCH` partially updates the items by `id` and
+      `DELETE` deletes the `id` list, each in one transaction with bulk SQL.
+    - Updated and deleted rows are locked with `SELECT ... FOR UPDATE` and
+      checked against the object permissions.
+    - Per-item errors are returned in `messages` in the order of the payload.
+    - Many-to-many fields are not supported.
+    """
+
+    request: drf_request.Request
+    bulk_batch_size: int | None = None
+    bulk_max_length: int | None = 1000
+
+    get_queryset: t.Callable[[], models.QuerySet[t.Any]]
+    filter_queryset: t.Callable[[models.QuerySet[t.Any]], models.QuerySet[t.Any]]
+    get_serializer: t.Callable[..., serializers.BaseSerializer]
+    get_serializer_class: t.Callable[[], type[serializers.BaseSerializer]]
+    get_serializer_context: t.Callable[[], dict[str, t.Any]]
+    check_object_permissions: t.Callable[[drf_request.Request, t.Any], None]
+
+    @decorators.action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            max_length=self.bulk_max_length,
+        )
+        self.validate_bulk(serializer)
+        with transaction.atomic():
+            self.perform_bulk_create(serializer)
+        return response.Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @bulk_create.mapping.patch
+    def bulk_partial_update(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        items = request.data if isinstance(request.data, list) else []
+        ids = [item.get("id") for item in items if isinstance(item, dict)]
+
+        # The rows stay locked from the read to the write, so the items are
+        # validated against the rows they update.
+        with transaction.atomic():
+            instances = list(self.get_locked_bulk_queryset(ids))
+            for instance in instances:
+                self.check_object_permissions(request, instance)
+
+            serializer = base_serializers.BulkUpdateListSerializer(
+                instances,
+                data=request.data,
+                child=self.get_serializer_class()(partial=True),
+                partial=True,
+                max_length=self.bulk_max_length,  # pyright: ignore[reportCallIssue]
+                context=self.get_serializer_context(),
+            )
+            self.validate_bulk(serializer)
+            self.perform_bulk_update(serializer)
+        return response.Response(serializer.data)
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        serializer = serializers.ListField(
+            child=serializers.CharField(),
+            max_length=self.bulk_max_length,
+        )
+        try:
+            ids = serializer.run_validation(request.data)
+        except exceptions.ValidationError as error:
+            raise exceptions.ValidationError({"messages": error.detail}) from error
+
+        with transaction.atomic():
+            queryset = self.get_locked_bulk_queryset(ids)
+            model = queryset.model
+            found_pks = set()
+            for instance in queryset:
+                self.check_object_permissions(request, instance)
+                found_pks.add(instance.pk)
+
+            errors = {
+                index: [
+                    relations.PrimaryKeyRelatedField.default_error_messages[
+                        "does_not_exist"
+                    ].format(pk_value=pk),
+                ]
+                for index, pk in enumerate(ids)
+                if base_serializers.to_pk(model, pk) not in found_pks
+            }
+            if errors:
+                raise exceptions.ValidationError({"messages": errors})
+
+            self.perform_bulk_destroy(self.get_bulk_queryset(ids))
+        return response.Response(status=status.HTTP_204_NO_CONTENT)
+
+    def get_bulk_queryset(self, ids: t.Sequence[t.Any]) -> models.QuerySet[t.Any]:
+        queryset = self.filter_queryset(self.get_queryset())
+        pks = [base_serializers.to_pk(queryset.model, pk) for pk in ids]
+        return queryset.filter(pk__in=[pk for pk in pks if pk is not None])
+
+    def get_locked_bulk_queryset(
+        self,
+        ids: t.Sequence[t.Any],
+    ) -> models.QuerySet[t.Any]:
+        # Locked in primary key order, so concurrent bulk actions cannot
+        # deadlock, and without the rows of the joined tables.
+        return (
+            self.get_bulk_queryset(ids).select_for_update(of=("self",)).order_by("pk")
+        )
+
+    def validate_bulk(self, serializer: serializers.BaseSerializer) -> None:
+        if not serializer.is_valid():
+            raise exceptions.ValidationError({"messages": serializer.errors})
+
+    def perform_bulk_create(self, serializer: serializers.BaseSerializer) -> None:
+        model = self.get_queryset().model
+        instances = [model(**attrs) for attrs in serializer.validated_data]
+        serializer.instance = self.get_queryset().bulk_create(
+            instances,
+            batch_size=self.bulk_batch_size,
+            user=util_fields.get_action_user(self.request.user),  # pyright: ignore[reportCallIssue]
+        )
+
+    def perform_bulk_update(
+        self,
+        serializer: base_serializers.BulkUpdateListSerializer,
+    ) -> None:
+        # Each row is written with the fields of its own item only, a field
+        # another item changes would overwrite a concurrent update otherwise.
+        instances: list[models.Model] = []
+        groups: dict[tuple[str, ...], list[models.Model]] = {}
+        for item, attrs in zip(
+            serializer.initial_data,
+            serializer.validated_data,
+            strict=True,
+        ):
+            instance = t.cast(models.Model, serializer.get_instance(item))
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+            instances.append(instance)
+            groups.setdefault(tuple(sorted(attrs)), []).append(instance)
+
+        user = util_fields.get_action_user(self.request.user)
+        for fields, group in groups.items():
+            if not fields:
+                continue
+            self.get_queryset().bulk_update(
+                group,
+                fields,
+                batch_size=self.bulk_batch_size,
+                user=user,  # pyright: ignore[reportCallIssue]
+            )
+        serializer.instance = instances
+
+    def perform_bulk_destroy(self, queryset: models.QuerySet[t.Any]) -> None:
+        # Soft-deletable rows are soft deleted like `SoftDeletableModel.delete()`.
+        if isinstance(queryset, util_managers.SoftDeletableQuerySet):
+            queryset.delete(updated_by=util_fields.get_action_user(self.request.user))
+        elif isinstance(queryset, util_managers.GlobalQuerySet):
+            queryset.soft_delete(
+                updated_by=util_fields.get_action_user(self.request.user),
+            )
+        else:
+            queryset.delete()
+
+
+class StreamingListMixin:
+    """
+    Opt-in `export` action that streams the whole list as a JSON array.
+
+    Rows are read with `QuerySet.iterator`, a server-side cursor on PostgreSQL,
+    then serialized and rendered `stream_chunk_size` rows at a time into a
+    `StreamingHttpResponse`, so memory stays flat however many rows there are.
+    The list is filtered but not paginated. The status is sent before the rows
+    are read, so an error while streaming truncates the body.
+
+    Under ASGI the chunks are read one `sync_to_async` call at a time, since
+    Django would gather a sync iterator in a single call, the whole list in
+    memory.
+    """
+
+    list_actions: t.ClassVar[tuple[str, ...]]
+    stream_chunk_size = 2000
+    stream_renderer_class: type[renderers.BaseRenderer] = util_renderers.ORJSONRenderer
+
+    get_queryset: t.Callable[[], models.QuerySet[t.Any]]
+    filter_queryset: t.Callable[[models.QuerySet[t.Any]], models.QuerySet[t.Any]]
+    get_serializer: t.Callable[..., serializers.BaseSerializer]
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Extend the list actions of the viewset, whatever the base class order.
+        list_actions = getattr(cls, "list_actions", ())
+        if "export" not in list_actions:
+            cls.list_actions = (*list_actions, "export")
+
+    @decorators.action(detail=False, methods=["get"], pagination_class=None)
+    def export(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> http.StreamingHttpResponse:
+        queryset = self.filter_queryset(self.get_queryset())
+        # The rows are read while the response streams, after `dispatch` left
+        # `read_replica()`, so bind them to the database routed to now.
+        queryset = queryset.using(queryset.db)
+        renderer = self.stream_renderer_class()
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        chunks = self.stream_list(queryset, renderer)
+        if isinstance(request._request, asgi.ASGIRequest):  # noqa: SLF001
+            chunks = self.astream_list(chunks)
+        return http.StreamingHttpResponse(chunks, content_type=content_type)
+
+    def stream_list(
+        self,
+        queryset: models.QuerySet[t.Any],
+        renderer: renderers.BaseRenderer,
+    ) -> t.Iterator[bytes]:
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        separator = b""
+
+        yield b"["
+        while chunk := list(itertools.islice(rows, self.stream_chunk_size)):
+            data = self.get_serializer(chunk, many=True).data
+            # Drop the brackets of the rendered chunk to join it into one array.
+            yield separator + t.cast(bytes, renderer.render(data))[1:-1]
+            separator = b","
+        yield b"]"
+
+    async def astream_list(self, chunks: t.Iterator[bytes]) -> t.AsyncIterator[bytes]:
+        next_chunk = sync.sync_to_async(next)
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+
+
+class CacheResponseMixin:
+    """
+    Opt-in cache of the rendered JSON responses of `list` and `retrieve`.
+
+    Responses are cached per user, URL kwargs, query params and media type, and
+    per generation of the queryset model and `cache_dependencies`. A save or
+    delete of those models, single or bulk, bumps their generation, so list the
+    models that nested serializers read in `cache_dependencies`, and the model
+    itself when the viewset has no `queryset` attribute.
+
+    The cached actions read from the primary, since a replica that lags behind
+    a write would store the rows from before it under the bumped generation.
+
+    The models are tracked when the viewset class is defined, so processes that
+    write to them without loading the URLconf, such as workers, must call
+    `server.utils.django.cache.track_models` for them, e.g. in `AppConfig.ready`.
+
+    Every lookup sends `server.utils.django.cache.response_cache_lookup`.
+    """
+
+    cache_alias = "default"
+    cache_timeout: int | None = 60
+    cache_dependencies: t.ClassVar[tuple[type[models.Model], ...]] = ()
+
+    action: str | None
+    action_map: dict[str, str]
+    kwargs: dict[str, t.Any]
+    get_queryset: t.Callable[[], models.QuerySet[t.Any]]
+    get_object: t.Callable[[], t.Any]
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        queryset = getattr(cls, "queryset", None)
+        util_cache.track_models(
+            [
+                *([queryset.model] if queryset is not None else []),
+                *cls.cache_dependencies,
+            ],
+            cls.cache_alias,
+        )
+
+    def reads_replica(self, request: http.HttpRequest) -> bool:
+        action = self.action_map.get((request.method or "").lower())
+        if action in ["list", "retrieve"]:
+            return False
+        return super().reads_replica(request)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def list(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> http.HttpResponse:
+        return self.get_cached_response(
+            super().list,  # pyright: ignore[reportAttributeAccessIssue]
+            request,
+            *args,
+            **kwargs,
+        )
+
+    def retrieve(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> http.HttpResponse:
+        return self.get_cached_response(
+            super().retrieve,  # pyright: ignore[reportAttributeAccessIssue]
+            request,
+            *args,
+            **kwargs,
+        )
+
+    def get_cached_response(
+        self,
+        handler: t.Callable[..., response.Response],
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> http.HttpResponse:
+        key = self.get_cache_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+
+        cache = caches[self.cache_alias]
+        cached = cache.get(key)
+        util_cache.response_cache_lookup.send(
+            sender=type(self),
+            key=key,
+            hit=cached is not None,
+        )
+        if cached is not None:
+            if self.action == "retrieve":
+                # The object permissions may depend on more than the cached
+                # rows, so they are checked before a hit is served.
+                self.get_object()
+            content, status_code, headers = cached
+            # Answer conditional requests with the validators of the entry.
+            conditional_response = django_cache.get_conditional_response(
+                t.cast(t.Any, request._request),  # noqa: SLF001
+                etag=headers.get("ETag"),
+                last_modified=http_utils.parse_http_date_safe(
+                    headers.get("Last-Modified", ""),
+                ),
+                response=http.HttpResponse(
+                    content,
+                    status=status_code,
+                    headers=headers,
+                ),
+            )
+            return t.cast(http.HttpResponse, conditional_response)
+
+        drf_response = handler(request, *args, **kwargs)
+        if drf_response.status_code == status.HTTP_200_OK:
+            drf_response.add_post_render_callback(
+                functools.partial(self.set_cached_response, key),
+            )
+        return drf_response
+
+    def set_cached_response(
+        self,
+        key: str,
+        rendered_response: http.HttpResponse,
+    ) -> None:
+        caches[self.cache_alias].set(
+            key,
+            (
+                rendered_response.content,
+                rendered_response.status_code,
+                dict(rendered_response.items()),
+            ),
+            self.cache_timeout,
+        )
+
+    def get_cache_scope(self, request: drf_request.Request) -> str:
+        user = request.user
+        return str(user.pk) if user.is_authenticated else "anonymous"
+
+    def get_cache_key(self, request: drf_request.Request) -> str | None:
+        # The browsable API embeds the user and a CSRF token in the page.
+        renderer = getattr(request, "accepted_renderer", None)
+        if not isinstance(renderer, renderers.JSONRenderer):
+            return None
+
+        view_class = type(self)
+        generations = util_cache.get_generations(
+            [self.get_queryset().model, *self.cache_dependencies],
+            self.cache_alias,
+        )
+        signature = orjson.dumps(
+            [
+                f"{view_class.__module__}.{view_class.__qualname__}",
+                self.action,
+                self.get_cache_scope(request),
+                sorted(self.kwargs.items()),
+                sorted(request.query_params.lists()),
+                getattr(request, "accepted_media_type", None),
+                sorted(generations.items()),
+            ],
+            default=str,
+        )
+        return f"response:{hashlib.sha256(signature).hexdigest()}"
 
 
 class BaseGenericViewSet(t.Generic[Model, Serializer], viewsets.GenericViewSet):
     queryset: models.QuerySet[Model]
     serializer_class: type[Serializer]
+    # Actions that serialize the queryset as a list.
+    list_actions: t.ClassVar[tuple[str, ...]] = ("list",)
+    # The field that versions a row for `ETag` and `Last-Modified`, conditional
+    # requests are skipped for the models without it.
+    conditional_field: str | None = "updated_at"
+    # Whether lists are versioned as well. It costs an aggregate over the whole
+    # filtered queryset before the page query, the full count that the keyset,
+    # look-ahead and estimated paginators avoid.
+    conditional_list: bool = False
+    # Columns read by other code than the serializer, such as object permissions,
+    # that the query plan must not defer.
+    only_fields: t.ClassVar[tuple[str, ...]] = ()
+
+    etag: str | None = None
+    last_modified: datetime.datetime | None = None
+
+    def dispatch(
+        self,
+        request: http.HttpRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> http.HttpResponse:
+        if not self.reads_replica(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        with routers.read_replica():
+            return super().dispatch(request, *args, **kwargs)
+
+    def reads_replica(self, request: http.HttpRequest) -> bool:
+        # The reads may lag behind the writes, clients that just wrote are
+        # pinned to the primary by `PrimaryPinMiddleware`.
+        action = self.action_map.get((request.method or "").lower())
+        return action in [*self.list_actions, "retrieve"]
 
     def get_queryset(self) -> models.QuerySet[Model]:
         queryset = super().get_queryset()
 
-        if self.action in ["list", "retrieve"]:
-            serializer = self.get_serializer()
-            fields = getattr(serializer, "fields", {})
-            if "created_by" in fields:
-                queryset = queryset.select_related("created_by")
-            if "updated_by" in fields:
-                queryset = queryset.select_related("updated_by")
+        if self.action in [*self.list_actions, "retrieve"]:
+            serializer_class = self.get_serializer_class()
+            if issubclass(serializer_class, serializers.ModelSerializer):
+                plan = self.get_query_plan(serializer_class)
+                if self.action in self.list_actions and plan.values_fields is not None:
+                    fields = [*plan.values_fields, *self.get_ordering_fields()]
+                    queryset = t.cast(
+                        models.QuerySet[Model],
+                        queryset.values(*dict.fromkeys(fields)),
+                    )
+                else:
+                    if plan.only:
+                        fields = [*plan.only, *self.get_only_fields(queryset.model)]
+                        plan = dataclasses.replace(
+                            plan, only=tuple(dict.fromkeys(fields))
+                        )
+                    queryset = plan.apply(queryset)
 
         return queryset
 
+    def get_query_plan(
+        self,
+        serializer_class: type[serializers.ModelSerializer],
+    ) -> query_plan.QueryPlan:
+        if getattr(serializer_class, "context_dependent_fields", False):
+            serializer = t.cast(serializers.ModelSerializer, self.get_serializer())
+            return query_plan.get_serializer_query_plan(serializer)
+        return query_plan.get_query_plan(
+            serializer_class,
+            base_serializers.get_sparse_fieldset(self.request),
+        )
+
+    def get_only_fields(self, model: type[models.Model]) -> list[str]:
+        # The columns read outside of the serializer, loaded along with its
+        # own so that reading them does not cost a query per row.
+        fields = [*self.get_ordering_fields(), *self.only_fields]
+        if (field := self.get_conditional_field(model)) is not None:
+            fields.append(field)
+        return fields
+
+    def get_ordering_fields(self) -> list[str]:
+        # The rows must carry the fields a cursor paginator reads.
+        ordering = getattr(self.paginator, "ordering", None) or ()
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        return [name.lstrip("-") for name in ordering]
+
+    def get_object(self) -> Model:
+        instance = super().get_object()
+
+        field = self.get_conditional_field(type(instance))
+        if field is not None:
+            self.check_preconditions(getattr(instance, field), instance.pk)
+        return instance
+
+    def paginate_queryset(self, queryset: models.QuerySet[Model]) -> t.Any:
+        field = self.get_conditional_field(queryset.model)
+        if self.action == "list" and self.conditional_list and field is not None:
+            aggregates = queryset.order_by().aggregate(
+                **self.get_version_aggregates(field),
+            )
+            self.check_preconditions(aggregates["last_modified"], aggregates["count"])
+        return super().paginate_queryset(queryset)
+
+    def get_version_aggregates(self, field: str) -> dict[str, models.Aggregate]:
+        # Adding, removing or updating a row changes the count or the latest
+        # update, so the filtered list is versioned by both.
+        return {"last_modified": models.Max(field), "count": models.Count("pk")}
+
+    def get_conditional_field(self, model: type[models.Model]) -> str | None:
+        if self.conditional_field is None:
+            return None
+        try:
+            model._meta.get_field(self.conditional_field)  # noqa: SLF001
+        except django_exceptions.FieldDoesNotExist:
+            return None
+        return self.conditional_field
+
+    def check_preconditions(
+        self,
+        last_modified: datetime.datetime | None,
+        *version: t.Any,
+    ) -> None:
+        """
+        Answer the `If-Match`, `If-None-Match` and `If-Modified-Since` headers.
+
+        Args:
+            last_modified (datetime.datetime | None): The latest update.
+            *version (t.Any): Other values that version the resource.
+
+        Raises:
+            util_exceptions.NotModified: A `GET` of an unchanged resource.
+            util_exceptions.PreconditionFailed: A write to a changed resource.
+        """
+        signature = orjson.dumps([last_modified, *version], default=str)
+        self.etag = f'"{hashlib.md5(signature, usedforsecurity=False).hexdigest()}"'
+        self.last_modified = last_modified
+
+        conditional_response = django_cache.get_conditional_response(
+            t.cast(t.Any, self.request._request),  # noqa: SLF001
+            etag=self.etag,
+            last_modified=(
+                int(last_modified.timestamp()) if last_modified is not None else None
+            ),
+        )
+        if conditional_response is None:
+            return
+        if conditional_response.status_code == status.HTTP_304_NOT_MODIFIED:
+            raise util_exceptions.NotModified
+        raise util_exceptions.PreconditionFailed
+
+    def handle_exception(self, exc: Exception) -> response.Response:
+        if isinstance(exc, util_exceptions.NotModified):
+            return response.Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(
+        self,
+        request: drf_request.Request,
+        response: http.HttpResponse,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> http.HttpResponse:
+        response = super().finalize_response(
+            request,
+            response,  # pyright: ignore[reportArgumentType]
+            *args,
+            **kwargs,
+        )
+
+        # The validators of a write describe the resource before it.
+        if (
+            request.method in permissions.SAFE_METHODS
+            and response.status_code
+            in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED)
+            and self.etag is not None
+        ):
+            response["ETag"] = self.etag
+            if self.last_modified is not None:
+                response["Last-Modified"] = http_utils.http_date(
+                    self.last_modified.timestamp(),
+                )
+        return response
+
 
 class BaseModelViewSet(
     CreateUserActionLogMixin,
@@ -46,3 +664,231 @@ class BaseModelViewSet(
     viewsets.ModelViewSet,
 ):
     pass
+
+
+class AsyncBaseGenericViewSet(
+    BaseGenericViewSet[Model, Serializer],
+    adrf_viewsets.GenericViewSet,
+):
+    """
+    `BaseGenericViewSet` with async handlers, served natively under ASGI.
+
+    Object lookups, conditional aggregates and deletes go through the async ORM.
+    Filters, paginators, permissions and serializers are sync and each of them
+    runs in one `sync_to_async` call. The sync handlers of other mixins run in a
+    thread, `CacheResponseMixin` is not supported.
+    """
+
+    _ASYNC_NON_DISPATCH_METHODS: t.ClassVar[list[str]] = [
+        *adrf_viewsets.GenericViewSet._ASYNC_NON_DISPATCH_METHODS,  # noqa: SLF001
+        "adispatch",
+        "aget_queryset",
+        "aget_serializer_data",
+    ]
+
+    def dispatch(
+        self,
+        request: http.HttpRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        if not self.view_is_async:
+            return super().dispatch(request, *args, **kwargs)
+        return self.adispatch(request, *args, **kwargs)
+
+    async def adispatch(
+        self,
+        request: http.HttpRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> http.HttpResponse:
+        if not self.reads_replica(request):
+            return await self.async_dispatch(request, *args, **kwargs)
+
+        with routers.read_replica():
+            return await self.async_dispatch(request, *args, **kwargs)
+
+    async def aget_queryset(self) -> models.QuerySet[Model]:
+        # Filter backends may validate their values against the database.
+        return await sync.sync_to_async(
+            lambda: self.filter_queryset(self.get_queryset()),
+        )()
+
+    async def aget_object(self) -> Model:
+        queryset = await self.aget_queryset()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            instance = await queryset.aget(**filter_kwargs)
+        except (
+            queryset.model.DoesNotExist,
+            TypeError,
+            ValueError,
+            django_exceptions.ValidationError,
+        ) as e:
+            raise http.Http404 from e
+
+        await sync.sync_to_async(self.check_object_permissions)(self.request, instance)
+        field = self.get_conditional_field(type(instance))
+        if field is not None:
+            self.check_preconditions(getattr(instance, field), instance.pk)
+        return instance
+
+    async def apaginate_queryset(self, queryset: models.QuerySet[Model]) -> t.Any:
+        field = self.get_conditional_field(queryset.model)
+        if self.action == "list" and self.conditional_list and field is not None:
+            aggregates = await queryset.order_by().aaggregate(
+                **self.get_version_aggregates(field),
+            )
+            self.check_preconditions(aggregates["last_modified"], aggregates["count"])
+        # The count and the page of the sync paginators share one thread.
+        return await sync.sync_to_async(
+            super(BaseGenericViewSet, self).paginate_queryset,
+        )(queryset)
+
+    async def aget_serializer_data(
+        self,
+        serializer: serializers.BaseSerializer,
+    ) -> t.Any:
+        # Fields may read the relations that the query plan did not load.
+        return await sync.sync_to_async(lambda: serializer.data)()
+
+
+class AsyncListModelMixin(mixins.ListModelMixin):
+    aget_queryset: t.Callable[[], t.Awaitable[models.QuerySet[t.Any]]]
+    apaginate_queryset: t.Callable[[models.QuerySet[t.Any]], t.Awaitable[t.Any]]
+    get_serializer: t.Callable[..., serializers.BaseSerializer]
+    aget_serializer_data: t.Callable[[serializers.BaseSerializer], t.Awaitable[t.Any]]
+    get_paginated_response: t.Callable[[t.Any], response.Response]
+
+    async def list(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        queryset = await self.aget_queryset()
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            data = await self.aget_serializer_data(serializer)
+            return self.get_paginated_response(data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return response.Response(await self.aget_serializer_data(serializer))
+
+
+class AsyncRetrieveModelMixin(mixins.RetrieveModelMixin):
+    aget_object: t.Callable[[], t.Awaitable[t.Any]]
+    get_serializer: t.Callable[..., serializers.BaseSerializer]
+    aget_serializer_data: t.Callable[[serializers.BaseSerializer], t.Awaitable[t.Any]]
+
+    async def retrieve(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return response.Response(await self.aget_serializer_data(serializer))
+
+
+class AsyncCreateUserActionLogMixin(mixins.CreateModelMixin):
+    request: drf_request.Request
+    get_serializer: t.Callable[..., serializers.BaseSerializer]
+    aget_serializer_data: t.Callable[[serializers.BaseSerializer], t.Awaitable[t.Any]]
+
+    async def create(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        serializer = self.get_serializer(data=request.data)
+        await sync.sync_to_async(serializer.is_valid)(raise_exception=True)
+        await self.aperform_create(serializer)
+        data = await self.aget_serializer_data(serializer)
+        return response.Response(
+            data,
+            status=status.HTTP_201_CREATED,
+            headers=self.get_success_headers(data),
+        )
+
+    async def aperform_create(
+        self,
+        serializer: serializers.BaseSerializer,
+    ) -> None:
+        user = util_fields.get_action_user(self.request.user)
+        await sync.sync_to_async(serializer.save)(created_by=user, updated_by=user)
+
+
+class AsyncUpdateUserActionLogMixin(mixins.UpdateModelMixin):
+    request: drf_request.Request
+    aget_object: t.Callable[[], t.Awaitable[t.Any]]
+    get_serializer: t.Callable[..., serializers.BaseSerializer]
+    aget_serializer_data: t.Callable[[serializers.BaseSerializer], t.Awaitable[t.Any]]
+
+    async def update(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        partial = kwargs.pop("partial", False)
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        await sync.sync_to_async(serializer.is_valid)(raise_exception=True)
+        await self.aperform_update(serializer)
+
+        if getattr(instance, "_prefetched_objects_cache", None):
+            # Like `UpdateModelMixin`, drop the prefetched relations that the
+            # update may have changed.
+            instance._prefetched_objects_cache = {}  # noqa: SLF001
+        return response.Response(await self.aget_serializer_data(serializer))
+
+    async def partial_update(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        kwargs["partial"] = True
+        return await self.update(request, *args, **kwargs)
+
+    async def aperform_update(
+        self,
+        serializer: serializers.BaseSerializer,
+    ) -> None:
+        await sync.sync_to_async(serializer.save)(
+            updated_by=util_fields.get_action_user(self.request.user),
+        )
+
+
+class AsyncDestroyModelMixin(mixins.DestroyModelMixin):
+    aget_object: t.Callable[[], t.Awaitable[t.Any]]
+
+    async def destroy(
+        self,
+        request: drf_request.Request,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> response.Response:
+        instance = await self.aget_object()
+        await self.aperform_destroy(instance)
+        return response.Response(status=status.HTTP_204_NO_CONTENT)
+
+    async def aperform_destroy(self, instance: models.Model) -> None:
+        await instance.adelete()
+
+
+class AsyncBaseModelViewSet(
+    AsyncCreateUserActionLogMixin,
+    AsyncListModelMixin,
+    AsyncRetrieveModelMixin,
+    AsyncUpdateUserActionLogMixin,
+    AsyncDestroyModelMixin,
+    AsyncBaseGenericViewSet[Model, Serializer],
+):
+    pass